@@ -0,0 +1,97 @@
+"""
+The A1 notation helpers of gspread 5.5.0, before they were memoized,
+kept as the reference of the utils benchmarks.
+
+"""
+
+from math import inf
+
+from gspread.exceptions import IncorrectCellLabel
+from gspread.utils import A1_ADDR_ROW_COL_RE, CELL_ADDR_RE, MAGIC_NUMBER
+
+
+def rowcol_to_a1(row, col):
+    row = int(row)
+    col = int(col)
+
+    if row < 1 or col < 1:
+        raise IncorrectCellLabel("({}, {})".format(row, col))
+
+    div = col
+    column_label = ""
+
+    while div:
+        (div, mod) = divmod(div, 26)
+        if mod == 0:
+            mod = 26
+            div -= 1
+        column_label = chr(mod + MAGIC_NUMBER) + column_label
+
+    label = "{}{}".format(column_label, row)
+
+    return label
+
+
+def a1_to_rowcol(label):
+    m = CELL_ADDR_RE.match(label)
+    if m:
+        column_label = m.group(1).upper()
+        row = int(m.group(2))
+
+        col = 0
+        for i, c in enumerate(reversed(column_label)):
+            col += (ord(c) - MAGIC_NUMBER) * (26**i)
+    else:
+        raise IncorrectCellLabel(label)
+
+    return (row, col)
+
+
+def _a1_to_rowcol_unbounded(label):
+    m = A1_ADDR_ROW_COL_RE.match(label)
+    if m:
+        column_label, row = m.groups()
+
+        if column_label:
+            col = 0
+            for i, c in enumerate(reversed(column_label.upper())):
+                col += (ord(c) - MAGIC_NUMBER) * (26**i)
+        else:
+            col = inf
+
+        if row:
+            row = int(row)
+        else:
+            row = inf
+    else:
+        raise IncorrectCellLabel(label)
+
+    return (row, col)
+
+
+def a1_range_to_grid_range(name, sheet_id=None):
+    start_label, _, end_label = name.partition(":")
+
+    start_row_index, start_column_index = _a1_to_rowcol_unbounded(start_label)
+
+    end_row_index, end_column_index = _a1_to_rowcol_unbounded(end_label or start_label)
+
+    if start_row_index > end_row_index:
+        start_row_index, end_row_index = end_row_index, start_row_index
+
+    if start_column_index > end_column_index:
+        start_column_index, end_column_index = end_column_index, start_column_index
+
+    grid_range = {
+        "startRowIndex": start_row_index - 1,
+        "endRowIndex": end_row_index,
+        "startColumnIndex": start_column_index - 1,
+        "endColumnIndex": end_column_index,
+    }
+
+    grid_range = {key: value for (key, value) in grid_range.items() if value != inf}
+
+    if sheet_id is not None:
+        grid_range["sheetId"] = sheet_id
+
+    return grid_range
@@ -0,0 +1,79 @@
+"""
+Benchmarks of the memory used by exports, buffered with
+:meth:`gspread.Client.export` or streamed with
+:meth:`gspread.Client.export_to`.
+
+The exported file is built once and served from memory, so the peak
+memory reported in the benchmark ``extra_info`` only counts what the
+client allocates.
+
+"""
+
+import io
+import tracemalloc
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+import gspread
+from gspread.utils import ExportFormat
+
+from .replay import synthetic_rows
+
+pytest.importorskip("pytest_benchmark")
+
+KEY = "benchmark"
+
+EXPORTED = "".join(
+    ",".join(row) + "\r\n" for row in synthetic_rows(100000, 10)
+).encode()
+
+
+class ExportAdapter(BaseAdapter):
+    """Answers every request with :data:`EXPORTED`, read from a stream."""
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Length"] = str(len(EXPORTED))
+        response.raw = io.BytesIO(EXPORTED)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class NullFile(io.RawIOBase):
+    """A binary file discarding what is written, like a file on disk
+    would not keep it in memory."""
+
+    def writable(self):
+        return True
+
+    def write(self, chunk):
+        return len(chunk)
+
+
+@pytest.mark.parametrize("streamed", [False, True], ids=["export", "export_to"])
+def test_export(benchmark, streamed):
+    session = requests.Session()
+    session.mount("https://", ExportAdapter())
+    client = gspread.Client(None, session=session)
+
+    def export():
+        if streamed:
+            client.export_to(KEY, NullFile(), ExportFormat.CSV)
+        else:
+            NullFile().write(client.export(KEY, ExportFormat.CSV))
+
+    benchmark.pedantic(export, rounds=5)
+
+    tracemalloc.start()
+    try:
+        export()
+        benchmark.extra_info["peak_memory"] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,77 @@
+"""
+Benchmarks of the concurrency and retry features against the fake API
+of :mod:`gspread.fake`, with a fixed latency and seeded errors so runs
+can be compared.
+
+"""
+
+import pytest
+
+import gspread
+from gspread.fake import FakeGoogleAPI
+from gspread.retry import RetryPolicy
+
+pytest.importorskip("pytest_benchmark")
+
+LATENCY = 0.01
+RANGES = ["A{0}:J{0}".format(row) for row in range(1, 201)]
+
+
+class NoWaitRetryPolicy(RetryPolicy):
+    def sleep(self, delay):
+        pass
+
+
+def open_sheet(api, **kwargs):
+    key = api.create_spreadsheet(rows=200, cols=10)
+    client = gspread.Client(None, session=api.session(), **kwargs)
+    return client.open_by_key(key).sheet1
+
+
+@pytest.mark.parametrize("max_workers", [1, 4, 16])
+def test_batch_get_workers(benchmark, max_workers):
+    sheet = open_sheet(FakeGoogleAPI(latency=LATENCY))
+
+    # 20 requests of 10 ranges, sent by up to max_workers threads
+    benchmark.pedantic(
+        sheet.spreadsheet.values_batch_get,
+        args=(RANGES,),
+        kwargs={"max_cells": 100, "max_workers": max_workers},
+        rounds=3,
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 16])
+def test_open_many(benchmark, max_workers):
+    api = FakeGoogleAPI(latency=LATENCY)
+    client = gspread.Client(None, session=api.session())
+    keys = [api.create_spreadsheet() for _ in range(50)]
+
+    benchmark.pedantic(
+        lambda: list(client.open_many(keys, max_workers=max_workers)), rounds=3
+    )
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+def test_open_and_read(benchmark, lazy):
+    api = FakeGoogleAPI(latency=LATENCY)
+    client = gspread.Client(None, session=api.session())
+    key = api.create_spreadsheet(rows=200, cols=10)
+
+    def open_and_read():
+        spreadsheet = client.open_by_key(key, lazy=lazy)
+        return spreadsheet.values_get("Sheet1!A1:J10")
+
+    benchmark.pedantic(open_and_read, rounds=10)
+
+
+def test_retries(benchmark):
+    api = FakeGoogleAPI(error_rate=0.2, seed=1)
+    sheet = open_sheet(api, retry_policy=NoWaitRetryPolicy(max_attempts=10))
+
+    def read_rows():
+        for range_name in RANGES:
+            sheet.get(range_name)
+
+    benchmark.pedantic(read_rows, rounds=3)
+    benchmark.extra_info["requests"] = len(api.requests)
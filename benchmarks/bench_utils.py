@@ -0,0 +1,87 @@
+"""
+Benchmarks of the A1 notation helpers, called once per cell or range by
+most worksheet methods.
+
+Each helper is measured against its gspread 5.5.0 version (see
+``baseline.py``), on 10k cells or ranges: ``repeated`` ones, 1k distinct
+cells as in the ranges of a single worksheet, and ``unique`` ones, more
+than the memoized ranges. The caches are cleared before each round, so
+every round starts cold.
+
+Run with ``tox -e bench``, e.g. to compare the range parsing::
+
+    pytest -o python_files=bench_*.py benchmarks/bench_utils.py -k grid_range
+"""
+
+import pytest
+
+from gspread import utils
+
+from . import baseline
+
+CELLS = 10000
+
+IMPLEMENTATIONS = {"5.5.0": baseline, "memoized": utils}
+
+
+def _workload(distinct_rows):
+    rows = [i % distinct_rows + 1 for i in range(CELLS)]
+    cols = [i % 200 + 1 for i in range(CELLS)]
+    labels = [utils.rowcol_to_a1(row, col) for row, col in zip(rows, cols)]
+    ranges = ["{}:{}".format(a, b) for a, b in zip(labels, labels[1:] + labels[:1])]
+    return rows, cols, labels, ranges
+
+
+WORKLOADS = {"repeated": _workload(1000), "unique": _workload(CELLS)}
+
+
+def clear_caches():
+    utils._column_label.cache_clear()
+    utils._column_index.cache_clear()
+    utils._grid_range.cache_clear()
+
+
+def run_cold(benchmark, func):
+    benchmark.pedantic(func, setup=clear_caches, rounds=20, warmup_rounds=1)
+
+
+@pytest.fixture(params=list(WORKLOADS))
+def workload(request):
+    return WORKLOADS[request.param]
+
+
+@pytest.fixture(params=list(IMPLEMENTATIONS))
+def impl(request):
+    return IMPLEMENTATIONS[request.param]
+
+
+def test_rowcol_to_a1(benchmark, workload, impl):
+    rows, cols, _, _ = workload
+    rowcol_to_a1 = impl.rowcol_to_a1
+    run_cold(
+        benchmark, lambda: [rowcol_to_a1(row, col) for row, col in zip(rows, cols)]
+    )
+
+
+def test_rowcols_to_a1(benchmark, workload):
+    rows, cols, _, _ = workload
+    run_cold(benchmark, lambda: utils.rowcols_to_a1(rows, cols))
+
+
+def test_a1_to_rowcol(benchmark, workload, impl):
+    _, _, labels, _ = workload
+    a1_to_rowcol = impl.a1_to_rowcol
+    run_cold(benchmark, lambda: [a1_to_rowcol(label) for label in labels])
+
+
+@pytest.mark.parametrize("sheet_id", [None, 0])
+def test_a1_range_to_grid_range(benchmark, workload, impl, sheet_id):
+    _, _, _, ranges = workload
+    to_grid_range = impl.a1_range_to_grid_range
+    run_cold(benchmark, lambda: [to_grid_range(name, sheet_id) for name in ranges])
+
+
+@pytest.mark.parametrize("sheet_id", [None, 0])
+def test_a1_ranges_to_grid_ranges(benchmark, workload, sheet_id):
+    _, _, _, ranges = workload
+    run_cold(benchmark, lambda: utils.a1_ranges_to_grid_ranges(ranges, sheet_id))
@@ -0,0 +1,89 @@
+"""
+Benchmarks of the worksheet reads and writes at 1k, 100k and 1M cells.
+
+The API is replaced by synthetic cassettes served by a local transport,
+so only the parsing of the responses and the building of the payloads
+are measured. Run them with ``tox -e bench``, or to run a single size::
+
+    pytest -o python_files=bench_*.py benchmarks/ -k 100k
+
+The peak memory of each benchmark is reported in its ``extra_info``,
+see ``--benchmark-json``.
+
+"""
+
+from functools import partial
+
+import pytest
+
+from gspread.cell import Cell
+
+from .replay import synthetic_rows
+
+pytest.importorskip("pytest_benchmark")
+
+
+def check(actual, expected):
+    """Fails the benchmark if the measured call returned a wrong result."""
+    if actual != expected:
+        raise AssertionError("{!r} != {!r}".format(actual, expected))
+
+
+def test_get_all_values(worksheet, measure):
+    values = measure(worksheet.get_all_values)
+    check(len(values), worksheet.row_count)
+
+
+def test_get_all_records(worksheet, measure):
+    records = measure(worksheet.get_all_records)
+    check(len(records), worksheet.row_count - 1)
+
+
+def test_range(worksheet, measure):
+    cells = measure(worksheet.range)
+    check(len(cells), worksheet.row_count * worksheet.col_count)
+
+
+def test_range_block(worksheet, measure):
+    block = measure(worksheet.range, "", True)
+    check(len(block), worksheet.row_count * worksheet.col_count)
+
+
+def test_find(worksheet, measure):
+    # the last cell, the whole worksheet is scanned
+    query = worksheet.get_all_values()[-1][-1]
+    cell = measure(worksheet.find, query)
+    check((cell.row, cell.col), (worksheet.row_count, worksheet.col_count))
+
+
+def test_update_cells(worksheet, measure):
+    rows = synthetic_rows(worksheet.row_count, worksheet.col_count)
+    cells = [
+        Cell(r, c, value)
+        for r, row in enumerate(rows, 1)
+        for c, value in enumerate(row, 1)
+    ]
+    measure(worksheet.update_cells, cells)
+
+
+@pytest.mark.parametrize("sparse", [False, True], ids=["dense", "sparse"])
+def test_update_cells_scattered(worksheet, measure, sparse):
+    # the first cell of every tenth row, a rectangle mostly padded with None
+    cells = [Cell(r, 1, str(r)) for r in range(1, worksheet.row_count + 1, 10)]
+    cells.append(Cell(worksheet.row_count, worksheet.col_count, "last"))
+    measure(partial(worksheet.update_cells, sparse=sparse), cells)
+
+
+def test_batch_update(worksheet, measure):
+    rows = synthetic_rows(worksheet.row_count, worksheet.col_count)
+    # one range per block of 100 rows
+    data = [
+        {"range": "A{}".format(start + 1), "values": rows[start : start + 100]}
+        for start in range(0, len(rows), 100)
+    ]
+    measure(worksheet.batch_update, data)
+
+
+def test_append_rows(worksheet, measure):
+    rows = synthetic_rows(worksheet.row_count, worksheet.col_count)
+    measure(worksheet.append_rows, rows)
@@ -0,0 +1,52 @@
+import tracemalloc
+
+import pytest
+
+import gspread
+
+from .replay import SPREADSHEET_ID, replay_session, synthetic_cassette
+
+# rows, columns and number of timed rounds of each worksheet size
+SIZES = {
+    "1k": (100, 10, 20),
+    "100k": (10000, 10, 5),
+    "1M": (100000, 10, 2),
+}
+
+
+@pytest.fixture(scope="module", params=list(SIZES))
+def size(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def cassette(size):
+    rows, cols, _ = SIZES[size]
+    return synthetic_cassette(rows, cols)
+
+
+@pytest.fixture
+def worksheet(cassette):
+    client = gspread.Client(None, session=replay_session(cassette))
+    return client.open_by_key(SPREADSHEET_ID).sheet1
+
+
+@pytest.fixture
+def measure(benchmark, size):
+    """Times ``func(*args)`` with the rounds of the current size, then
+    records the peak memory it allocates in the benchmark ``extra_info``.
+    """
+
+    def measure(func, *args):
+        result = benchmark.pedantic(func, args=args, rounds=SIZES[size][2])
+
+        tracemalloc.start()
+        try:
+            func(*args)
+            benchmark.extra_info["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        return result
+
+    return measure
@@ -0,0 +1,169 @@
+"""
+Local transport replaying cassettes, and synthetic cassettes of large
+worksheets, used to run the benchmarks without network access.
+
+"""
+
+import json
+from collections import defaultdict
+from urllib.parse import quote
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from gspread.metrics import parse_endpoint
+from gspread.utils import rowcol_to_a1
+
+SPREADSHEET_ID = "benchmark"
+SHEET_TITLE = "Sheet1"
+
+
+class ReplayAdapter(BaseAdapter):
+    """Answers requests with the responses of a cassette, in the format
+    recorded by VCR.py in ``tests/cassettes``.
+
+    Requests are matched on their method and endpoint, ignoring the ids,
+    ranges and query parameters (see :func:`gspread.metrics.parse_endpoint`).
+    The responses of an endpoint are served in the recorded order, the
+    last one is then replayed for every following request.
+    """
+
+    def __init__(self, cassette):
+        super().__init__()
+        self.responses = defaultdict(list)
+        self.served = defaultdict(int)
+
+        for interaction in cassette["interactions"]:
+            request = interaction["request"]
+            key = (request["method"], parse_endpoint(request["uri"])[0])
+            self.responses[key].append(_prepare(interaction["response"]))
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def send(self, request, **kwargs):
+        key = (request.method, parse_endpoint(request.url)[0])
+
+        responses = self.responses.get(key)
+        if not responses:
+            raise LookupError("no recorded response for {} {}".format(*key))
+
+        index = min(self.served[key], len(responses) - 1)
+        self.served[key] += 1
+        status, headers, body = responses[index]
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = body
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def _prepare(response):
+    """Returns the status, headers and body bytes of a recorded response."""
+    headers = {name: ", ".join(values) for name, values in response["headers"].items()}
+    body = response["body"]["string"].encode("utf-8")
+    headers["Content-Length"] = str(len(body))
+    return response["status"]["code"], headers, body
+
+
+def replay_session(cassette):
+    """Returns a :class:`requests.Session` answering every request to
+    Google APIs with :class:`ReplayAdapter`.
+    """
+    session = requests.Session()
+    session.mount("https://", ReplayAdapter(cassette))
+    return session
+
+
+def synthetic_rows(rows, cols):
+    """Returns ``rows`` rows of ``cols`` values mixing integers, decimals
+    and text, like most real sheets.
+    """
+    kinds = [str, "{:.2f}".format, "item {}".format, "{:,}".format]
+    return [
+        [kinds[c % len(kinds)](r * cols + c) for c in range(cols)] for r in range(rows)
+    ]
+
+
+def _interaction(method, path, body, status=200):
+    return {
+        "request": {
+            "method": method,
+            "uri": "https://sheets.googleapis.com/v4/spreadsheets/" + path,
+            "body": None,
+            "headers": {},
+        },
+        "response": {
+            "status": {"code": status, "message": "OK"},
+            "headers": {"Content-Type": ["application/json; charset=UTF-8"]},
+            "body": {"string": json.dumps(body)},
+        },
+    }
+
+
+def synthetic_cassette(rows, cols):
+    """Builds a cassette serving a spreadsheet with a single worksheet of
+    ``rows`` by ``cols`` cells, filled with :func:`synthetic_rows`.
+
+    Reads of any range return the whole worksheet, writes are acknowledged
+    with the number of cells of the worksheet.
+    """
+    title = quote("'{}'".format(SHEET_TITLE))
+    last_cell = "{}!A1:{}".format(SHEET_TITLE, rowcol_to_a1(rows, cols))
+    cells = rows * cols
+
+    metadata = {
+        "spreadsheetId": SPREADSHEET_ID,
+        "properties": {"title": "benchmark", "locale": "en_US"},
+        "sheets": [
+            {
+                "properties": {
+                    "sheetId": 0,
+                    "title": SHEET_TITLE,
+                    "index": 0,
+                    "sheetType": "GRID",
+                    "gridProperties": {"rowCount": rows, "columnCount": cols},
+                }
+            }
+        ],
+    }
+    values = {
+        "range": last_cell,
+        "majorDimension": "ROWS",
+        "values": synthetic_rows(rows, cols),
+    }
+    updates = {
+        "spreadsheetId": SPREADSHEET_ID,
+        "updatedRange": last_cell,
+        "updatedRows": rows,
+        "updatedColumns": cols,
+        "updatedCells": cells,
+    }
+
+    interactions = [
+        _interaction("GET", SPREADSHEET_ID, metadata),
+        _interaction("GET", "{}/values/{}".format(SPREADSHEET_ID, title), values),
+        _interaction("PUT", "{}/values/{}".format(SPREADSHEET_ID, title), updates),
+        _interaction(
+            "POST",
+            "{}/values/{}:append".format(SPREADSHEET_ID, title),
+            {"spreadsheetId": SPREADSHEET_ID, "updates": updates},
+        ),
+        _interaction(
+            "POST",
+            "{}/values:batchUpdate".format(SPREADSHEET_ID),
+            dict(updates, totalUpdatedCells=cells, responses=[updates]),
+        ),
+    ]
+
+    return {"version": 1, "interactions": interactions}
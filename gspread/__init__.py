@@ -13,6 +13,7 @@ __version__ = "5.5.0"
 __author__ = "Anton Burnashev"
 
 
+from .aio import AsyncClient, AsyncSpreadsheet, AsyncWorksheet
 from .auth import (
     authorize,
     oauth,
@@ -20,7 +21,9 @@ from .auth import (
     service_account,
     service_account_from_dict,
 )
-from .cell import Cell
+from .bulk import BulkWriter
+from .cache import ResponseCache
+from .cell import Cell, CellBlock
 from .client import BackoffClient, Client, ClientFactory
 from .exceptions import (
     CellNotFound,
@@ -28,7 +31,13 @@ from .exceptions import (
     IncorrectCellLabel,
     NoValidUrlKeyFound,
     SpreadsheetNotFound,
+    SpreadsheetsNotOpened,
     WorksheetNotFound,
 )
+from .metrics import LatencyHistogram, OpenTelemetryObserver
+from .mirror import WorksheetMirror
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
 from .spreadsheet import Spreadsheet
+from .urls import APIUrls
 from .worksheet import Worksheet
@@ -0,0 +1,334 @@
+"""
+gspread.aio
+~~~~~~~~~~~
+
+This module contains the asyncio counterparts of the Client, Spreadsheet
+and Worksheet classes.
+
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+
+from .client import Client
+from .spreadsheet import Spreadsheet
+from .worksheet import Worksheet
+
+
+def _coroutine(method):
+    """Wraps a blocking method of the wrapped object into a coroutine
+    method run on the client's executor.
+    """
+
+    @wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        return await self._run(getattr(self._wrapped, method.__name__), *args, **kwargs)
+
+    return wrapper
+
+
+class AsyncClient:
+    """An asyncio interface to a :class:`~gspread.Client`.
+
+    Every API call is sent by the wrapped client on a pool of worker
+    threads, so many spreadsheets can be read and written concurrently
+    from a single event loop.
+
+    :param client: An authorized :class:`~gspread.Client` instance.
+    :param int max_workers: (optional) Maximum number of requests
+        sent at the same time. Defaults to the
+        :class:`~concurrent.futures.ThreadPoolExecutor` default.
+
+    Example::
+
+        gc = gspread.service_account()
+
+        async def main():
+            async with gspread.AsyncClient(gc) as agc:
+                spreadsheets = await asyncio.gather(
+                    agc.open_by_key(key1),
+                    agc.open_by_key(key2),
+                )
+                sheets = await asyncio.gather(*(s.get_worksheet(0) for s in spreadsheets))
+                values = await asyncio.gather(*(s.get("A1:C10") for s in sheets))
+
+        asyncio.run(main())
+    """
+
+    def __init__(self, client, max_workers=None):
+        self._wrapped = client
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    @property
+    def client(self):
+        """The wrapped :class:`~gspread.Client`."""
+        return self._wrapped
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def close(self):
+        """Shuts down the worker threads once pending requests are done.
+
+        Blocks until then, from a coroutine use :meth:`aclose` instead.
+        """
+        self.executor.shutdown(wait=True)
+
+    async def aclose(self):
+        """Shuts down the worker threads once pending requests are done,
+        without blocking the event loop while waiting for them.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.close)
+
+    async def open(self, title, folder_id=None, lazy=False):
+        """Opens a spreadsheet, see :meth:`gspread.Client.open`.
+
+        :returns: a :class:`~gspread.aio.AsyncSpreadsheet` instance.
+        """
+        spreadsheet = await self._run(self._wrapped.open, title, folder_id, lazy=lazy)
+        return AsyncSpreadsheet(self, spreadsheet)
+
+    async def open_by_key(self, key, lazy=False):
+        """Opens a spreadsheet, see :meth:`gspread.Client.open_by_key`.
+
+        :returns: a :class:`~gspread.aio.AsyncSpreadsheet` instance.
+        """
+        spreadsheet = await self._run(self._wrapped.open_by_key, key, lazy=lazy)
+        return AsyncSpreadsheet(self, spreadsheet)
+
+    async def open_by_url(self, url, lazy=False):
+        """Opens a spreadsheet, see :meth:`gspread.Client.open_by_url`.
+
+        :returns: a :class:`~gspread.aio.AsyncSpreadsheet` instance.
+        """
+        spreadsheet = await self._run(self._wrapped.open_by_url, url, lazy=lazy)
+        return AsyncSpreadsheet(self, spreadsheet)
+
+    async def openall(self, title=None, lazy=False):
+        """Opens all available spreadsheets, see :meth:`gspread.Client.openall`.
+
+        :returns: a list of :class:`~gspread.aio.AsyncSpreadsheet` instances.
+        """
+        spreadsheets = await self._run(self._wrapped.openall, title, lazy=lazy)
+        return [AsyncSpreadsheet(self, s) for s in spreadsheets]
+
+    async def create(self, title, folder_id=None, lazy=False):
+        """Creates a new spreadsheet, see :meth:`gspread.Client.create`.
+
+        :returns: a :class:`~gspread.aio.AsyncSpreadsheet` instance.
+        """
+        spreadsheet = await self._run(self._wrapped.create, title, folder_id, lazy=lazy)
+        return AsyncSpreadsheet(self, spreadsheet)
+
+    async def copy(self, file_id, *args, **kwargs):
+        """Copies a spreadsheet, see :meth:`gspread.Client.copy`.
+
+        :returns: a :class:`~gspread.aio.AsyncSpreadsheet` instance.
+        """
+        spreadsheet = await self._run(self._wrapped.copy, file_id, *args, **kwargs)
+        return AsyncSpreadsheet(self, spreadsheet)
+
+    list_spreadsheet_files = _coroutine(Client.list_spreadsheet_files)
+    del_spreadsheet = _coroutine(Client.del_spreadsheet)
+    export = _coroutine(Client.export)
+    export_to = _coroutine(Client.export_to)
+    import_csv = _coroutine(Client.import_csv)
+
+
+class AsyncSpreadsheet:
+    """An asyncio interface to a :class:`~gspread.spreadsheet.Spreadsheet`.
+
+    .. note::
+
+       This class should not be instantiated manually, it is returned by
+       the :class:`~gspread.aio.AsyncClient` methods.
+    """
+
+    def __init__(self, client, spreadsheet):
+        self.client = client
+        self._wrapped = spreadsheet
+
+    def __repr__(self):
+        return "<{} {} id:{}>".format(
+            self.__class__.__name__,
+            repr(self.title),
+            self.id,
+        )
+
+    @property
+    def spreadsheet(self):
+        """The wrapped :class:`~gspread.spreadsheet.Spreadsheet`."""
+        return self._wrapped
+
+    @property
+    def id(self):
+        """Spreadsheet ID."""
+        return self._wrapped.id
+
+    @property
+    def title(self):
+        """Spreadsheet title.
+
+        None while the title of a lazy spreadsheet is not known yet, as
+        fetching it would block the event loop: ``await`` :meth:`refresh`
+        first to load it.
+        """
+        # not self._wrapped.title, it fetches the metadata when missing
+        return self._wrapped._properties.get("title")
+
+    @property
+    def url(self):
+        """Spreadsheet URL."""
+        return self._wrapped.url
+
+    async def _run(self, func, *args, **kwargs):
+        return await self.client._run(func, *args, **kwargs)
+
+    async def worksheet(self, title):
+        """Returns a worksheet, see :meth:`gspread.spreadsheet.Spreadsheet.worksheet`.
+
+        :returns: a :class:`~gspread.aio.AsyncWorksheet` instance.
+        """
+        worksheet = await self._run(self._wrapped.worksheet, title)
+        return AsyncWorksheet(self, worksheet)
+
+    async def get_worksheet(self, index):
+        """Returns a worksheet, see :meth:`gspread.spreadsheet.Spreadsheet.get_worksheet`.
+
+        :returns: a :class:`~gspread.aio.AsyncWorksheet` instance.
+        """
+        worksheet = await self._run(self._wrapped.get_worksheet, index)
+        return AsyncWorksheet(self, worksheet)
+
+    async def get_worksheet_by_id(self, id):
+        """Returns a worksheet, see :meth:`gspread.spreadsheet.Spreadsheet.get_worksheet_by_id`.
+
+        :returns: a :class:`~gspread.aio.AsyncWorksheet` instance.
+        """
+        worksheet = await self._run(self._wrapped.get_worksheet_by_id, id)
+        return AsyncWorksheet(self, worksheet)
+
+    async def worksheets(self):
+        """Returns all the worksheets, see :meth:`gspread.spreadsheet.Spreadsheet.worksheets`.
+
+        :returns: a list of :class:`~gspread.aio.AsyncWorksheet` instances.
+        """
+        worksheets = await self._run(self._wrapped.worksheets)
+        return [AsyncWorksheet(self, w) for w in worksheets]
+
+    async def add_worksheet(self, title, rows, cols, index=None):
+        """Adds a new worksheet, see :meth:`gspread.spreadsheet.Spreadsheet.add_worksheet`.
+
+        :returns: a :class:`~gspread.aio.AsyncWorksheet` instance.
+        """
+        worksheet = await self._run(
+            self._wrapped.add_worksheet, title, rows, cols, index
+        )
+        return AsyncWorksheet(self, worksheet)
+
+    async def del_worksheet(self, worksheet):
+        """Deletes a worksheet, see :meth:`gspread.spreadsheet.Spreadsheet.del_worksheet`.
+
+        :param worksheet: The worksheet to be deleted.
+        :type worksheet: :class:`~gspread.aio.AsyncWorksheet`
+        """
+        return await self._run(self._wrapped.del_worksheet, worksheet.worksheet)
+
+    batch_update = _coroutine(Spreadsheet.batch_update)
+    values_append = _coroutine(Spreadsheet.values_append)
+    values_clear = _coroutine(Spreadsheet.values_clear)
+    values_batch_clear = _coroutine(Spreadsheet.values_batch_clear)
+    values_get = _coroutine(Spreadsheet.values_get)
+    values_batch_get = _coroutine(Spreadsheet.values_batch_get)
+    values_update = _coroutine(Spreadsheet.values_update)
+    values_batch_update = _coroutine(Spreadsheet.values_batch_update)
+    fetch_sheet_metadata = _coroutine(Spreadsheet.fetch_sheet_metadata)
+    refresh = _coroutine(Spreadsheet.refresh)
+    export = _coroutine(Spreadsheet.export)
+    export_to = _coroutine(Spreadsheet.export_to)
+
+
+class AsyncWorksheet:
+    """An asyncio interface to a :class:`~gspread.worksheet.Worksheet`.
+
+    .. note::
+
+       This class should not be instantiated manually, it is returned by
+       the :class:`~gspread.aio.AsyncSpreadsheet` methods.
+    """
+
+    def __init__(self, spreadsheet, worksheet):
+        self.spreadsheet = spreadsheet
+        self.client = spreadsheet.client
+        self._wrapped = worksheet
+
+    def __repr__(self):
+        return "<{} {} id:{}>".format(
+            self.__class__.__name__,
+            repr(self.title),
+            self.id,
+        )
+
+    @property
+    def worksheet(self):
+        """The wrapped :class:`~gspread.worksheet.Worksheet`."""
+        return self._wrapped
+
+    @property
+    def id(self):
+        """Worksheet ID."""
+        return self._wrapped.id
+
+    @property
+    def title(self):
+        """Worksheet title."""
+        return self._wrapped.title
+
+    @property
+    def row_count(self):
+        """Number of rows."""
+        return self._wrapped.row_count
+
+    @property
+    def col_count(self):
+        """Number of columns."""
+        return self._wrapped.col_count
+
+    async def _run(self, func, *args, **kwargs):
+        return await self.client._run(func, *args, **kwargs)
+
+    get = _coroutine(Worksheet.get)
+    batch_get = _coroutine(Worksheet.batch_get)
+    get_values = _coroutine(Worksheet.get_values)
+    get_all_values = _coroutine(Worksheet.get_all_values)
+    get_all_records = _coroutine(Worksheet.get_all_records)
+    row_values = _coroutine(Worksheet.row_values)
+    col_values = _coroutine(Worksheet.col_values)
+    acell = _coroutine(Worksheet.acell)
+    cell = _coroutine(Worksheet.cell)
+    range = _coroutine(Worksheet.range)
+    find = _coroutine(Worksheet.find)
+    findall = _coroutine(Worksheet.findall)
+    update = _coroutine(Worksheet.update)
+    batch_update = _coroutine(Worksheet.batch_update)
+    update_acell = _coroutine(Worksheet.update_acell)
+    update_cell = _coroutine(Worksheet.update_cell)
+    update_cells = _coroutine(Worksheet.update_cells)
+    append_row = _coroutine(Worksheet.append_row)
+    append_rows = _coroutine(Worksheet.append_rows)
+    insert_row = _coroutine(Worksheet.insert_row)
+    insert_rows = _coroutine(Worksheet.insert_rows)
+    clear = _coroutine(Worksheet.clear)
+    batch_clear = _coroutine(Worksheet.batch_clear)
+    format = _coroutine(Worksheet.format)
+    batch_format = _coroutine(Worksheet.batch_format)
+    resize = _coroutine(Worksheet.resize)
@@ -0,0 +1,198 @@
+"""
+gspread.bulk
+~~~~~~~~~~~~
+
+This module contains the BulkWriter class, used to upload a large
+number of rows to a worksheet.
+
+"""
+
+import json
+import os
+from collections.abc import Sized
+from itertools import islice
+
+from .exceptions import GSpreadException
+from .utils import (
+    MAX_BATCH_PAYLOAD_SIZE,
+    ValueInputOption,
+    absolute_range_name,
+    rowcol_to_a1,
+)
+
+
+class BulkWriter:
+    """Writes an iterable of rows to a worksheet in size-bounded chunks.
+
+    The rows are sent with one `values:batchUpdate`_ call per chunk.
+    A chunk holds at most ``chunk_rows`` rows and ``max_payload_size``
+    characters of JSON, so uploads of any size stay under the API request
+    limits.
+
+    The number of rows already written is kept in :attr:`committed_rows`
+    and, if ``checkpoint_file`` is given, in that file after each chunk.
+    Calling :meth:`write` again with the same rows, from the same writer
+    or from a new writer using the same checkpoint file, resumes the
+    upload after the last committed chunk.
+
+    :param worksheet: The :class:`~gspread.worksheet.Worksheet` to write to.
+    :param int start_row: (optional) Row of the first written row,
+        starting from 1.
+    :param int start_col: (optional) Column of the first written value,
+        starting from 1.
+    :param int chunk_rows: (optional) Maximum number of rows per request.
+    :param int max_payload_size: (optional) Maximum size of a request
+        body, in characters.
+    :param str value_input_option: (optional) How the values should be
+        interpreted, ``ValueInputOption.raw`` or
+        ``ValueInputOption.user_entered``.
+    :param str checkpoint_file: (optional) Path of a file where the progress
+        is saved after each chunk.
+
+    Example::
+
+        writer = gspread.BulkWriter(worksheet, checkpoint_file="upload.json")
+        writer.write(csv.reader(open("data.csv")))
+
+    .. _values:batchUpdate: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets.values/batchUpdate
+    """
+
+    def __init__(
+        self,
+        worksheet,
+        start_row=1,
+        start_col=1,
+        chunk_rows=10000,
+        max_payload_size=MAX_BATCH_PAYLOAD_SIZE,
+        value_input_option=ValueInputOption.raw,
+        checkpoint_file=None,
+    ):
+        self.worksheet = worksheet
+        self.start_row = start_row
+        self.start_col = start_col
+        self.chunk_rows = chunk_rows
+        self.max_payload_size = max_payload_size
+        self.value_input_option = value_input_option
+        self.checkpoint_file = checkpoint_file
+
+        #: Number of rows written so far.
+        self.committed_rows = 0
+
+        if checkpoint_file is not None and os.path.exists(checkpoint_file):
+            self._load_checkpoint()
+
+    @property
+    def checkpoint(self):
+        """The current progress, as saved in the checkpoint file.
+
+        :rtype: dict
+        """
+        return {
+            "spreadsheet_id": self.worksheet.spreadsheet.id,
+            "worksheet_id": self.worksheet.id,
+            "start_row": self.start_row,
+            "start_col": self.start_col,
+            "committed_rows": self.committed_rows,
+        }
+
+    def _load_checkpoint(self):
+        with open(self.checkpoint_file) as f:
+            checkpoint = json.load(f)
+
+        committed_rows = checkpoint.pop("committed_rows")
+        expected = self.checkpoint
+        expected.pop("committed_rows")
+
+        if checkpoint != expected:
+            raise GSpreadException(
+                "checkpoint file {} belongs to another upload: {}".format(
+                    self.checkpoint_file, checkpoint
+                )
+            )
+
+        self.committed_rows = committed_rows
+
+    def _save_checkpoint(self):
+        if self.checkpoint_file is None:
+            return
+
+        # write then rename, so an interruption never leaves a partial file
+        tmp_file = "{}.tmp".format(self.checkpoint_file)
+        with open(tmp_file, "w") as f:
+            json.dump(self.checkpoint, f)
+        os.replace(tmp_file, self.checkpoint_file)
+
+    def _chunks(self, rows):
+        chunk = []
+        chunk_size = 0
+
+        for row in rows:
+            row = list(row)
+            row_size = len(json.dumps(row)) + 1
+
+            full = len(chunk) >= self.chunk_rows
+            too_large = chunk_size + row_size > self.max_payload_size
+
+            if chunk and (full or too_large):
+                yield chunk
+                chunk = []
+                chunk_size = 0
+
+            chunk.append(row)
+            chunk_size += row_size
+
+        if chunk:
+            yield chunk
+
+    def _ensure_size(self, last_row, last_col):
+        """Resizes the worksheet in a single request if it is too small."""
+        rows = last_row if last_row > self.worksheet.row_count else None
+        cols = last_col if last_col > self.worksheet.col_count else None
+
+        if rows is not None or cols is not None:
+            self.worksheet.resize(rows=rows, cols=cols)
+
+    def write(self, rows, total_rows=None):
+        """Writes ``rows``, skipping the rows already committed.
+
+        :param rows: An iterable of rows, each row being a list of values.
+        :param int total_rows: (optional) Total number of rows, used to
+            resize the worksheet once before writing. Defaults to
+            ``len(rows)`` when available, otherwise the worksheet is grown
+            as the chunks are written.
+
+        :returns: the number of rows committed.
+        :rtype: int
+        """
+        if total_rows is None and isinstance(rows, Sized):
+            total_rows = len(rows)
+
+        # the known last row is resized along with the columns of the first
+        # chunk, in a single request
+        known_last_row = 0 if total_rows is None else self.start_row + total_rows - 1
+
+        for chunk in self._chunks(islice(rows, self.committed_rows, None)):
+            first_row = self.start_row + self.committed_rows
+            last_row = max(first_row + len(chunk) - 1, known_last_row)
+            last_col = self.start_col + max(len(row) for row in chunk) - 1
+
+            self._ensure_size(last_row, last_col)
+
+            range_name = absolute_range_name(
+                self.worksheet.title, rowcol_to_a1(first_row, self.start_col)
+            )
+            body = {
+                "valueInputOption": self.value_input_option,
+                "data": [
+                    {"range": range_name, "majorDimension": "ROWS", "values": chunk}
+                ],
+            }
+
+            # sent right away even inside Spreadsheet.batch(),
+            # the checkpoint must only count written rows
+            self.worksheet.spreadsheet._send_values_batch_update(None, body)
+
+            self.committed_rows += len(chunk)
+            self._save_checkpoint()
+
+        return self.committed_rows
@@ -0,0 +1,229 @@
+"""
+gspread.cache
+~~~~~~~~~~~~~
+
+This module contains the response cache of :class:`~gspread.Client`,
+serving repeated reads from memory.
+
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from urllib.parse import urlencode
+
+from .metrics import parse_endpoint
+
+_Entry = namedtuple("_Entry", ["response", "size", "stored_at", "file_id", "version"])
+
+# Drive API paths, wherever the API is served from: "drive/v3/files",
+# "upload/drive/v2/files", "proxy/drive/v3/files"...
+_DRIVE_PATH = re.compile(r"(^|/)drive/v\d+/")
+
+
+class ResponseCache:
+    """An in-memory cache of the responses to GET requests, such as
+    :meth:`~gspread.spreadsheet.Spreadsheet.values_get`,
+    :meth:`~gspread.spreadsheet.Spreadsheet.values_batch_get`,
+    :meth:`~gspread.spreadsheet.Spreadsheet.fetch_sheet_metadata` or
+    :meth:`~gspread.Client.list_spreadsheet_files`.
+
+    Responses are keyed on their URL and query parameters. A response
+    younger than ``ttl`` is served as is. An older one is served only if
+    its spreadsheet has not changed since, which is checked by fetching
+    the Drive ``version`` of the spreadsheet, once per ``ttl``. Responses
+    not tied to a spreadsheet, like file listings, are fetched again.
+
+    Any other request made by the client, e.g. a write, drops the cached
+    responses of its spreadsheet. Changes made by other clients are only
+    seen once the responses are older than ``ttl``.
+
+    :param int max_bytes: (optional) Maximum size of the cached response
+        bodies, the least recently used ones are dropped first. Defaults
+        to 64 MB.
+    :param float ttl: (optional) Number of seconds a response is served
+        without any check. Defaults to 30 seconds.
+    :param bool validate: (optional) Whether or not to check the version
+        of the spreadsheet when a response is older than ``ttl``, instead
+        of fetching it again. Checking the version needs the Drive scope.
+        Defaults to ``True``.
+
+    Example::
+
+        gc = gspread.Client(credentials, cache=gspread.ResponseCache(ttl=30))
+
+        # polled every 30 seconds, only the version is fetched
+        # as long as the spreadsheet does not change
+        values = gc.open_by_key(key).sheet1.get_all_values()
+    """
+
+    def __init__(
+        self, max_bytes=64 * 1024 * 1024, ttl=30, validate=True, clock=time.monotonic
+    ):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.validate = validate
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.validated_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        """Total size of the cached response bodies, in bytes."""
+        return self._size
+
+    def stats(self):
+        """Returns the number of ``hits`` (served without any request),
+        ``validated_hits`` (served after checking the version), ``misses``
+        and ``evictions``, the number of ``entries`` and their ``size``.
+
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "validated_hits": self.validated_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "size": self._size,
+            }
+
+    @staticmethod
+    def key(url, params=None):
+        """Returns the cache key of a request."""
+        if not params:
+            return url
+        return url + "?" + urlencode(sorted(params.items()), doseq=True)
+
+    def fetch(self, url, params, send, get_version):
+        """Returns the cached response of a GET request, or sends it and
+        caches its response.
+
+        :param str url: The URL of the request.
+        :param dict params: The query parameters of the request.
+        :param send: A callable sending the request and returning its
+            response.
+        :param get_version: A callable returning the current version of a
+            spreadsheet, or None if it is unknown, called with its id.
+        """
+        key = self.key(url, params)
+        file_id = parse_endpoint(url)[1]
+
+        response = self._lookup(key, file_id, get_version)
+        if response is not None:
+            return response
+
+        response = send()
+        self._store(key, file_id, response)
+        return response
+
+    def _lookup(self, key, file_id, get_version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+
+            if self._clock() - entry.stored_at < self.ttl:
+                self.hits += 1
+                return entry.response
+
+        if self.validate and file_id is not None:
+            # fetching the version also lets the response fetched again
+            # below be validated the next time
+            checked_at, version = self._version(file_id, get_version)
+            if version is not None and version == entry.version:
+                # the response is known fresh as of the version check, not
+                # as of now: the version may have been checked a while ago
+                with self._lock:
+                    if key in self._entries:
+                        self._entries[key] = entry._replace(stored_at=checked_at)
+                    self.validated_hits += 1
+                return entry.response
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _version(self, file_id, get_version):
+        """Returns the time the version of a spreadsheet was checked and
+        the version, fetched at most once per ``ttl``.
+        """
+        checked_at, version = self._known_version(file_id)
+        if version is not None:
+            return checked_at, version
+
+        checked_at = self._clock()
+        version = get_version(file_id)
+        if version is not None:
+            with self._lock:
+                self._versions[file_id] = (checked_at, version)
+        return checked_at, version
+
+    def _known_version(self, file_id):
+        with self._lock:
+            checked_at, version = self._versions.get(file_id, (None, None))
+            if checked_at is not None and self._clock() - checked_at < self.ttl:
+                return checked_at, version
+            return None, None
+
+    def _store(self, key, file_id, response):
+        size = len(response.content)
+        if size > self.max_bytes:
+            return
+
+        # a version checked before the response was fetched is safe: the
+        # response can only be newer than it
+        version = self._known_version(file_id)[1] if file_id is not None else None
+        entry = _Entry(response, size, self._clock(), file_id, version)
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+
+            self._entries[key] = entry
+            self._size += size
+
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self.evictions += 1
+
+    def invalidate(self, url):
+        """Drops the cached responses of the spreadsheet ``url`` refers to,
+        and the file listings if it is a Drive URL.
+        """
+        endpoint, file_id = parse_endpoint(url)
+        drive = _DRIVE_PATH.search(endpoint) is not None
+
+        with self._lock:
+            self._versions.pop(file_id, None)
+
+            for key, entry in list(self._entries.items()):
+                same_file = file_id is not None and entry.file_id == file_id
+                listing = drive and entry.file_id is None
+                if same_file or listing:
+                    del self._entries[key]
+                    self._size -= entry.size
+
+    def clear(self):
+        """Drops all the cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._size = 0
@@ -6,6 +6,8 @@ This module contains common cells' models.
 
 """
 
+from collections.abc import Sequence
+
 from .utils import a1_to_rowcol, numericise, rowcol_to_a1
 
 
@@ -14,6 +16,8 @@ class Cell:
     in a :class:`~gspread.worksheet.Worksheet`.
     """
 
+    __slots__ = ("_row", "_col", "value")
+
     def __init__(self, row, col, value=""):
         self._row = row
         self._col = col
@@ -87,3 +91,117 @@ class Cell:
         :type: str
         """
         return rowcol_to_a1(self.row, self.col)
+
+
+class _CellView(Cell):
+    """A cell reading and writing its value in a :class:`CellBlock`."""
+
+    __slots__ = ("_block",)
+
+    def __init__(self, block, row, col):
+        self._block = block
+        self._row = row
+        self._col = col
+
+    def __repr__(self):
+        return "<Cell R{}C{} {}>".format(self.row, self.col, repr(self.value))
+
+    @property
+    def value(self):
+        """Value of the cell."""
+        block = self._block
+        return block.values[self._row - block.first_row][self._col - block.first_col]
+
+    @value.setter
+    def value(self, value):
+        block = self._block
+        block.values[self._row - block.first_row][self._col - block.first_col] = value
+
+
+class CellBlock(Sequence):
+    """A rectangular block of cells, stored as a grid of values.
+
+    A block behaves like the list of :class:`~gspread.cell.Cell` returned
+    by :meth:`~gspread.worksheet.Worksheet.range`, in the same row by row
+    order, but only keeps the values and the position of the top-left
+    cell. Cells are created when they are accessed and read and write
+    their value in the block, so changes made through them can be sent
+    with :meth:`~gspread.worksheet.Worksheet.update_cells`.
+
+    :param list values: The values, as a list of rows of the same length.
+    :param int first_row: (optional) Row number of the top-left cell.
+    :param int first_col: (optional) Column number of the top-left cell.
+
+    Example::
+
+        block = worksheet.range("A1:C1000", as_block=True)
+
+        for cell in block:
+            if cell.value == "":
+                cell.value = 0
+
+        worksheet.update_cells(block)
+    """
+
+    __slots__ = ("values", "first_row", "first_col", "_cols")
+
+    def __init__(self, values, first_row=1, first_col=1):
+        #: The values, as a list of rows.
+        self.values = values
+        self.first_row = first_row
+        self.first_col = first_col
+        self._cols = len(values[0]) if values else 0
+
+    def __repr__(self):
+        return "<{} R{}C{} {}x{}>".format(
+            self.__class__.__name__,
+            self.first_row,
+            self.first_col,
+            self.row_count,
+            self.col_count,
+        )
+
+    @property
+    def row_count(self):
+        """Number of rows in the block."""
+        return len(self.values) if self._cols else 0
+
+    @property
+    def col_count(self):
+        """Number of columns in the block."""
+        return self._cols
+
+    def __len__(self):
+        return self.row_count * self._cols
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("cell index out of range")
+
+        i, j = divmod(index, self._cols)
+        return _CellView(self, self.first_row + i, self.first_col + j)
+
+    def __iter__(self):
+        for i in range(self.row_count):
+            for j in range(self._cols):
+                yield _CellView(self, self.first_row + i, self.first_col + j)
+
+    def cell(self, row, col):
+        """Returns the cell at the given position of the worksheet.
+
+        :param int row: Row number.
+        :param int col: Column number.
+        :rtype: :class:`~gspread.cell.Cell`
+        """
+        i = row - self.first_row
+        j = col - self.first_col
+        if not (0 <= i < self.row_count and 0 <= j < self._cols):
+            raise IndexError("R{}C{} is outside of {!r}".format(row, col, self))
+
+        return _CellView(self, row, col)
@@ -7,19 +7,32 @@ Google API.
 
 """
 
-from http import HTTPStatus
+import gzip
+import json as jsonlib
+import logging
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import SimpleNamespace
 from typing import Type
 
 from google.auth.transport.requests import AuthorizedSession
-
-from .exceptions import APIError, SpreadsheetNotFound, UnSupportedExportFormat
-from .spreadsheet import Spreadsheet
-from .urls import (
-    DRIVE_FILES_API_V3_COMMENTS_URL,
-    DRIVE_FILES_API_V3_URL,
-    DRIVE_FILES_UPLOAD_API_V2_URL,
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from requests.exceptions import ConnectionError, Timeout
+
+from .exceptions import (
+    APIError,
+    SpreadsheetNotFound,
+    SpreadsheetsNotOpened,
+    UnSupportedExportFormat,
 )
+from .metrics import request_event
+from .retry import RetryPolicy
+from .spreadsheet import Spreadsheet
+from .urls import APIUrls
 from .utils import (
+    EXPORT_CHUNK_SIZE,
     ExportFormat,
     MimeType,
     convert_credentials,
@@ -27,6 +40,12 @@ from .utils import (
     finditem,
 )
 
+logger = logging.getLogger(__name__)
+
+#: The outcome of opening one spreadsheet with :meth:`Client.open_many`,
+#: either ``spreadsheet`` or ``error`` is None.
+OpenResult = namedtuple("OpenResult", ["key", "spreadsheet", "error"])
+
 
 class Client:
     """An instance of this class communicates with Google API.
@@ -38,10 +57,74 @@ class Client:
         while persisting some parameters across requests.
         Defaults to `google.auth.transport.requests.AuthorizedSession <https://google-auth.readthedocs.io/en/latest/reference/google.auth.transport.requests.html#google.auth.transport.requests.AuthorizedSession>`_.
 
+    :param retry_policy: (optional) A :class:`~gspread.retry.RetryPolicy`
+        deciding whether failed requests are sent again.
+        Defaults to None, failed requests raise immediately.
+
+    :param rate_limiter: (optional) A :class:`~gspread.ratelimit.RateLimiter`
+        pacing the requests sent by this client. It can be shared by
+        several clients. Defaults to None, requests are sent right away.
+
+    :param int pool_connections: (optional) Number of hosts to keep
+        connection pools for, see :class:`requests.adapters.HTTPAdapter`.
+    :param int pool_maxsize: (optional) Maximum number of connections kept
+        open to each Google API host. Set it to the number of threads
+        sharing the client to reuse connections instead of opening new ones.
+    :param max_retries: (optional) Number of retries of failed connections,
+        or a :class:`urllib3.util.Retry`, applied by the connection pools.
+        The ``retry_policy`` retries failed requests on top of that.
+
+    :param bool compress_requests: (optional) Whether or not to send JSON
+        bodies of at least :attr:`compress_min_size` bytes gzip-compressed.
+        Defaults to ``False``.
+
+    :param urls: (optional) The :class:`~gspread.urls.APIUrls` the requests
+        are sent to, shared by the spreadsheets and worksheets opened by
+        this client. Defaults to the Google APIs.
+    :param str base_url: (optional) A root URL serving both the Sheets and
+        Drive APIs, e.g. the one of a :class:`~gspread.fake.FakeServer`.
+        Shortcut for ``urls=APIUrls.from_base_url(base_url)``.
+
+    :param cache: (optional) A :class:`~gspread.cache.ResponseCache`
+        serving repeated GET requests from memory. Defaults to None,
+        every request is sent.
+
+    :param list observers: (optional) Callables called with a
+        :class:`~gspread.metrics.RequestEvent` after each request, e.g. a
+        :class:`~gspread.metrics.LatencyHistogram`. Observers are called in
+        the thread sending the request. Errors raised by an observer are
+        logged to the ``gspread.client`` logger and otherwise ignored.
+
+    When one of ``pool_connections``, ``pool_maxsize`` or ``max_retries`` is
+    given, an :class:`~requests.adapters.HTTPAdapter` using them is mounted
+    on the session for the Google API hosts.
+
+    Responses are always requested gzip-compressed: each request is sent
+    with ``Accept-Encoding: gzip`` and a user agent containing ``(gzip)``,
+    both required by Google APIs to compress their responses. The headers
+    of the session are left unchanged.
+
     >>> c = gspread.Client(auth=OAuthCredentialObject)
+
+    >>> # share a client across 32 threads
+    >>> c = gspread.Client(auth=OAuthCredentialObject, pool_maxsize=32)
     """
 
-    def __init__(self, auth, session=None):
+    def __init__(
+        self,
+        auth,
+        session=None,
+        retry_policy=None,
+        rate_limiter=None,
+        pool_connections=None,
+        pool_maxsize=None,
+        max_retries=None,
+        observers=None,
+        compress_requests=False,
+        urls=None,
+        base_url=None,
+        cache=None,
+    ):
         if auth is not None:
             self.auth = convert_credentials(auth)
             self.session = session or AuthorizedSession(self.auth)
@@ -49,6 +132,120 @@ class Client:
             self.session = session
 
         self.timeout = None
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.observers = list(observers or [])
+        self.compress_requests = compress_requests
+
+        if urls is None:
+            urls = APIUrls() if base_url is None else APIUrls.from_base_url(base_url)
+        self.urls = urls
+        self.cache = cache
+        # spreadsheet id -> (fetch time, metadata), shared by every
+        # Spreadsheet opened through this client
+        self.metadata_cache = {}
+
+        pool_options = (pool_connections, pool_maxsize, max_retries)
+        if self.session is not None and pool_options != (None, None, None):
+            self.mount_adapter(pool_connections, pool_maxsize, max_retries)
+
+    #: Minimum size in bytes of the JSON bodies compressed when
+    #: ``compress_requests`` is set, smaller ones are not worth it.
+    compress_min_size = 1024
+
+    def _gzip_headers(self, headers):
+        """Returns a copy of ``headers`` asking Google APIs for a
+        gzip-compressed response, on top of the session headers.
+        """
+        from . import __version__
+
+        # a user-supplied session may have no default headers
+        defaults = getattr(self.session, "headers", None) or {}
+        headers = dict(headers or {})
+
+        user_agent = headers.get("User-Agent", defaults.get("User-Agent", ""))
+        if "gzip" not in user_agent:
+            headers["User-Agent"] = "{} gspread/{} (gzip)".format(
+                user_agent, __version__
+            ).strip()
+
+        accept_encoding = headers.get(
+            "Accept-Encoding", defaults.get("Accept-Encoding", "")
+        )
+        if "gzip" not in accept_encoding:
+            headers["Accept-Encoding"] = ", ".join(
+                e for e in ("gzip", accept_encoding) if e
+            )
+
+        return headers
+
+    def mount_adapter(self, pool_connections=None, pool_maxsize=None, max_retries=None):
+        """Mounts an :class:`~requests.adapters.HTTPAdapter` with the given
+        pool sizes on the session, for the Google API hosts.
+
+        :param int pool_connections: (optional) Number of hosts to keep
+            connection pools for.
+        :param int pool_maxsize: (optional) Maximum number of connections
+            kept open to each host.
+        :param max_retries: (optional) Number of retries of failed
+            connections, or a :class:`urllib3.util.Retry`.
+        :returns: the mounted adapter.
+        """
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections or DEFAULT_POOLSIZE,
+            pool_maxsize=pool_maxsize or DEFAULT_POOLSIZE,
+            max_retries=max_retries or 0,
+            pool_block=DEFAULT_POOLBLOCK,
+        )
+
+        for url in self.urls.hosts:
+            self.session.mount(url, adapter)
+
+        return adapter
+
+    def pool_stats(self):
+        """Returns the use of the connection pools of the session, by host.
+
+        For each host: ``maxsize`` the number of connections kept open,
+        ``in_use`` the number of connections currently sending a request,
+        ``idle`` the number of open connections ready to be reused,
+        ``connections`` the number of connections opened so far and
+        ``requests`` the number of requests sent.
+
+        ``connections`` growing much faster than ``requests`` means
+        connections are not reused, ``in_use`` staying at ``maxsize``
+        means ``pool_maxsize`` is too small.
+
+        :rtype: dict
+        """
+        stats = {}
+
+        adapters = {id(a): a for a in getattr(self.session, "adapters", {}).values()}
+
+        for adapter in adapters.values():
+            poolmanager = getattr(adapter, "poolmanager", None)
+            if poolmanager is None:
+                continue
+
+            for key in poolmanager.pools.keys():
+                pool = poolmanager.pools.get(key)
+                if pool is None or pool.pool is None:
+                    continue
+
+                # the queue holds the idle connections, and None
+                # placeholders for the connections not opened yet
+                queued = list(pool.pool.queue)
+                maxsize = pool.pool.maxsize
+
+                stats[pool.host] = {
+                    "maxsize": maxsize,
+                    "in_use": max(maxsize - len(queued), 0),
+                    "idle": sum(conn is not None for conn in queued),
+                    "connections": pool.num_connections,
+                    "requests": pool.num_requests,
+                }
+
+        return stats
 
     def login(self):
         from google.auth.transport.requests import Request
@@ -75,23 +272,171 @@ class Client:
         json=None,
         files=None,
         headers=None,
+        stream=False,
     ):
-        response = getattr(self.session, method)(
+        """Sends a request to ``endpoint`` and returns its response.
+
+        :param bool stream: (optional) Whether or not to leave the response
+            body unread, to be consumed with
+            :meth:`~requests.Response.iter_content`. Streamed responses are
+            never cached, the caller must close them.
+        :raises gspread.exceptions.APIError: if the request fails.
+        """
+        args = (method, endpoint, params, data, json, files, headers, stream)
+
+        if self.cache is None:
+            return self._request(*args)
+
+        if method.lower() != "get" or (data, json, files) != (None, None, None):
+            try:
+                return self._request(*args)
+            finally:
+                self.cache.invalidate(endpoint)
+
+        if stream:
+            return self._request(*args)
+
+        return self.cache.fetch(
             endpoint,
-            json=json,
-            params=params,
-            data=data,
-            files=files,
-            headers=headers,
-            timeout=self.timeout,
+            params,
+            lambda: self._request(method, endpoint, params, headers=headers),
+            self._file_version,
         )
 
-        if response.ok:
-            return response
-        else:
-            raise APIError(response)
+    def _file_version(self, file_id):
+        """Returns the Drive version of a file, None if it is unknown."""
+        try:
+            response = self._request(
+                "get",
+                self.urls.drive_file % file_id,
+                params={"fields": "version", "supportsAllDrives": True},
+            )
+        except APIError:
+            return None
+        return response.json().get("version")
+
+    def _request(
+        self,
+        method,
+        endpoint,
+        params=None,
+        data=None,
+        json=None,
+        files=None,
+        headers=None,
+        stream=False,
+    ):
+        headers = self._gzip_headers(headers)
+        if self.compress_requests and json is not None:
+            json, data, headers = self._compress_json(json, data, headers)
 
-    def list_spreadsheet_files(self, title=None, folder_id=None):
+        call = SimpleNamespace(attempt=0, response=None)
+        start = time.monotonic()
+        started_at = time.time()
+        error = None
+        # only passed when set, as sessions may not accept it
+        options = {"stream": True} if stream else {}
+
+        try:
+            return self._send(
+                method,
+                endpoint,
+                call,
+                start,
+                json=json,
+                params=params,
+                data=data,
+                files=files,
+                headers=headers,
+                **options,
+            )
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if self.observers:
+                event = request_event(
+                    method,
+                    endpoint,
+                    call.response,
+                    started_at,
+                    time.monotonic() - start,
+                    call.attempt,
+                    error,
+                )
+                self._notify(event)
+
+    def _notify(self, event):
+        """Calls the observers with ``event``. An observer raising is logged
+        and skipped, so it can neither hide the result of the request nor
+        keep the other observers from being called.
+        """
+        for observer in self.observers:
+            try:
+                observer(event)
+            except Exception:
+                logger.exception("observer %r failed on %s", observer, event)
+
+    def _compress_json(self, json, data, headers):
+        """Returns the ``json``, ``data`` and ``headers`` to send ``json``
+        gzip-compressed, or unchanged if it is smaller than
+        :attr:`compress_min_size`.
+        """
+        body = jsonlib.dumps(json).encode("utf-8")
+
+        if len(body) < self.compress_min_size:
+            return json, data, headers
+
+        headers = dict(headers or {})
+        headers["Content-Type"] = "application/json"
+        headers["Content-Encoding"] = "gzip"
+        return None, gzip.compress(body), headers
+
+    def _send(self, method, endpoint, call, start, **kwargs):
+        """Sends a request, retrying it according to the retry policy.
+        The number of retries and the last response are kept in ``call``.
+        """
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(method)
+
+            call.response = None
+
+            try:
+                response = getattr(self.session, method)(
+                    endpoint, timeout=self.timeout, **kwargs
+                )
+            except (ConnectionError, Timeout):
+                delay = self._retry_delay(method, call.attempt, start)
+                if delay is None:
+                    raise
+            else:
+                call.response = response
+
+                if response.ok:
+                    return response
+
+                delay = self._retry_delay(method, call.attempt, start, response)
+                if delay is None:
+                    raise APIError(response)
+
+                # give the connection back to the pool while waiting
+                response.close()
+
+            self.retry_policy.sleep(delay)
+            call.attempt += 1
+
+    def _retry_delay(self, method, attempt, start, response=None):
+        """Returns the delay before retrying a failed request,
+        None if it must not be retried.
+        """
+        if self.retry_policy is None:
+            return None
+
+        elapsed = time.monotonic() - start
+        return self.retry_policy.get_delay(attempt, elapsed, response, method)
+
+    def list_spreadsheet_files(self, title=None, folder_id=None, fields=None):
         """List all the spreadsheet files
 
         Will list all spreadsheet files owned by/shared with this user account.
@@ -101,10 +446,15 @@ class Client:
             The parameter ``folder_id`` can be obtained from the URL when looking at
             a folder in a web browser as follow:
             ``https://drive.google.com/drive/u/0/folders/<folder_id>``
+        :param str fields: (optional) The fields of each file to fetch,
+            e.g. ``"id,name"``. Defaults to ``"id,name,createdTime,modifiedTime"``.
         """
+        if fields is None:
+            fields = "id,name,createdTime,modifiedTime"
+
         files = []
         page_token = ""
-        url = DRIVE_FILES_API_V3_URL
+        url = self.urls.drive_files_api_v3
 
         q = 'mimeType="{}"'.format(MimeType.google_sheets)
         if title:
@@ -117,7 +467,7 @@ class Client:
             "pageSize": 1000,
             "supportsAllDrives": True,
             "includeItemsFromAllDrives": True,
-            "fields": "kind,nextPageToken,files(id,name,createdTime,modifiedTime)",
+            "fields": "kind,nextPageToken,files({})".format(fields),
         }
 
         while page_token is not None:
@@ -130,12 +480,14 @@ class Client:
 
         return files
 
-    def open(self, title, folder_id=None):
+    def open(self, title, folder_id=None, lazy=False):
         """Opens a spreadsheet.
 
         :param str title: A title of a spreadsheet.
         :param str folder_id: (optional) If specified can be used to filter
             spreadsheets by parent folder ID.
+        :param bool lazy: (optional) Whether or not to defer fetching the
+            spreadsheet metadata, see :meth:`open_by_key`.
         :returns: a :class:`~gspread.models.Spreadsheet` instance.
 
         If there's more than one spreadsheet with same title the first one
@@ -155,24 +507,35 @@ class Client:
             # Drive uses different terminology
             properties["title"] = properties["name"]
 
-            return Spreadsheet(self, properties)
+            return Spreadsheet(self, properties, lazy=lazy)
         except StopIteration:
             raise SpreadsheetNotFound
 
-    def open_by_key(self, key):
+    def open_by_key(self, key, lazy=False):
         """Opens a spreadsheet specified by `key` (a.k.a Spreadsheet ID).
 
         :param str key: A key of a spreadsheet as it appears in a URL in a browser.
+        :param bool lazy: (optional) Whether or not to defer fetching the
+            spreadsheet metadata until a property like
+            :attr:`~gspread.spreadsheet.Spreadsheet.title` or a worksheet is
+            first needed. Opening the spreadsheet then sends no request,
+            and a missing spreadsheet is only reported by the first
+            request made. Defaults to ``False``.
         :returns: a :class:`~gspread.models.Spreadsheet` instance.
 
         >>> gc.open_by_key('0BmgG6nO_6dprdS1MN3d3MkdPa142WFRrdnRRUWl1UFE')
+
+        >>> # no request until the values are read
+        >>> gc.open_by_key(key, lazy=True).values_get("Sheet1!A1:C10")
         """
-        return Spreadsheet(self, {"id": key})
+        return Spreadsheet(self, {"id": key}, lazy=lazy)
 
-    def open_by_url(self, url):
+    def open_by_url(self, url, lazy=False):
         """Opens a spreadsheet specified by `url`.
 
         :param str url: URL of a spreadsheet as it appears in a browser.
+        :param bool lazy: (optional) Whether or not to defer fetching the
+            spreadsheet metadata, see :meth:`open_by_key`.
 
         :returns: a :class:`~gspread.models.Spreadsheet` instance.
 
@@ -181,13 +544,71 @@ class Client:
 
         >>> gc.open_by_url('https://docs.google.com/spreadsheet/ccc?key=0Bm...FE&hl')
         """
-        return self.open_by_key(extract_id_from_url(url))
-
-    def openall(self, title=None):
+        return self.open_by_key(extract_id_from_url(url), lazy=lazy)
+
+    def open_many(self, keys, max_workers=None):
+        """Opens many spreadsheets specified by their keys, concurrently.
+
+        Each spreadsheet is opened with :meth:`open_by_key` on a pool of
+        worker threads. The requests go through the ``rate_limiter`` and
+        ``retry_policy`` of the client like any other.
+
+        :param keys: An iterable of spreadsheet keys.
+        :param int max_workers: (optional) Maximum number of spreadsheets
+            opened at the same time. Defaults to the
+            :class:`~concurrent.futures.ThreadPoolExecutor` default. Set the
+            ``pool_maxsize`` of the client to at least this number to reuse
+            connections.
+        :returns: a generator of :data:`~gspread.client.OpenResult` ``(key, spreadsheet, error)``,
+            in the order the spreadsheets are opened. A spreadsheet failing
+            to open does not stop the others, its error is returned instead.
+
+        Example::
+
+            failed = {}
+            for key, spreadsheet, error in gc.open_many(keys, max_workers=16):
+                if error is not None:
+                    failed[key] = error
+                else:
+                    print(spreadsheet.title)
+        """
+        for key, spreadsheet, error in self._open_concurrently(
+            self.open_by_key, keys, max_workers
+        ):
+            yield OpenResult(key, spreadsheet, error)
+
+    def _open_concurrently(self, open_one, items, max_workers):
+        """Yields ``(item, spreadsheet, error)`` for each of ``items``,
+        opened with ``open_one(item)`` on a pool of threads, as they complete.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(open_one, item): item for item in items}
+            try:
+                for future in as_completed(futures):
+                    try:
+                        yield futures[future], future.result(), None
+                    except Exception as error:
+                        yield futures[future], None, error
+            finally:
+                # the caller stopped early, do not open the remaining ones
+                for future in futures:
+                    future.cancel()
+
+    def openall(self, title=None, parallel=False, max_workers=None, lazy=False):
         """Opens all available spreadsheets.
 
         :param str title: (optional) If specified can be used to filter
             spreadsheets by title.
+        :param bool parallel: (optional) Whether or not to open the
+            spreadsheets concurrently, see :meth:`open_many`. If some fail
+            to open, :exc:`~gspread.exceptions.SpreadsheetsNotOpened` is
+            raised once all are done, holding the error of each one and
+            the spreadsheets that were opened. Defaults to ``False``.
+        :param int max_workers: (optional) Maximum number of spreadsheets
+            opened at the same time when ``parallel`` is ``True``.
+        :param bool lazy: (optional) Whether or not to defer fetching the
+            metadata of each spreadsheet, see :meth:`open_by_key`. No
+            request is sent besides the file listing.
 
         :returns: a list of :class:`~gspread.models.Spreadsheet` instances.
         """
@@ -198,11 +619,31 @@ class Client:
                 spread for spread in spreadsheet_files if title == spread["name"]
             ]
 
-        return [
-            Spreadsheet(self, dict(title=x["name"], **x)) for x in spreadsheet_files
-        ]
+        properties = [dict(title=x["name"], **x) for x in spreadsheet_files]
+
+        if lazy or not parallel:
+            return [Spreadsheet(self, p, lazy=lazy) for p in properties]
+
+        spreadsheets = [None] * len(properties)
+        errors = {}
+        for i, spreadsheet, error in self._open_concurrently(
+            lambda i: Spreadsheet(self, properties[i]),
+            range(len(properties)),
+            max_workers,
+        ):
+            spreadsheets[i] = spreadsheet
+            if error is not None:
+                errors[i] = error
+
+        if errors:
+            raise SpreadsheetsNotOpened(
+                [s for s in spreadsheets if s is not None],
+                {properties[i]["id"]: errors[i] for i in sorted(errors)},
+            )
 
-    def create(self, title, folder_id=None):
+        return spreadsheets
+
+    def create(self, title, folder_id=None, lazy=False):
         """Creates a new spreadsheet.
 
         :param str title: A title of a new spreadsheet.
@@ -210,6 +651,9 @@ class Client:
         :param str folder_id: Id of the folder where we want to save
             the spreadsheet.
 
+        :param bool lazy: (optional) Whether or not to defer fetching the
+            metadata of the new spreadsheet, see :meth:`open_by_key`.
+
         :returns: a :class:`~gspread.models.Spreadsheet` instance.
 
         """
@@ -225,8 +669,12 @@ class Client:
         if folder_id is not None:
             payload["parents"] = [folder_id]
 
-        r = self.request("post", DRIVE_FILES_API_V3_URL, json=payload, params=params)
+        r = self.request(
+            "post", self.urls.drive_files_api_v3, json=payload, params=params
+        )
         spreadsheet_id = r.json()["id"]
+        if lazy:
+            return Spreadsheet(self, {"id": spreadsheet_id, "title": title}, lazy=True)
         return self.open_by_key(spreadsheet_id)
 
     def export(self, file_id, format=ExportFormat.PDF):
@@ -254,13 +702,56 @@ class Client:
         if format not in ExportFormat:
             raise UnSupportedExportFormat
 
-        url = "{}/{}/export".format(DRIVE_FILES_API_V3_URL, file_id)
+        url = self.urls.drive_file_export % file_id
 
         params = {"mimeType": format}
 
         r = self.request("get", url, params=params)
         return r.content
 
+    def export_to(
+        self, file_id, file, format=ExportFormat.PDF, chunk_size=EXPORT_CHUNK_SIZE
+    ):
+        """Export the spreadsheet in the given format to a file.
+
+        Unlike :meth:`export`, the exported file is never held in memory:
+        it is written chunk by chunk while it is downloaded. Several
+        exports can run at the same time from different threads, each
+        one holds a connection until it is done.
+
+        :param str file_id: The key of the spreadsheet to export.
+        :param file: A path, or a file object opened in binary mode. A file
+            written at a path is removed if the export fails.
+        :param str format: The format of the resulting file, see
+            :meth:`export`.
+        :param int chunk_size: (optional) Size of the chunks written to
+            ``file``, in bytes.
+
+        :returns int: The number of bytes written.
+
+        Example::
+
+            size = gc.export_to(key, "report.xlsx", ExportFormat.EXCEL)
+        """
+        if format not in ExportFormat:
+            raise UnSupportedExportFormat
+
+        url = self.urls.drive_file_export % file_id
+
+        r = self.request("get", url, params={"mimeType": format}, stream=True)
+
+        with r:
+            if hasattr(file, "write"):
+                return _write_chunks(r, file, chunk_size)
+
+            try:
+                with open(file, "wb") as f:
+                    return _write_chunks(r, f, chunk_size)
+            except BaseException:
+                if os.path.exists(file):
+                    os.remove(file)
+                raise
+
     def copy(
         self,
         file_id,
@@ -268,6 +759,7 @@ class Client:
         copy_permissions=False,
         folder_id=None,
         copy_comments=True,
+        lazy=False,
     ):
         """Copies a spreadsheet.
 
@@ -283,6 +775,9 @@ class Client:
         :param bool copy_comments: (optional) If True, copy the comments from
             the original spreadsheet to the new spreadsheet.
 
+        :param bool lazy: (optional) Whether or not to defer fetching the
+            metadata of the new spreadsheet, see :meth:`open_by_key`.
+
         :returns: a :class:`~gspread.models.Spreadsheet` instance.
 
         .. versionadded:: 3.1.0
@@ -304,7 +799,7 @@ class Client:
            when you try to copy a spreadsheet.
 
         """
-        url = "{}/{}/copy".format(DRIVE_FILES_API_V3_URL, file_id)
+        url = self.urls.drive_file_copy % file_id
 
         payload = {
             "name": title,
@@ -316,12 +811,14 @@ class Client:
 
         params = {"supportsAllDrives": True}
         r = self.request("post", url, json=payload, params=params)
-        spreadsheet_id = r.json()["id"]
+        copied = r.json()
 
-        new_spreadsheet = self.open_by_key(spreadsheet_id)
+        new_spreadsheet = Spreadsheet(
+            self, {"id": copied["id"], "title": copied["name"]}, lazy=lazy
+        )
 
         if copy_permissions is True:
-            original = self.open_by_key(file_id)
+            original = self.open_by_key(file_id, lazy=lazy)
 
             permissions = original.list_permissions()
             for p in permissions:
@@ -338,7 +835,7 @@ class Client:
                     pass
 
         if copy_comments is True:
-            source_url = DRIVE_FILES_API_V3_COMMENTS_URL % (file_id)
+            source_url = self.urls.drive_files_api_v3_comments % (file_id)
             page_token = ""
             comments = []
             params = {
@@ -354,7 +851,9 @@ class Client:
                 comments.extend(res["comments"])
                 page_token = res.get("nextPageToken", None)
 
-            destination_url = DRIVE_FILES_API_V3_COMMENTS_URL % (new_spreadsheet.id)
+            destination_url = self.urls.drive_files_api_v3_comments % (
+                new_spreadsheet.id
+            )
             # requesting some fields in the response is mandatory from the API.
             # choose 'id' randomly out of all the fields, but no need to use it for now.
             params = {"fields": "id"}
@@ -368,10 +867,11 @@ class Client:
 
         :param str file_id: a spreadsheet ID (a.k.a file ID).
         """
-        url = "{}/{}".format(DRIVE_FILES_API_V3_URL, file_id)
+        url = self.urls.drive_file % file_id
 
         params = {"supportsAllDrives": True}
         self.request("delete", url, params=params)
+        self.metadata_cache.pop(file_id, None)
 
     def import_csv(self, file_id, data):
         """Imports data into the first page of the spreadsheet.
@@ -398,7 +898,7 @@ class Client:
             data = data.encode("utf-8")
 
         headers = {"Content-Type": "text/csv"}
-        url = "{}/{}".format(DRIVE_FILES_UPLOAD_API_V2_URL, file_id)
+        url = self.urls.drive_file_upload % file_id
 
         self.request(
             "put",
@@ -411,13 +911,15 @@ class Client:
             },
             headers=headers,
         )
+        # the worksheets were replaced, drop their cached metadata
+        self.metadata_cache.pop(file_id, None)
 
     def list_permissions(self, file_id):
         """Retrieve a list of permissions for a file.
 
         :param str file_id: a spreadsheet ID (aka file ID).
         """
-        url = "{}/{}/permissions".format(DRIVE_FILES_API_V3_URL, file_id)
+        url = self.urls.drive_file_permissions % file_id
 
         params = {
             "supportsAllDrives": True,
@@ -490,7 +992,7 @@ class Client:
 
         """
 
-        url = "{}/{}/permissions".format(DRIVE_FILES_API_V3_URL, file_id)
+        url = self.urls.drive_file_permissions % file_id
 
         payload = {
             "emailAddress": value,
@@ -513,14 +1015,23 @@ class Client:
         :param str file_id: a spreadsheet ID (aka file ID.)
         :param str permission_id: an ID for the permission.
         """
-        url = "{}/{}/permissions/{}".format(
-            DRIVE_FILES_API_V3_URL, file_id, permission_id
-        )
+        url = self.urls.drive_file_permission % (file_id, permission_id)
 
         params = {"supportsAllDrives": True}
         self.request("delete", url, params=params)
 
 
+def _write_chunks(response, file, chunk_size):
+    """Writes the body of a streamed response to ``file``, returns the
+    number of bytes written.
+    """
+    size = 0
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        file.write(chunk)
+        size += len(chunk)
+    return size
+
+
 class BackoffClient(Client):
     """BackoffClient is a gspread client with exponential
     backoff retries.
@@ -531,62 +1042,20 @@ class BackoffClient(Client):
     This can help by trying the request after some time and
     prevent the application from failing (by raising an APIError exception).
 
-    .. Warning::
-        This Client is not production ready yet.
-        Use it at your own risk !
+    It is a :class:`~gspread.Client` using a default
+    :class:`~gspread.retry.RetryPolicy`. The retry state is kept by each
+    request, so a single client can be shared by many threads.
 
     .. note::
         To use with the `auth` module, make sure to pass this backoff
         client factory using the ``client_factory`` parameter of the
         method used.
+    """
 
-    .. note::
-        Currently known issues are:
-
-        * will retry exponentially even when the error should
-          raise instantly. Due to the Drive API that raises
-          403 (Forbidden) errors for forbidden access and
-          for api rate limit exceeded."""
-
-    _HTTP_ERROR_CODES = [
-        HTTPStatus.FORBIDDEN,  # Drive API return a 403 Forbidden on usage rate limit exceeded
-        HTTPStatus.REQUEST_TIMEOUT,  # in case of a timeout
-        HTTPStatus.TOO_MANY_REQUESTS,  # sheet API usage rate limit exceeded
-    ]
-    _NR_BACKOFF = 0
-    _MAX_BACKOFF = 128  # arbitrary maximum backoff
-    _MAX_BACKOFF_REACHED = False  # Stop after reaching _MAX_BACKOFF
-
-    def request(self, *args, **kwargs):
-        try:
-            return super().request(*args, **kwargs)
-        except APIError as err:
-            data = err.response.json()
-            code = data["error"]["code"]
-
-            # check if error should retyr
-            if code in self._HTTP_ERROR_CODES and self._MAX_BACKOFF_REACHED is False:
-                self._NR_BACKOFF += 1
-                wait = min(2**self._NR_BACKOFF, self._MAX_BACKOFF)
-
-                if wait >= self._MAX_BACKOFF:
-                    self._MAX_BACKOFF_REACHED = True
-
-                import time
-
-                time.sleep(wait)
-
-                # make the request again
-                response = self.request(*args, **kwargs)
-
-                # reset counters for next time
-                self._NR_BACKOFF = 0
-                self._MAX_BACKOFF_REACHED = False
-
-                return response
-
-            # failed too many times, raise APIEerror
-            raise err
+    def __init__(self, auth, session=None, retry_policy=None, **kwargs):
+        super().__init__(
+            auth, session, retry_policy=retry_policy or RetryPolicy(), **kwargs
+        )
 
 
 ClientFactory = Type[Client]
@@ -0,0 +1,191 @@
+"""
+gspread.columnar
+~~~~~~~~~~~~~~~~
+
+This module contains the column oriented conversion of records, used by
+:meth:`gspread.worksheet.Worksheet.get_record_columns`.
+
+It requires NumPy, and pandas to build data frames. Both are imported
+only when needed.
+
+"""
+
+import importlib
+
+from .utils import numericise
+
+
+def _require(name):
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise ImportError(
+            "{0} is required for column oriented records, "
+            "install it with 'pip install {0}'".format(name)
+        ) from e
+
+
+def _column_array(values):
+    """Builds the array of already numericised ``values``, with an int or
+    float dtype when all of them are numbers.
+    """
+    np = _require("numpy")
+
+    types = {type(v) for v in values}
+
+    try:
+        if types <= {int}:
+            return np.array(values, dtype=np.int64)
+        if types <= {int, float}:
+            return np.array(values, dtype=np.float64)
+    except OverflowError:
+        pass
+
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _parse_numbers(values):
+    """Parses a list of strings as an ``int64`` array, or a ``float64``
+    array if some values are not integers. Returns None if they can not
+    all be parsed.
+    """
+    np = _require("numpy")
+
+    # converting the whole list with the builtin parsers is much faster
+    # than both numericise() and NumPy's own string to number casts
+    try:
+        return np.array(list(map(int, values)), dtype=np.int64)
+    except OverflowError:
+        # integers that do not fit in 64 bits must stay Python ints
+        return None
+    except ValueError:
+        pass
+
+    try:
+        return np.array(list(map(float, values)), dtype=np.float64)
+    except ValueError:
+        return None
+
+
+def numericise_column(
+    values,
+    empty2zero=False,
+    default_blank="",
+    allow_underscores_in_numeric_literals=False,
+):
+    """Numericises a whole column of values at once.
+
+    The type of the column is inferred once: when all its values are
+    integers it becomes an ``int64`` array, when they are all numbers a
+    ``float64`` array. Blank cells are 0 if ``empty2zero`` is set, otherwise
+    they hold ``default_blank`` in an ``object`` array.
+
+    A column that can not be parsed as a whole, e.g. mixing numbers and
+    text, is converted value by value with :func:`~gspread.utils.numericise`
+    into an ``object`` array.
+
+    :param list values: The values of the column.
+    :param bool empty2zero: (optional) Whether or not to return empty cells
+        as 0 (zero). Defaults to ``False``.
+    :param str default_blank: (optional) Which value to use for blank cells,
+        defaults to empty string.
+    :param bool allow_underscores_in_numeric_literals: (optional) Whether or
+        not to allow visual underscores in numeric literals.
+    :rtype: numpy.ndarray
+    """
+    np = _require("numpy")
+
+    def exact():
+        return _column_array(
+            [
+                numericise(
+                    value,
+                    empty2zero,
+                    default_blank,
+                    allow_underscores_in_numeric_literals,
+                )
+                for value in values
+            ]
+        )
+
+    if not values or set(map(type, values)) != {str}:
+        return exact()
+
+    # a single scan of the column tells which cleanups are needed
+    joined = "\n".join(values)
+    cleaned = values
+
+    if "_" in joined:
+        if not allow_underscores_in_numeric_literals:
+            return exact()
+        cleaned = [value.replace("_", "") for value in cleaned]
+
+    if "," in joined:
+        cleaned = [value.replace(",", "") for value in cleaned]
+
+    if "" not in cleaned:
+        parsed = _parse_numbers(cleaned)
+        return exact() if parsed is None else parsed
+
+    blank = np.array([value == "" for value in cleaned], dtype=bool)
+    parsed = _parse_numbers([value for value in cleaned if value != ""])
+
+    if parsed is None:
+        return exact()
+
+    if empty2zero:
+        result = np.zeros(len(values), dtype=parsed.dtype)
+    else:
+        result = np.full(len(values), default_blank, dtype=object)
+
+    result[~blank] = parsed if empty2zero else parsed.tolist()
+    return result
+
+
+def records_to_columns(
+    keys,
+    rows,
+    empty2zero=False,
+    default_blank="",
+    allow_underscores_in_numeric_literals=False,
+    numericise_ignore=[],
+):
+    """Converts ``rows`` of values into a dict mapping each key to the
+    array of its column, numericised with :func:`numericise_column`.
+
+    :param list keys: The column names.
+    :param list rows: The rows of values, all of the same length as ``keys``.
+    :param list numericise_ignore: (optional) List of ints of indices of
+        the columns (starting at 1) to ignore numericising, special use
+        of ['all'] to ignore numericising on all columns.
+    :rtype: dict
+    """
+    np = _require("numpy")
+
+    columns = {}
+
+    for i, key in enumerate(keys):
+        values = [row[i] for row in rows]
+
+        if numericise_ignore == ["all"] or i + 1 in numericise_ignore:
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+        else:
+            column = numericise_column(
+                values,
+                empty2zero,
+                default_blank,
+                allow_underscores_in_numeric_literals,
+            )
+
+        columns[key] = column
+
+    return columns
+
+
+def columns_to_dataframe(columns):
+    """Builds a :class:`pandas.DataFrame` from a dict of column arrays."""
+    pd = _require("pandas")
+    return pd.DataFrame(columns)
@@ -39,6 +39,26 @@ class InvalidInputValue(GSpreadException):
     """The provided values is incorrect."""
 
 
+class SpreadsheetsNotOpened(GSpreadException):
+    """Some spreadsheets failed to open in a parallel
+    :meth:`~gspread.Client.openall`, the others are still returned.
+
+    :attr list spreadsheets: The spreadsheets that were opened, in the
+        order of the file listing.
+    :attr dict errors: The error of each spreadsheet that failed to
+        open, by spreadsheet ID.
+    """
+
+    def __init__(self, spreadsheets, errors):
+        super().__init__(
+            "{} spreadsheet(s) failed to open: {}".format(
+                len(errors), ", ".join(errors)
+            )
+        )
+        self.spreadsheets = spreadsheets
+        self.errors = errors
+
+
 class APIError(GSpreadException):
     def __init__(self, response):
 
@@ -0,0 +1,1179 @@
+"""
+gspread.fake
+~~~~~~~~~~~~
+
+This module contains an in-memory stand-in of the parts of the Google
+Sheets v4 and Drive v3 APIs used by gspread, to test and benchmark code
+using gspread without network access or quotas.
+
+It is served either in-process, by a transport adapter mounted on the
+client session, or over HTTP on localhost.
+
+"""
+
+import copy
+import csv
+import datetime
+import gzip
+import io
+import json
+import random
+import re
+import threading
+import time
+from collections import deque, namedtuple
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .exceptions import IncorrectCellLabel
+from .metrics import parse_endpoint
+from .urls import APIUrls
+from .utils import (
+    Dimension,
+    MimeType,
+    ValueInputOption,
+    ValueRenderOption,
+    a1_range_to_grid_range,
+    absolute_range_name,
+    rowcol_to_a1,
+)
+
+_STATUSES = {
+    400: "INVALID_ARGUMENT",
+    403: "PERMISSION_DENIED",
+    404: "NOT_FOUND",
+    429: "RESOURCE_EXHAUSTED",
+    500: "INTERNAL",
+    503: "UNAVAILABLE",
+}
+
+_NUMBER_RE = re.compile(r"[+-]?(\d{1,3}(,\d{3})+|\d*)(\.\d+)?([eE][+-]?\d+)?")
+_SIMPLE_TITLE_RE = re.compile(r"[A-Za-z0-9_]+")
+
+# formatting and validation requests accepted by batchUpdate, they do not
+# change anything the fake API keeps track of
+_NOOP_REQUESTS = {
+    "repeatCell",
+    "updateBorders",
+    "mergeCells",
+    "unmergeCells",
+    "updateDimensionProperties",
+    "autoResizeDimensions",
+    "setBasicFilter",
+    "clearBasicFilter",
+    "setDataValidation",
+    "addConditionalFormatRule",
+    "addProtectedRange",
+}
+
+# a response body which is not JSON, e.g. an exported file
+_Raw = namedtuple("_Raw", ["content", "content_type"])
+
+
+class FakeAPIError(Exception):
+    """An error answered by the fake API, in the format of Google APIs."""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+    def json(self):
+        return {
+            "error": {
+                "code": self.code,
+                "message": self.message,
+                "status": _STATUSES.get(self.code, "UNKNOWN"),
+            }
+        }
+
+
+def _param(params, name, default=None):
+    values = params.get(name)
+    return values[0] if values else default
+
+
+def _flag(value):
+    return str(value).lower() == "true"
+
+
+def _user_entered(value):
+    """Parses a value like the Sheets UI does: numbers and booleans."""
+    if not isinstance(value, str):
+        return value
+    if value.startswith("'"):
+        return value[1:]
+    if value.upper() in ("TRUE", "FALSE"):
+        return value.upper() == "TRUE"
+    if not re.search(r"\d", value) or not _NUMBER_RE.fullmatch(value):
+        return value
+
+    number = float(value.replace(",", ""))
+    return int(number) if number.is_integer() else number
+
+
+def _formatted(value):
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return value if isinstance(value, str) else str(value)
+
+
+def _trim(rows):
+    """Drops the trailing blank cells of each row, then the trailing
+    blank rows.
+    """
+    trimmed = []
+    for row in rows:
+        end = len(row)
+        while end and row[end - 1] == "":
+            end -= 1
+        trimmed.append(row[:end])
+
+    while trimmed and not trimmed[-1]:
+        trimmed.pop()
+
+    return trimmed
+
+
+def _transpose(rows):
+    width = max((len(row) for row in rows), default=0)
+    padded = [row + [""] * (width - len(row)) for row in rows]
+    return _trim([list(column) for column in zip(*padded)])
+
+
+def _split_range(name):
+    """Splits a range name into its sheet title, None if absent, and its
+    A1 part.
+    """
+    if name.startswith("'"):
+        match = re.match(r"'((?:[^']|'')*)'(?:!(.*))?$", name)
+        if match is None:
+            raise FakeAPIError(400, "Unable to parse range: {}".format(name))
+        return match.group(1).replace("''", "'"), match.group(2) or ""
+
+    title, bang, a1 = name.partition("!")
+    if not bang:
+        return None, name
+    return title, a1
+
+
+def _field_paths(fields):
+    """Returns the paths of a field mask, e.g. ``gridProperties/rowCount``
+    or ``gridProperties(rowCount,columnCount)``, as tuples of keys.
+    """
+    paths = []
+    depth = 0
+    start = 0
+
+    for i, char in enumerate(fields + ","):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            field = fields[start:i].strip().replace("/", ".")
+            start = i + 1
+            if "(" in field:
+                prefix, _, nested = field[:-1].partition("(")
+                paths.extend(
+                    tuple(prefix.split(".")) + path for path in _field_paths(nested)
+                )
+            elif field:
+                paths.append(tuple(field.split(".")))
+
+    return paths
+
+
+def _apply_fields(target, source, fields):
+    """Copies the ``fields`` of ``source`` into ``target``."""
+    if fields.strip() == "*":
+        target.update(copy.deepcopy(source))
+        return
+
+    for path in _field_paths(fields):
+        src, dst = source, target
+        for key in path[:-1]:
+            src = src.get(key, {})
+            dst = dst.setdefault(key, {})
+        if path[-1] in src:
+            dst[path[-1]] = copy.deepcopy(src[path[-1]])
+        else:
+            dst.pop(path[-1], None)
+
+
+def _now():
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return now.strftime("%Y-%m-%dT%H:%M:%S.") + "{:03d}Z".format(
+        now.microsecond // 1000
+    )
+
+
+class _Sheet:
+    """A worksheet: its properties and its grid of values."""
+
+    def __init__(self, properties):
+        self.properties = properties
+        self.values = []
+
+    @property
+    def title(self):
+        return self.properties["title"]
+
+    @property
+    def grid(self):
+        return self.properties["gridProperties"]
+
+    def label(self, row, col, last_row, last_col):
+        """Returns the A1 notation of a range of this sheet, 1-based."""
+        title = self.title
+        if not _SIMPLE_TITLE_RE.fullmatch(title):
+            title = absolute_range_name(title)
+
+        if last_row < row or last_col < col:
+            return "{}!{}".format(title, rowcol_to_a1(row, col))
+
+        return "{}!{}:{}".format(
+            title, rowcol_to_a1(row, col), rowcol_to_a1(last_row, last_col)
+        )
+
+    def bounds(self, grid_range):
+        """Returns the 1-based, inclusive, bounds of a grid range, with its
+        unbounded sides extended to the grid.
+        """
+        return (
+            grid_range.get("startRowIndex", 0) + 1,
+            grid_range.get("startColumnIndex", 0) + 1,
+            min(
+                grid_range.get("endRowIndex", self.grid["rowCount"]),
+                self.grid["rowCount"],
+            ),
+            min(
+                grid_range.get("endColumnIndex", self.grid["columnCount"]),
+                self.grid["columnCount"],
+            ),
+        )
+
+    def read(self, row, col, last_row, last_col):
+        return _trim([r[col - 1 : last_col] for r in self.values[row - 1 : last_row]])
+
+    def write(self, row, col, values):
+        rows = self.grid["rowCount"]
+        cols = self.grid["columnCount"]
+        width = max((len(r) for r in values), default=0)
+
+        if row - 1 + len(values) > rows or col - 1 + width > cols:
+            raise FakeAPIError(
+                400,
+                "Range ({}) exceeds grid limits. Max rows: {}, max columns: {}".format(
+                    self.label(row, col, row + len(values) - 1, col + width - 1),
+                    rows,
+                    cols,
+                ),
+            )
+
+        while len(self.values) < row - 1 + len(values):
+            self.values.append([])
+
+        for i, new_row in enumerate(values):
+            target = self.values[row - 1 + i]
+            if len(target) < col - 1 + len(new_row):
+                target.extend([""] * (col - 1 + len(new_row) - len(target)))
+            for j, value in enumerate(new_row):
+                # null values leave the cell unchanged
+                if value is not None:
+                    target[col - 1 + j] = value
+
+    def clear(self, row, col, last_row, last_col):
+        for target in self.values[row - 1 : last_row]:
+            for j in range(col - 1, min(last_col, len(target))):
+                target[j] = ""
+
+    def table_end(self, row, col, last_col):
+        """Returns the last row of the table starting at ``row``: the rows
+        holding values between the two columns, without gap.
+        """
+        end = row - 1
+        while end < len(self.values) and any(
+            value != "" for value in self.values[end][col - 1 : last_col]
+        ):
+            end += 1
+        return end
+
+    def resize(self, rows, cols):
+        self.grid["rowCount"] = rows
+        self.grid["columnCount"] = cols
+        del self.values[rows:]
+        for target in self.values:
+            del target[cols:]
+
+    def insert(self, dimension, start, count):
+        if dimension == Dimension.rows:
+            self.grid["rowCount"] += count
+            if start < len(self.values):
+                self.values[start:start] = [[] for _ in range(count)]
+        else:
+            self.grid["columnCount"] += count
+            for target in self.values:
+                if start < len(target):
+                    target[start:start] = [""] * count
+
+    def delete(self, dimension, start, end):
+        if dimension == Dimension.rows:
+            self.grid["rowCount"] -= end - start
+            del self.values[start:end]
+        else:
+            self.grid["columnCount"] -= end - start
+            for target in self.values:
+                del target[start:end]
+
+
+class _File:
+    """A spreadsheet file: its Drive metadata and its worksheets."""
+
+    def __init__(self, file_id, title, parents=None):
+        now = _now()
+        self.id = file_id
+        self.properties = {
+            "title": title,
+            "locale": "en_US",
+            "autoRecalc": "ON_CHANGE",
+            "timeZone": "Etc/GMT",
+        }
+        self.sheets = []
+        self.parents = list(parents or [])
+        self.created_time = now
+        self.modified_time = now
+        self.version = 1
+        self.comments = []
+        self.permissions = []
+
+    def drive_metadata(self):
+        return {
+            "kind": "drive#file",
+            "id": self.id,
+            "name": self.properties["title"],
+            "mimeType": MimeType.google_sheets,
+            "parents": self.parents,
+            "createdTime": self.created_time,
+            "modifiedTime": self.modified_time,
+            "version": str(self.version),
+        }
+
+    def metadata(self):
+        return {
+            "spreadsheetId": self.id,
+            "properties": copy.deepcopy(self.properties),
+            "sheets": [
+                {"properties": copy.deepcopy(sheet.properties)} for sheet in self.sheets
+            ],
+            "spreadsheetUrl": "https://docs.google.com/spreadsheets/d/{}".format(
+                self.id
+            ),
+        }
+
+    def sheet(self, title=None, sheet_id=None):
+        for sheet in self.sheets:
+            if title is not None and sheet.title == title:
+                return sheet
+            if sheet_id is not None and sheet.properties["sheetId"] == sheet_id:
+                return sheet
+        return None
+
+    def resolve(self, range_name):
+        """Returns the sheet and the grid range of ``range_name``."""
+        title, a1 = _split_range(range_name)
+
+        if title is None:
+            # a bare name is either a sheet title or a range of the first sheet
+            sheet = self.sheet(title=a1)
+            if sheet is not None:
+                return sheet, {}
+            sheet = self.sheets[0]
+        else:
+            sheet = self.sheet(title=title)
+
+        if sheet is None:
+            raise FakeAPIError(400, "Unable to parse range: {}".format(range_name))
+        if not a1:
+            return sheet, {}
+
+        try:
+            return sheet, a1_range_to_grid_range(a1)
+        except IncorrectCellLabel:
+            raise FakeAPIError(
+                400, "Unable to parse range: {}".format(range_name)
+            ) from None
+
+    def renumber(self):
+        for index, sheet in enumerate(self.sheets):
+            sheet.properties["index"] = index
+
+    def touch(self):
+        self.modified_time = _now()
+        self.version += 1
+
+
+class _Call:
+    """The arguments of a request handled by the fake API."""
+
+    def __init__(self, path, file_id, params, body):
+        self.path = path
+        self.file_id = file_id
+        self.params = params
+        self.body = body or {}
+
+    @property
+    def range(self):
+        segments = self.path.split("/")
+        segment = segments[segments.index("values") + 1]
+        return unquote(segment.partition(":")[0])
+
+
+class FakeGoogleAPI:
+    """An in-memory stand-in of the Google Sheets and Drive APIs.
+
+    It answers the values requests (get, batchGet, update, batchUpdate,
+    append, clear and batchClear), the spreadsheet batchUpdate requests
+    managing worksheets and their size, the Drive files requests (list,
+    create, get, copy, delete and export as CSV or TSV), and the comments
+    and permissions lists.
+
+    :param latency: (optional) Seconds to wait before answering each
+        request, or a callable returning them, called with the HTTP
+        method and the endpoint template
+        (see :func:`gspread.metrics.parse_endpoint`).
+    :param int read_quota: (optional) Number of read requests allowed per
+        ``quota_window``, further ones are answered with 429 errors.
+        Defaults to no limit.
+    :param int write_quota: (optional) Same as ``read_quota`` for the
+        write requests.
+    :param float quota_window: (optional) Length of the quota windows, in
+        seconds. Defaults to 60, the window of the Sheets API quotas.
+    :param float error_rate: (optional) Probability for each request to
+        be answered with an ``error_status`` error.
+    :param int error_status: (optional) Status of the random errors.
+        Defaults to 429.
+    :param int seed: (optional) Seed of the random errors, the same seed
+        fails the same requests.
+    :param clock: (optional) Function returning the current time in
+        seconds, used by the quotas. Defaults to :func:`time.monotonic`.
+    :param sleep: (optional) Function waiting for the latency. Defaults to
+        :func:`time.sleep`.
+
+    Every request is recorded in :attr:`requests` as its HTTP method and
+    endpoint template.
+
+    Example::
+
+        api = FakeGoogleAPI(latency=0.05, write_quota=60)
+        key = api.create_spreadsheet("Orders", values=[["id", "total"]])
+
+        gc = gspread.Client(None, session=api.session())
+        gc.open_by_key(key).sheet1.append_row([1, 9.5])
+
+        # or over HTTP
+        with api.serve() as server:
+            gc = gspread.Client(None, session=requests.Session(), base_url=server.url)
+    """
+
+    ROUTES = {
+        ("GET", "v4/spreadsheets/{id}"): "_get_spreadsheet",
+        ("POST", "v4/spreadsheets/{id}:batchUpdate"): "_batch_update",
+        ("GET", "v4/spreadsheets/{id}/values/{range}"): "_values_get",
+        ("PUT", "v4/spreadsheets/{id}/values/{range}"): "_values_update",
+        ("POST", "v4/spreadsheets/{id}/values/{range}:append"): "_values_append",
+        ("POST", "v4/spreadsheets/{id}/values/{range}:clear"): "_values_clear",
+        ("GET", "v4/spreadsheets/{id}/values:batchGet"): "_values_batch_get",
+        ("POST", "v4/spreadsheets/{id}/values:batchUpdate"): "_values_batch_update",
+        ("POST", "v4/spreadsheets/{id}/values:batchClear"): "_values_batch_clear",
+        ("GET", "drive/v3/files"): "_list_files",
+        ("POST", "drive/v3/files"): "_create_file",
+        ("GET", "drive/v3/files/{id}"): "_get_file",
+        ("DELETE", "drive/v3/files/{id}"): "_delete_file",
+        ("POST", "drive/v3/files/{id}/copy"): "_copy_file",
+        ("GET", "drive/v3/files/{id}/export"): "_export_file",
+        ("GET", "drive/v3/files/{id}/comments"): "_list_comments",
+        ("POST", "drive/v3/files/{id}/comments"): "_create_comment",
+        ("GET", "drive/v3/files/{id}/permissions"): "_list_permissions",
+        ("POST", "drive/v3/files/{id}/permissions"): "_create_permission",
+    }
+
+    def __init__(
+        self,
+        latency=0,
+        read_quota=None,
+        write_quota=None,
+        quota_window=60,
+        error_rate=0,
+        error_status=429,
+        seed=None,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.latency = latency
+        self.quotas = {"read": read_quota, "write": write_quota}
+        self.quota_window = quota_window
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.clock = clock
+        self.sleep = sleep
+
+        self.files = {}
+        self.requests = []
+
+        self._random = random.Random(seed)
+        self._faults = []
+        self._quota_usage = {"read": deque(), "write": deque()}
+        self._ids = 0
+        self._lock = threading.RLock()
+
+    def _new_id(self, prefix):
+        self._ids += 1
+        return "{}{:08d}".format(prefix, self._ids)
+
+    def create_spreadsheet(
+        self, title="Untitled spreadsheet", rows=1000, cols=26, values=None
+    ):
+        """Creates a spreadsheet with a single worksheet and returns its id.
+
+        :param str title: (optional) The title of the spreadsheet.
+        :param int rows: (optional) Number of rows of the worksheet.
+        :param int cols: (optional) Number of columns of the worksheet.
+        :param list values: (optional) Values of the worksheet, from A1.
+        :rtype: str
+        """
+        with self._lock:
+            spreadsheet = _File(self._new_id("fake"), title)
+            spreadsheet.sheets.append(self._new_sheet("Sheet1", 0, rows, cols, 0))
+            self.files[spreadsheet.id] = spreadsheet
+
+            if values:
+                spreadsheet.sheets[0].write(1, 1, values)
+
+            return spreadsheet.id
+
+    def _new_sheet(self, title, index, rows=1000, cols=26, sheet_id=None):
+        if sheet_id is None:
+            self._ids += 1
+            sheet_id = self._ids
+
+        return _Sheet(
+            {
+                "sheetId": sheet_id,
+                "title": title,
+                "index": index,
+                "sheetType": "GRID",
+                "gridProperties": {"rowCount": rows, "columnCount": cols},
+            }
+        )
+
+    def fail_next(self, status=429, count=1, endpoint=None):
+        """Answers the next ``count`` requests with ``status`` errors.
+
+        :param int status: (optional) The HTTP status of the errors.
+        :param int count: (optional) The number of requests to fail.
+        :param str endpoint: (optional) Only fail the requests to this
+            endpoint template, e.g. ``"v4/spreadsheets/{id}/values:batchGet"``.
+        """
+        with self._lock:
+            self._faults.append([status, count, endpoint])
+
+    def mount(self, target, urls=None):
+        """Mounts the in-process transport of the fake API on ``target``,
+        a :class:`requests.Session` or a :class:`~gspread.Client`.
+
+        The transport answers the requests to the hosts of ``urls``, or
+        of the :class:`~gspread.urls.APIUrls` of the client, so a client
+        with a custom ``base_url`` or ``urls`` is served too. Defaults to
+        the Google API hosts.
+
+        :returns: the session of ``target``.
+        """
+        session = getattr(target, "session", target)
+        if urls is None:
+            urls = getattr(target, "urls", None) or APIUrls()
+
+        adapter = FakeAdapter(self)
+        for host in urls.hosts:
+            session.mount(host, adapter)
+        return session
+
+    def session(self, urls=None):
+        """Returns a new :class:`requests.Session` sending the requests to
+        Google APIs, or to the hosts of ``urls``, to the fake API.
+        """
+        return self.mount(requests.Session(), urls)
+
+    def serve(self, host="127.0.0.1", port=0):
+        """Starts serving the fake API over HTTP, see :class:`FakeServer`."""
+        return FakeServer(self, host, port).start()
+
+    def handle(self, method, url, body=None):
+        """Answers a request.
+
+        :param str method: The HTTP method.
+        :param str url: The URL, or only its path and query.
+        :param body: (optional) The decoded JSON body.
+        :returns: the HTTP status, the headers and the body of the response.
+        :rtype: tuple
+        """
+        method = method.upper()
+        parts = urlsplit(url)
+        endpoint, file_id = parse_endpoint(url)
+
+        delay = (
+            self.latency(method, endpoint) if callable(self.latency) else self.latency
+        )
+        if delay:
+            self.sleep(delay)
+
+        try:
+            with self._lock:
+                self.requests.append((method, endpoint))
+                self._check_faults(method, endpoint)
+                handler = getattr(self, self._route(method, endpoint))
+                call = _Call(parts.path, file_id, parse_qs(parts.query), body)
+                result = handler(call)
+        except FakeAPIError as e:
+            return e.code, {"Content-Type": "application/json"}, _json(e.json())
+
+        if isinstance(result, _Raw):
+            return 200, {"Content-Type": result.content_type}, result.content
+
+        return 200, {"Content-Type": "application/json; charset=UTF-8"}, _json(result)
+
+    def _route(self, method, endpoint):
+        for (route_method, template), handler in self.ROUTES.items():
+            if method == route_method and endpoint.endswith(template):
+                return handler
+
+        raise FakeAPIError(
+            404, "{} {} is not implemented by the fake API".format(method, endpoint)
+        )
+
+    def _check_faults(self, method, endpoint):
+        for fault in self._faults:
+            status, count, fault_endpoint = fault
+            if fault_endpoint is None or endpoint.endswith(fault_endpoint):
+                fault[1] -= 1
+                if fault[1] <= 0:
+                    self._faults.remove(fault)
+                raise FakeAPIError(status, "Injected error")
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise FakeAPIError(self.error_status, "Injected error")
+
+        self._check_quota("read" if method == "GET" else "write")
+
+    def _check_quota(self, kind):
+        quota = self.quotas[kind]
+        if quota is None:
+            return
+
+        now = self.clock()
+        usage = self._quota_usage[kind]
+        while usage and usage[0] <= now - self.quota_window:
+            usage.popleft()
+
+        if len(usage) >= quota:
+            raise FakeAPIError(
+                429,
+                "Quota exceeded for quota metric '{} requests' and limit "
+                "'{} requests per minute per user'".format(kind.capitalize(), kind),
+            )
+
+        usage.append(now)
+
+    def _file(self, file_id):
+        try:
+            return self.files[file_id]
+        except KeyError:
+            raise FakeAPIError(
+                404, "Requested entity was not found: {}".format(file_id)
+            ) from None
+
+    # Sheets API
+
+    def _get_spreadsheet(self, call):
+        return self._file(call.file_id).metadata()
+
+    def _value_range(self, spreadsheet, range_name, params):
+        sheet, grid_range = spreadsheet.resolve(range_name)
+        bounds = sheet.bounds(grid_range)
+        values = sheet.read(*bounds)
+
+        render = _param(params, "valueRenderOption", ValueRenderOption.formatted)
+        if render == ValueRenderOption.formatted:
+            values = [[_formatted(value) for value in row] for row in values]
+
+        major_dimension = _param(params, "majorDimension", Dimension.rows)
+        if major_dimension == Dimension.cols:
+            values = _transpose(values)
+
+        value_range = {"range": sheet.label(*bounds), "majorDimension": major_dimension}
+        if values:
+            value_range["values"] = values
+        return value_range
+
+    def _values_get(self, call):
+        return self._value_range(self._file(call.file_id), call.range, call.params)
+
+    def _values_batch_get(self, call):
+        spreadsheet = self._file(call.file_id)
+        return {
+            "spreadsheetId": spreadsheet.id,
+            "valueRanges": [
+                self._value_range(spreadsheet, range_name, call.params)
+                for range_name in call.params.get("ranges", [])
+            ],
+        }
+
+    def _write(self, spreadsheet, value_range, value_input_option, include_values):
+        sheet, grid_range = spreadsheet.resolve(value_range["range"])
+        row, col, last_row, last_col = sheet.bounds(grid_range)
+
+        values = value_range.get("values", [])
+        if value_range.get("majorDimension") == Dimension.cols:
+            values = [list(column) for column in zip(*values)]
+        if value_input_option == ValueInputOption.user_entered:
+            values = [[_user_entered(value) for value in r] for r in values]
+
+        height = len(values)
+        width = max((len(r) for r in values), default=0)
+        # a single cell is the top left corner of the written values
+        bounded = ":" in value_range["range"].rpartition("!")[2]
+        if bounded and (row + height - 1 > last_row or col + width - 1 > last_col):
+            raise FakeAPIError(
+                400,
+                "Requested writing within range [{}], but tried writing "
+                "{} rows and {} columns".format(value_range["range"], height, width),
+            )
+
+        sheet.write(row, col, values)
+        spreadsheet.touch()
+
+        updated_range = sheet.label(row, col, row + height - 1, col + width - 1)
+        response = {
+            "spreadsheetId": spreadsheet.id,
+            "updatedRange": updated_range,
+            "updatedRows": height,
+            "updatedColumns": width,
+            "updatedCells": sum(len(r) for r in values),
+        }
+        if include_values:
+            response["updatedData"] = self._value_range(spreadsheet, updated_range, {})
+        return response
+
+    def _values_update(self, call):
+        value_range = dict(call.body, range=call.range)
+        return self._write(
+            self._file(call.file_id),
+            value_range,
+            _param(call.params, "valueInputOption"),
+            _flag(_param(call.params, "includeValuesInResponse")),
+        )
+
+    def _values_batch_update(self, call):
+        spreadsheet = self._file(call.file_id)
+        responses = [
+            self._write(
+                spreadsheet,
+                value_range,
+                call.body.get("valueInputOption"),
+                _flag(call.body.get("includeValuesInResponse")),
+            )
+            for value_range in call.body.get("data", [])
+        ]
+
+        return {
+            "spreadsheetId": spreadsheet.id,
+            "totalUpdatedRows": sum(r["updatedRows"] for r in responses),
+            "totalUpdatedColumns": sum(r["updatedColumns"] for r in responses),
+            "totalUpdatedCells": sum(r["updatedCells"] for r in responses),
+            "totalUpdatedSheets": len(
+                {r["updatedRange"].rpartition("!")[0] for r in responses}
+            ),
+            "responses": responses,
+        }
+
+    def _values_append(self, call):
+        spreadsheet = self._file(call.file_id)
+        sheet, grid_range = spreadsheet.resolve(call.range)
+        row, col, _, last_col = sheet.bounds(grid_range)
+
+        values = call.body.get("values", [])
+        if call.body.get("majorDimension") == Dimension.cols:
+            values = [list(column) for column in zip(*values)]
+
+        # the new rows go below the table starting at the first row of the range
+        table_end = sheet.table_end(row, col, last_col)
+        needed = table_end + len(values) - sheet.grid["rowCount"]
+        if _param(call.params, "insertDataOption") == "INSERT_ROWS":
+            sheet.insert(Dimension.rows, table_end, len(values))
+        elif needed > 0:
+            sheet.insert(Dimension.rows, sheet.grid["rowCount"], needed)
+
+        start = rowcol_to_a1(table_end + 1, col)
+        updates = self._write(
+            spreadsheet,
+            {"range": absolute_range_name(sheet.title, start), "values": values},
+            _param(call.params, "valueInputOption"),
+            _flag(_param(call.params, "includeValuesInResponse")),
+        )
+
+        response = {"spreadsheetId": spreadsheet.id, "updates": updates}
+        if table_end >= row:
+            response["tableRange"] = sheet.label(row, col, table_end, last_col)
+        return response
+
+    def _clear(self, spreadsheet, range_name):
+        sheet, grid_range = spreadsheet.resolve(range_name)
+        bounds = sheet.bounds(grid_range)
+        sheet.clear(*bounds)
+        spreadsheet.touch()
+        return sheet.label(*bounds)
+
+    def _values_clear(self, call):
+        spreadsheet = self._file(call.file_id)
+        return {
+            "spreadsheetId": spreadsheet.id,
+            "clearedRange": self._clear(spreadsheet, call.range),
+        }
+
+    def _values_batch_clear(self, call):
+        spreadsheet = self._file(call.file_id)
+        return {
+            "spreadsheetId": spreadsheet.id,
+            "clearedRanges": [
+                self._clear(spreadsheet, range_name)
+                for range_name in call.body.get("ranges", [])
+            ],
+        }
+
+    def _batch_update(self, call):
+        spreadsheet = self._file(call.file_id)
+        replies = []
+
+        for request in call.body.get("requests", []):
+            ((kind, params),) = request.items()
+            if kind in _NOOP_REQUESTS:
+                replies.append({})
+                continue
+
+            handler = getattr(self, "_request_" + kind, None)
+            if handler is None:
+                raise FakeAPIError(
+                    400, "{} is not implemented by the fake API".format(kind)
+                )
+            replies.append(handler(spreadsheet, params))
+
+        spreadsheet.touch()
+        return {"spreadsheetId": spreadsheet.id, "replies": replies}
+
+    def _sheet(self, spreadsheet, sheet_id):
+        sheet = spreadsheet.sheet(sheet_id=sheet_id)
+        if sheet is None:
+            raise FakeAPIError(400, "No grid with id: {}".format(sheet_id))
+        return sheet
+
+    def _request_addSheet(self, spreadsheet, params):
+        properties = params.get("properties", {})
+        title = properties.get("title", "Sheet{}".format(len(spreadsheet.sheets) + 1))
+
+        if spreadsheet.sheet(title=title) is not None:
+            raise FakeAPIError(
+                400, 'A sheet with the name "{}" already exists.'.format(title)
+            )
+
+        grid = properties.get("gridProperties", {})
+        sheet = self._new_sheet(
+            title,
+            properties.get("index", len(spreadsheet.sheets)),
+            grid.get("rowCount", 1000),
+            grid.get("columnCount", 26),
+            properties.get("sheetId"),
+        )
+        spreadsheet.sheets.insert(sheet.properties["index"], sheet)
+        spreadsheet.renumber()
+        return {"addSheet": {"properties": copy.deepcopy(sheet.properties)}}
+
+    def _request_deleteSheet(self, spreadsheet, params):
+        spreadsheet.sheets.remove(self._sheet(spreadsheet, params["sheetId"]))
+        spreadsheet.renumber()
+        return {}
+
+    def _request_duplicateSheet(self, spreadsheet, params):
+        source = self._sheet(spreadsheet, params["sourceSheetId"])
+        index = params.get("insertSheetIndex")
+        index = len(spreadsheet.sheets) if index is None else index
+
+        sheet = self._new_sheet(
+            params.get("newSheetName") or "Copy of " + source.title,
+            index,
+            source.grid["rowCount"],
+            source.grid["columnCount"],
+            params.get("newSheetId"),
+        )
+        sheet.values = copy.deepcopy(source.values)
+        spreadsheet.sheets.insert(index, sheet)
+        spreadsheet.renumber()
+        return {"duplicateSheet": {"properties": copy.deepcopy(sheet.properties)}}
+
+    def _request_updateSheetProperties(self, spreadsheet, params):
+        properties = params["properties"]
+        sheet = self._sheet(spreadsheet, properties.get("sheetId", 0))
+        rows, cols = sheet.grid["rowCount"], sheet.grid["columnCount"]
+        index = sheet.properties["index"]
+
+        _apply_fields(sheet.properties, properties, params["fields"])
+        grid = sheet.properties.setdefault("gridProperties", {})
+        sheet.resize(grid.get("rowCount", rows), grid.get("columnCount", cols))
+
+        if sheet.properties.get("index", index) != index:
+            spreadsheet.sheets.remove(sheet)
+            spreadsheet.sheets.insert(sheet.properties["index"], sheet)
+        spreadsheet.renumber()
+        return {}
+
+    def _request_updateSpreadsheetProperties(self, spreadsheet, params):
+        _apply_fields(spreadsheet.properties, params["properties"], params["fields"])
+        return {}
+
+    def _request_appendDimension(self, spreadsheet, params):
+        sheet = self._sheet(spreadsheet, params["sheetId"])
+        dimension = params["dimension"]
+        count = "rowCount" if dimension == Dimension.rows else "columnCount"
+        sheet.insert(dimension, sheet.grid[count], params["length"])
+        return {}
+
+    def _request_insertDimension(self, spreadsheet, params):
+        span = params["range"]
+        sheet = self._sheet(spreadsheet, span["sheetId"])
+        sheet.insert(
+            span["dimension"], span["startIndex"], span["endIndex"] - span["startIndex"]
+        )
+        return {}
+
+    def _request_deleteDimension(self, spreadsheet, params):
+        span = params["range"]
+        sheet = self._sheet(spreadsheet, span["sheetId"])
+        sheet.delete(span["dimension"], span["startIndex"], span["endIndex"])
+        return {}
+
+    # Drive API
+
+    def _list_files(self, call):
+        query = _param(call.params, "q", "")
+        name = re.search(r'name\s*=\s*"((?:[^"\\]|\\.)*)"', query)
+        parent = re.search(r'parents in "([^"]*)"|"([^"]*)" in parents', query)
+
+        name = name and name.group(1)
+        parent = parent and (parent.group(1) or parent.group(2))
+
+        files = [
+            f.drive_metadata()
+            for f in self.files.values()
+            if name in (None, f.properties["title"])
+            if parent is None or parent in f.parents
+        ]
+
+        offset = int(_param(call.params, "pageToken") or 0)
+        size = int(_param(call.params, "pageSize", 100))
+        response = {"kind": "drive#fileList", "files": files[offset : offset + size]}
+        if offset + size < len(files):
+            response["nextPageToken"] = str(offset + size)
+        return response
+
+    def _create_file(self, call):
+        if call.body.get("mimeType") != MimeType.google_sheets:
+            raise FakeAPIError(400, "The fake API only creates spreadsheets")
+
+        spreadsheet = _File(
+            self._new_id("fake"), call.body.get("name"), call.body.get("parents")
+        )
+        spreadsheet.sheets.append(self._new_sheet("Sheet1", 0, sheet_id=0))
+        self.files[spreadsheet.id] = spreadsheet
+        return spreadsheet.drive_metadata()
+
+    def _get_file(self, call):
+        return self._file(call.file_id).drive_metadata()
+
+    def _delete_file(self, call):
+        self._file(call.file_id)
+        del self.files[call.file_id]
+        return {}
+
+    def _copy_file(self, call):
+        source = self._file(call.file_id)
+        title = call.body.get("name") or "Copy of " + source.properties["title"]
+        parents = [
+            p["id"] if isinstance(p, dict) else p for p in call.body.get("parents", [])
+        ]
+
+        spreadsheet = _File(self._new_id("fake"), title, parents or source.parents)
+        spreadsheet.properties = dict(copy.deepcopy(source.properties), title=title)
+        spreadsheet.sheets = copy.deepcopy(source.sheets)
+        self.files[spreadsheet.id] = spreadsheet
+        return spreadsheet.drive_metadata()
+
+    def _export_file(self, call):
+        spreadsheet = self._file(call.file_id)
+        mime_type = _param(call.params, "mimeType")
+        delimiters = {MimeType.csv: ",", MimeType.tsv: "\t"}
+
+        if mime_type not in delimiters:
+            raise FakeAPIError(
+                400, "Export to {} is not implemented by the fake API".format(mime_type)
+            )
+
+        sheet = spreadsheet.sheets[0]
+        output = io.StringIO()
+        writer = csv.writer(
+            output, delimiter=delimiters[mime_type], lineterminator="\r\n"
+        )
+        for row in sheet.read(1, 1, sheet.grid["rowCount"], sheet.grid["columnCount"]):
+            writer.writerow([_formatted(value) for value in row])
+
+        return _Raw(output.getvalue().encode("utf-8"), mime_type)
+
+    def _list_comments(self, call):
+        return {"comments": copy.deepcopy(self._file(call.file_id).comments)}
+
+    def _create_comment(self, call):
+        comment = dict(call.body, id=self._new_id("comment"))
+        self._file(call.file_id).comments.append(comment)
+        return comment
+
+    def _list_permissions(self, call):
+        return {"permissions": copy.deepcopy(self._file(call.file_id).permissions)}
+
+    def _create_permission(self, call):
+        permission = dict(call.body, id=self._new_id("permission"))
+        self._file(call.file_id).permissions.append(permission)
+        return permission
+
+
+def _json(payload):
+    return json.dumps(payload).encode("utf-8")
+
+
+def _decode_body(body, headers):
+    if not body:
+        return None
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    try:
+        return json.loads(body.decode("utf-8"))
+    except ValueError:
+        raise FakeAPIError(400, "Invalid JSON payload received") from None
+
+
+class FakeAdapter(BaseAdapter):
+    """Transport adapter answering requests with a :class:`FakeGoogleAPI`,
+    in-process. Use :meth:`FakeGoogleAPI.mount` to install it.
+    """
+
+    def __init__(self, api):
+        super().__init__()
+        self.api = api
+
+    def send(self, request, **kwargs):
+        try:
+            body = _decode_body(request.body, request.headers)
+        except FakeAPIError as e:
+            status, headers, content = e.code, {}, _json(e.json())
+        else:
+            status, headers, content = self.api.handle(
+                request.method, request.url, body
+            )
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = _STATUSES.get(status, "OK")
+        response.headers = CaseInsensitiveDict(headers)
+        response.headers["Content-Length"] = str(len(content))
+        response.encoding = "utf-8"
+        response.raw = io.BytesIO(content)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class FakeServer:
+    """Serves a :class:`FakeGoogleAPI` over HTTP, from a background thread.
+
+    Point a :class:`~gspread.Client` at it with its ``base_url``. It is
+    started by :meth:`FakeGoogleAPI.serve`, and stopped by :meth:`stop`
+    or at the end of a ``with`` block.
+    """
+
+    def __init__(self, api, host="127.0.0.1", port=0):
+        self.api = api
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else None
+
+                try:
+                    payload = _decode_body(body, self.headers)
+                except FakeAPIError as e:
+                    status, headers, content = e.code, {}, _json(e.json())
+                else:
+                    status, headers, content = api.handle(
+                        self.command, self.path, payload
+                    )
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = _ThreadingHTTPServer((host, port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        """The base URL of the server."""
+        host, port = self._server.server_address[:2]
+        return "http://{}:{}/".format(host, port)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
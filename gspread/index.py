@@ -0,0 +1,157 @@
+"""
+gspread.index
+~~~~~~~~~~~~~
+
+This module contains the CellIndex class, used to look up cells
+by value without fetching the worksheet for every lookup.
+
+"""
+
+from collections import defaultdict
+
+from .cell import Cell
+from .utils import absolute_range_name, column_letter_to_index
+
+
+class CellIndex:
+    """Maps the values of a worksheet to the positions of the cells
+    holding them.
+
+    The values are fetched once, lookups are then served from memory with
+    no API call. The index is marked as stale whenever values are written
+    through the same :class:`~gspread.spreadsheet.Spreadsheet` instance, and
+    is rebuilt on the next lookup. Writes made by other clients are not
+    detected, call :meth:`refresh` to pick them up.
+
+    .. note::
+
+       This class should not be instantiated manually, it is returned by
+       :meth:`gspread.worksheet.Worksheet.build_index`.
+    """
+
+    def __init__(self, worksheet, columns=None, case_sensitive=True):
+        self.worksheet = worksheet
+        self.case_sensitive = case_sensitive
+
+        if columns is None:
+            self.columns = None
+        else:
+            if isinstance(columns, (int, str)):
+                columns = [columns]
+            self.columns = sorted(
+                {
+                    column_letter_to_index(c) if isinstance(c, str) else c
+                    for c in columns
+                }
+            )
+
+        self._positions = {}
+        self._stale = True
+
+        worksheet.spreadsheet._indexes.add(self)
+        self.refresh()
+
+    def __repr__(self):
+        return "<{} {} values:{}{}>".format(
+            self.__class__.__name__,
+            repr(self.worksheet.title),
+            len(self._positions),
+            " stale" if self._stale else "",
+        )
+
+    @property
+    def stale(self):
+        """True if values were written since the index was built."""
+        return self._stale
+
+    def invalidate(self):
+        """Marks the index as stale, it will be rebuilt on the next lookup."""
+        self._stale = True
+
+    def refresh(self):
+        """Fetches the values of the worksheet and rebuilds the index."""
+        data = self.worksheet.spreadsheet.values_get(
+            absolute_range_name(self.worksheet.title)
+        )
+
+        positions = defaultdict(list)
+
+        for i, row in enumerate(data.get("values", [])):
+            if self.columns is None:
+                cells = enumerate(row, 1)
+            else:
+                cells = ((col, row[col - 1]) for col in self.columns if col <= len(row))
+
+            for col, value in cells:
+                positions[self._key(value)].append((i + 1, col, value))
+
+        self._positions = dict(positions)
+        self._stale = False
+
+    def _key(self, value):
+        # numbers and booleans of unformatted values are matched as text
+        return value if self.case_sensitive else str(value).casefold()
+
+    def positions(self, value):
+        """Returns the ``(row, col)`` of the cells holding ``value``, in row
+        order. Both numbers are one-based.
+
+        :param str value: The value to look up.
+        :rtype: list
+        """
+        return [(row, col) for row, col, _ in self._entries(value)]
+
+    def _entries(self, value):
+        if self._stale:
+            self.refresh()
+
+        return self._positions.get(self._key(value), [])
+
+    def __contains__(self, value):
+        return bool(self._entries(value))
+
+    def __len__(self):
+        """Number of distinct values in the index."""
+        if self._stale:
+            self.refresh()
+
+        return len(self._positions)
+
+    def find(self, query, in_column=None):
+        """Finds the first cell holding ``query``.
+
+        :param str query: The value to look up.
+        :param int in_column: (optional) One-based column number to scope
+            the search.
+        :returns: the first matching cell or None otherwise
+        :raises ValueError: if ``in_column`` is not one of the indexed
+            columns.
+        :rtype: :class:`gspread.cell.Cell`
+        """
+        found = self.findall(query, in_column)
+        return found[0] if found else None
+
+    def findall(self, query, in_column=None):
+        """Finds all the cells holding ``query``.
+
+        :param str query: The value to look up.
+        :param int in_column: (optional) One-based column number to scope
+            the search.
+        :returns: the list of all matching cells or empty list otherwise
+        :rtype: list
+        :raises ValueError: if ``in_column`` is not one of the indexed
+            columns.
+        """
+        if in_column is not None and self.columns is not None:
+            if in_column not in self.columns:
+                raise ValueError(
+                    "column {} is not indexed, indexed columns are {}".format(
+                        in_column, self.columns
+                    )
+                )
+
+        return [
+            Cell(row, col, value)
+            for row, col, value in self._entries(query)
+            if in_column is None or col == in_column
+        ]
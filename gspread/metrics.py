@@ -0,0 +1,273 @@
+"""
+gspread.metrics
+~~~~~~~~~~~~~~~
+
+This module contains the events reported to the observers of a
+:class:`~gspread.Client`, and observers collecting them.
+
+"""
+
+import bisect
+import importlib
+import threading
+from collections import namedtuple
+from urllib.parse import unquote, urlsplit
+
+#: Describes a call to :meth:`gspread.Client.request`, retries included.
+#:
+#: * ``method``: the HTTP method, in upper case.
+#: * ``endpoint``: the path of the URL with the identifiers replaced by
+#:   placeholders, e.g. ``v4/spreadsheets/{id}/values:batchGet``.
+#: * ``spreadsheet_id``: the spreadsheet (or Drive file) id, or None.
+#: * ``status``: the HTTP status of the last response, None if the last
+#:   attempt failed to connect.
+#: * ``bytes_sent``: size of the request body.
+#: * ``bytes_received``: size of the last response body, as transferred.
+#: * ``latency``: seconds from the first attempt to the last response.
+#: * ``retries``: number of attempts after the first one.
+#: * ``start_time``: when the first attempt started, in seconds since
+#:   the epoch.
+#: * ``error``: the exception raised to the caller, or None.
+RequestEvent = namedtuple(
+    "RequestEvent",
+    [
+        "method",
+        "endpoint",
+        "spreadsheet_id",
+        "status",
+        "bytes_sent",
+        "bytes_received",
+        "latency",
+        "retries",
+        "start_time",
+        "error",
+    ],
+)
+
+# the path segment following these ones is an identifier
+_PLACEHOLDERS = {
+    "spreadsheets": "{id}",
+    "files": "{id}",
+    "values": "{range}",
+    "sheets": "{sheet_id}",
+    "permissions": "{permission_id}",
+    "comments": "{comment_id}",
+}
+
+
+def parse_endpoint(url):
+    """Returns the endpoint template and the spreadsheet id of ``url``.
+
+    >>> parse_endpoint("https://sheets.googleapis.com/v4/spreadsheets/abc/values/Sheet1!A1:append")
+    ('v4/spreadsheets/{id}/values/{range}:append', 'abc')
+    """
+    segments = []
+    spreadsheet_id = None
+    previous = None
+
+    for segment in urlsplit(url).path.strip("/").split("/"):
+        name, colon, action = segment.partition(":")
+
+        if previous in _PLACEHOLDERS and name:
+            if _PLACEHOLDERS[previous] == "{id}" and spreadsheet_id is None:
+                spreadsheet_id = unquote(name)
+            segments.append(_PLACEHOLDERS[previous] + colon + action)
+            previous = None
+        else:
+            segments.append(segment)
+            previous = name
+
+    return "/".join(segments), spreadsheet_id
+
+
+def _body_size(body):
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    try:
+        return len(body)
+    except TypeError:
+        # streamed bodies have no known size
+        return 0
+
+
+def request_event(method, url, response, start_time, latency, retries, error=None):
+    """Builds the :data:`RequestEvent` of a request."""
+    endpoint, spreadsheet_id = parse_endpoint(url)
+
+    status = bytes_sent = bytes_received = None
+
+    if response is not None:
+        status = response.status_code
+        if response.request is not None:
+            bytes_sent = _body_size(response.request.body)
+
+        # the transferred size if known, otherwise the size of the body
+        # if it was read already: streamed bodies are left untouched
+        length = response.headers.get("Content-Length")
+        content = getattr(response, "_content", False)
+        if length is not None:
+            bytes_received = int(length)
+        elif content:
+            bytes_received = len(content)
+
+    return RequestEvent(
+        method=method.upper(),
+        endpoint=endpoint,
+        spreadsheet_id=spreadsheet_id,
+        status=status,
+        bytes_sent=bytes_sent or 0,
+        bytes_received=bytes_received or 0,
+        latency=latency,
+        retries=retries,
+        start_time=start_time,
+        error=error,
+    )
+
+
+class LatencyHistogram:
+    """Collects the requests of one or more clients in latency histograms,
+    one per HTTP method and endpoint.
+
+    :param list buckets: (optional) Upper bounds of the histogram buckets,
+        in seconds.
+
+    Example::
+
+        histogram = gspread.LatencyHistogram()
+        gc = gspread.service_account()
+        gc.observers.append(histogram)
+
+        ...
+
+        for (method, endpoint), stats in histogram.summary().items():
+            print(method, endpoint, stats["count"], stats["p95"])
+    """
+
+    #: Default upper bounds of the buckets, in seconds.
+    BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def __call__(self, event):
+        key = (event.method, event.endpoint)
+
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {
+                    "count": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "bytes_sent": 0,
+                    "bytes_received": 0,
+                    "total_latency": 0.0,
+                    "max_latency": 0.0,
+                    "buckets": [0] * (len(self.buckets) + 1),
+                }
+
+            series["count"] += 1
+            series["errors"] += event.error is not None
+            series["retries"] += event.retries
+            series["bytes_sent"] += event.bytes_sent
+            series["bytes_received"] += event.bytes_received
+            series["total_latency"] += event.latency
+            series["max_latency"] = max(series["max_latency"], event.latency)
+            series["buckets"][bisect.bisect_left(self.buckets, event.latency)] += 1
+
+    def reset(self):
+        """Drops all the collected requests."""
+        with self._lock:
+            self._series = {}
+
+    def _quantile(self, counts, q):
+        """Returns the upper bound of the bucket holding the ``q`` quantile,
+        None if it is in the last, unbounded, bucket.
+        """
+        rank = q * sum(counts)
+        seen = 0
+        for bound, count in zip(self.buckets, counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return None
+
+    def summary(self):
+        """Returns the statistics of each ``(method, endpoint)``: number of
+        requests, errors and retries, bytes sent and received, mean and
+        maximum latency, and the ``p50``, ``p95`` and ``p99`` latencies
+        (upper bound of their bucket, None beyond the last bucket), and
+        the count of each bucket.
+
+        :rtype: dict
+        """
+        with self._lock:
+            series = {
+                key: dict(value, buckets=list(value["buckets"]))
+                for key, value in self._series.items()
+            }
+
+        for stats in series.values():
+            counts = stats["buckets"]
+            stats["mean_latency"] = stats["total_latency"] / stats["count"]
+            stats["p50"] = self._quantile(counts, 0.5)
+            stats["p95"] = self._quantile(counts, 0.95)
+            stats["p99"] = self._quantile(counts, 0.99)
+            stats["buckets"] = dict(zip(self.buckets + (float("inf"),), counts))
+
+        return series
+
+
+class OpenTelemetryObserver:
+    """Emits an `OpenTelemetry <https://opentelemetry.io/>`_ span for each
+    request. Requires the ``opentelemetry-api`` package.
+
+    :param tracer: (optional) The tracer creating the spans. Defaults to
+        the ``gspread`` tracer of the global tracer provider.
+
+    Example::
+
+        gc.observers.append(gspread.OpenTelemetryObserver())
+    """
+
+    def __init__(self, tracer=None):
+        try:
+            self._trace = importlib.import_module("opentelemetry.trace")
+        except ImportError as e:
+            raise ImportError(
+                "opentelemetry-api is required to emit spans, "
+                "install it with 'pip install opentelemetry-api'"
+            ) from e
+
+        self.tracer = tracer or self._trace.get_tracer("gspread")
+
+    def __call__(self, event):
+        start = int(event.start_time * 1e9)
+        attributes = {
+            "http.request.method": event.method,
+            "gspread.endpoint": event.endpoint,
+            "gspread.retries": event.retries,
+            "http.request.body.size": event.bytes_sent,
+            "http.response.body.size": event.bytes_received,
+        }
+        if event.spreadsheet_id is not None:
+            attributes["gspread.spreadsheet_id"] = event.spreadsheet_id
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+
+        span = self.tracer.start_span(
+            "{} {}".format(event.method, event.endpoint),
+            kind=self._trace.SpanKind.CLIENT,
+            start_time=start,
+            attributes=attributes,
+        )
+
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+
+        span.end(end_time=start + int(event.latency * 1e9))
@@ -0,0 +1,194 @@
+"""
+gspread.mirror
+~~~~~~~~~~~~~~
+
+This module contains the WorksheetMirror class, a local copy of the values
+of a worksheet that only writes back what changed.
+
+"""
+
+from .utils import ValueInputOption, a1_to_rowcol, cells_to_rects, rowcol_to_a1
+
+
+class WorksheetMirror:
+    """An in-memory copy of the values of a worksheet.
+
+    The values are read once, changed locally, and :meth:`flush` sends
+    only the changed cells, grouped into rectangles, in a single
+    `values:batchUpdate`_ call. The volume written depends on the number
+    of changed cells, not on the size of the area they are spread over.
+
+    Rows and columns are numbered from 1, like in
+    :meth:`~gspread.worksheet.Worksheet.cell`.
+
+    :param worksheet: The :class:`~gspread.worksheet.Worksheet` to mirror.
+    :param str value_render_option: (optional) How values are read, see
+        :meth:`~gspread.worksheet.Worksheet.get_values`.
+    :param str value_input_option: (optional) How changed values are
+        written, see :meth:`~gspread.worksheet.Worksheet.update_cells`.
+
+    Example::
+
+        mirror = gspread.WorksheetMirror(worksheet)
+
+        for row in range(2, mirror.row_count + 1):
+            if mirror.value(row, 3) == "pending":
+                mirror.update_cell(row, 3, "done")
+
+        mirror.flush()
+
+    .. _values:batchUpdate: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets.values/batchUpdate
+    """
+
+    def __init__(
+        self,
+        worksheet,
+        value_render_option=None,
+        value_input_option=ValueInputOption.raw,
+    ):
+        self.worksheet = worksheet
+        self.value_render_option = value_render_option
+        self.value_input_option = value_input_option
+
+        # rows can be shorter than col_count, missing cells are empty
+        self._values = []
+        self._col_count = 0
+        self._dirty = set()
+
+        self.refresh()
+
+    def __repr__(self):
+        return "<{} {} dirty:{}>".format(
+            self.__class__.__name__,
+            repr(self.worksheet.title),
+            len(self._dirty),
+        )
+
+    @property
+    def row_count(self):
+        """Number of rows holding values."""
+        return len(self._values)
+
+    @property
+    def col_count(self):
+        """Number of columns holding values."""
+        return self._col_count
+
+    @property
+    def dirty_cells(self):
+        """The ``(row, col)`` of the cells changed since the last flush,
+        in row order.
+
+        :rtype: list
+        """
+        return sorted(self._dirty)
+
+    def refresh(self):
+        """Reads the values of the worksheet again, discarding the changes
+        that were not flushed.
+        """
+        self._values = self.worksheet.get_values(
+            value_render_option=self.value_render_option
+        )
+        self._col_count = max((len(row) for row in self._values), default=0)
+        self._dirty = set()
+
+    def value(self, row, col):
+        """Returns the value of a cell, an empty string outside the values.
+
+        :param int row: Row number.
+        :param int col: Column number.
+        :raises ValueError: if ``row`` or ``col`` is less than 1.
+        """
+        if row < 1 or col < 1:
+            raise ValueError("row and col must be 1 or greater")
+
+        try:
+            return self._values[row - 1][col - 1]
+        except IndexError:
+            return ""
+
+    def acell_value(self, label):
+        """Returns the value of a cell given in A1 notation.
+
+        :param str label: Cell label in A1 notation, e.g. 'B1'.
+        """
+        return self.value(*a1_to_rowcol(label))
+
+    def get_all_values(self):
+        """Returns a copy of all the values, as a list of lists."""
+        cols = self._col_count
+        return [row + [""] * (cols - len(row)) for row in self._values]
+
+    def update_cell(self, row, col, value):
+        """Changes the value of a cell. The cell is only marked as changed
+        if ``value`` differs from its current value.
+
+        :param int row: Row number.
+        :param int col: Column number.
+        :param value: New value.
+        """
+        # raises for cells before the first row or column
+        if self.value(row, col) == value:
+            return
+
+        # only grow what the write needs, not the whole grid
+        if row > len(self._values):
+            self._values.extend([] for _ in range(row - len(self._values)))
+
+        cells = self._values[row - 1]
+        if col > len(cells):
+            cells.extend([""] * (col - len(cells)))
+            self._col_count = max(self._col_count, col)
+
+        cells[col - 1] = value
+        self._dirty.add((row, col))
+
+    def update_acell(self, label, value):
+        """Changes the value of a cell given in A1 notation.
+
+        :param str label: Cell label in A1 notation, e.g. 'B1'.
+        :param value: New value.
+        """
+        self.update_cell(*a1_to_rowcol(label), value)
+
+    def flush(self):
+        """Writes the changed cells to the worksheet in a single request.
+
+        The worksheet is resized first if a changed cell is outside of it.
+
+        :returns: the response of
+            :meth:`~gspread.worksheet.Worksheet.batch_update`, None if no cell
+            changed.
+        """
+        if not self._dirty:
+            return None
+
+        rects = cells_to_rects(self._dirty)
+
+        last_row = max(rect[2] for rect in rects)
+        last_col = max(rect[3] for rect in rects)
+        rows = last_row if last_row > self.worksheet.row_count else None
+        cols = last_col if last_col > self.worksheet.col_count else None
+        if rows is not None or cols is not None:
+            self.worksheet.resize(rows=rows, cols=cols)
+
+        data = [
+            {
+                "range": "{}:{}".format(
+                    rowcol_to_a1(first_row, first_col), rowcol_to_a1(last_row, last_col)
+                ),
+                "values": [
+                    self._values[row - 1][first_col - 1 : last_col]
+                    for row in range(first_row, last_row + 1)
+                ],
+            }
+            for first_row, first_col, last_row, last_col in rects
+        ]
+
+        response = self.worksheet.batch_update(
+            data, value_input_option=self.value_input_option
+        )
+        self._dirty = set()
+
+        return response
@@ -0,0 +1,151 @@
+"""
+gspread.ratelimit
+~~~~~~~~~~~~~~~~~
+
+This module contains the client-side rate limiter used to pace
+the requests sent to Google API.
+
+"""
+
+import threading
+import time
+
+READ_METHODS = ("get", "head", "options")
+
+
+class TokenBucket:
+    """A thread-safe token bucket.
+
+    Tokens are added at ``rate`` per second, up to ``capacity``.
+    Every call to :meth:`acquire` takes one token, waiting for it
+    when the bucket is empty.
+
+    :param float rate: Number of tokens added per second.
+    :param int capacity: (optional) Maximum number of tokens, i.e. the
+        size of a burst. Defaults to one second worth of tokens.
+    """
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        self.rate = rate
+        self.capacity = max(capacity or rate, 1)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._last = clock()
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+
+    def acquire(self):
+        """Takes one token, waits until it is available if needed.
+
+        A waiting caller reserves its token before sleeping, so concurrent
+        callers are served in order instead of racing for the same token.
+
+        :returns: the number of seconds spent waiting.
+        :rtype: float
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            self._tokens -= 1
+
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            self.requests += 1
+            if wait:
+                self.waits += 1
+                self.wait_time += wait
+                self.max_wait = max(self.max_wait, wait)
+
+        if wait:
+            self._sleep(wait)
+
+        return wait
+
+    def stats(self):
+        """Returns the counters of this bucket.
+
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "waits": self.waits,
+                "wait_time": self.wait_time,
+                "max_wait": self.max_wait,
+            }
+
+
+class RateLimiter:
+    """Paces the requests sent by one or more clients so they stay under
+    the Sheets API per-minute quotas.
+
+    Read and write requests are counted in two separate buckets, as the
+    API quotas them separately. ``GET`` requests are reads, everything
+    else is a write.
+
+    A rate limiter is thread-safe, the same instance can be shared by
+    several :class:`~gspread.Client` instances to enforce a common quota.
+
+    :param int reads_per_minute: (optional) Maximum number of read
+        requests per minute. Defaults to 60, the default per-user quota.
+    :param int writes_per_minute: (optional) Maximum number of write
+        requests per minute. Defaults to 60, the default per-user quota.
+    :param int burst: (optional) Number of requests that can be sent at
+        once after a quiet period. Defaults to one second worth of requests.
+
+    Example::
+
+        limiter = gspread.RateLimiter(reads_per_minute=300, writes_per_minute=300)
+
+        gc1 = gspread.service_account(filename="creds1.json")
+        gc1.rate_limiter = limiter
+        gc2 = gspread.Client(credentials, rate_limiter=limiter)
+
+        # total time spent waiting for a read slot
+        limiter.stats()["read"]["wait_time"]
+    """
+
+    def __init__(
+        self,
+        reads_per_minute=60,
+        writes_per_minute=60,
+        burst=None,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.read_bucket = TokenBucket(reads_per_minute / 60, burst, clock, sleep)
+        self.write_bucket = TokenBucket(writes_per_minute / 60, burst, clock, sleep)
+
+    def acquire(self, method):
+        """Waits until a request with the given HTTP ``method`` can be sent.
+
+        :returns: the number of seconds spent waiting.
+        :rtype: float
+        """
+        if method.lower() in READ_METHODS:
+            return self.read_bucket.acquire()
+
+        return self.write_bucket.acquire()
+
+    def stats(self):
+        """Returns the counters of the read and write buckets: number of
+        requests, number of requests that had to wait, total and maximum
+        time waited in seconds.
+
+        :rtype: dict
+        """
+        return {
+            "read": self.read_bucket.stats(),
+            "write": self.write_bucket.stats(),
+        }
@@ -0,0 +1,177 @@
+"""
+gspread.records
+~~~~~~~~~~~~~~~
+
+This module contains the schema driven decoding of records, used by
+:meth:`gspread.worksheet.Worksheet.get_records`.
+
+"""
+
+import datetime
+import math
+import typing
+from collections import namedtuple
+from decimal import Decimal
+
+from .exceptions import GSpreadException
+
+# day 0 of the serial numbers used by Google Sheets for dates and times
+SERIAL_NUMBER_EPOCH = datetime.datetime(1899, 12, 30)
+
+
+def _to_int(value):
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError("{!r} is not an integer".format(value))
+    return int(value)
+
+
+def _to_decimal(value):
+    # str() gives the shortest repr of a float, e.g. Decimal("0.1")
+    return Decimal(str(value))
+
+
+def _to_bool(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.upper() in ("TRUE", "FALSE"):
+        return value.upper() == "TRUE"
+    raise ValueError("{!r} is not a boolean".format(value))
+
+
+def _to_datetime(value):
+    # round to the millisecond, the precision of Google Sheets
+    delta = datetime.timedelta(milliseconds=round(float(value) * 86400000))
+    return SERIAL_NUMBER_EPOCH + delta
+
+
+def _to_date(value):
+    # floor, not int: -0.5 is noon of the day before the epoch
+    return (SERIAL_NUMBER_EPOCH + datetime.timedelta(days=math.floor(value))).date()
+
+
+def _to_time(value):
+    return _to_datetime(float(value) % 1).time()
+
+
+def _to_str(value):
+    return value if isinstance(value, str) else str(value)
+
+
+#: Converters of the supported column types. Any other callable can be
+#: used as a column type, it is called with the raw cell value.
+CONVERTERS = {
+    int: _to_int,
+    float: float,
+    Decimal: _to_decimal,
+    bool: _to_bool,
+    datetime.datetime: _to_datetime,
+    datetime.date: _to_date,
+    datetime.time: _to_time,
+    str: _to_str,
+}
+
+
+def _unwrap_optional(column_type):
+    """Returns ``X`` for ``Optional[X]``, the type unchanged otherwise."""
+    if getattr(column_type, "__origin__", None) is typing.Union:
+        args = [a for a in column_type.__args__ if a is not type(None)]  # noqa: E721
+        if len(args) == 1:
+            return args[0]
+    return column_type
+
+
+def _schema_fields(schema):
+    """Returns the record factory and the ``(field, column, type)`` of each
+    field declared by ``schema``.
+    """
+    if isinstance(schema, dict):
+        # columns that are not valid field names are renamed _<position>
+        factory = namedtuple("Record", list(schema), rename=True)
+        factory._columns = dict(zip(schema, factory._fields))
+        fields = [
+            (field, column, column_type)
+            for field, (column, column_type) in zip(factory._fields, schema.items())
+        ]
+        return factory, fields
+
+    import dataclasses
+
+    if not (isinstance(schema, type) and dataclasses.is_dataclass(schema)):
+        raise TypeError("schema must be a dict or a dataclass")
+
+    hints = typing.get_type_hints(schema)
+    fields = [
+        (f.name, f.metadata.get("column", f.name), hints.get(f.name, f.type))
+        for f in dataclasses.fields(schema)
+        if f.init
+    ]
+    return schema, fields
+
+
+class RecordDecoder:
+    """Decodes rows of unformatted values into typed records.
+
+    The converter of each column is looked up once, when the decoder
+    is built, then applied to every row.
+
+    :param schema: Either a dict mapping the column names to their type,
+        records are then named tuples in the same order, or a dataclass
+        whose fields are the columns, records are then instances of it.
+        Columns of a dict that are not valid field names are renamed
+        ``_<position>``, the ``_columns`` dict of the named tuple type
+        maps each column to its field.
+        A dataclass field can read a column with another name by setting
+        ``metadata={"column": "Column name"}``.
+    :param list keys: The header row.
+
+    Blank cells are decoded as ``None``, or ``""`` for ``str`` columns.
+    """
+
+    def __init__(self, schema, keys):
+        self.factory, fields = _schema_fields(schema)
+
+        self.columns = []
+
+        for name, column, column_type in fields:
+            try:
+                index = keys.index(column)
+            except ValueError:
+                raise GSpreadException(
+                    "column {!r} of the schema is not in the header row".format(column)
+                ) from None
+
+            column_type = _unwrap_optional(column_type)
+            converter = CONVERTERS.get(column_type, column_type)
+            if not callable(converter):
+                raise TypeError(
+                    "unsupported type {!r} for column {!r}".format(column_type, column)
+                )
+
+            blank = "" if column_type is str else None
+            self.columns.append((index, column, converter, blank))
+
+    def decode(self, row, row_number=None):
+        """Decodes a single row.
+
+        :param list row: The unformatted values of the row.
+        :param int row_number: (optional) The row number, used in errors.
+        """
+        values = []
+
+        for index, column, converter, blank in self.columns:
+            value = row[index] if index < len(row) else ""
+
+            if value == "" or value is None:
+                values.append(blank)
+                continue
+
+            try:
+                values.append(converter(value))
+            except (TypeError, ValueError, ArithmeticError) as e:
+                raise GSpreadException(
+                    "can not decode {!r} in column {!r} of row {}: {}".format(
+                        value, column, row_number, e
+                    )
+                ) from e
+
+        return self.factory(*values)
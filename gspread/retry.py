@@ -0,0 +1,193 @@
+"""
+gspread.retry
+~~~~~~~~~~~~~
+
+This module contains the retry policy used by the clients to retry
+failed requests.
+
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request should be sent again.
+
+    A policy only holds configuration, the number of attempts and the time
+    spent are tracked by each request. A single policy can then be shared
+    by many clients and threads.
+
+    The delay between two attempts grows exponentially with a random
+    jitter, and never exceeds ``max_backoff``. When the API answers with
+    a ``Retry-After`` header, the delay is at least that long.
+
+    :param int max_attempts: (optional) Maximum number of attempts,
+        including the first one.
+    :param float initial_backoff: (optional) Delay before the first retry,
+        in seconds.
+    :param float max_backoff: (optional) Maximum delay between two attempts,
+        in seconds.
+    :param float max_elapsed: (optional) Give up if the next attempt would
+        start more than ``max_elapsed`` seconds after the first one.
+    :param bool jitter: (optional) Add a random amount of up to one second
+        to each delay, so that concurrent clients do not retry in lockstep.
+    :param bool retry_unsafe_methods: (optional) Whether or not to retry
+        the requests that are not idempotent, like ``POST``, after a
+        connection error or a timeout. The API may have applied such a
+        request before the connection failed, retrying it can then
+        append the same rows twice or create a second file. Defaults to
+        ``False``. Error responses are retried regardless of the method.
+
+    >>> client = gspread.Client(auth, retry_policy=RetryPolicy(max_attempts=3))
+    """
+
+    #: HTTP status codes that are always retried.
+    RETRY_STATUS_CODES = (
+        HTTPStatus.REQUEST_TIMEOUT,
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    )
+
+    #: Values of ``error.status`` in the response body that are retried.
+    RETRY_ERROR_STATUSES = (
+        "ABORTED",
+        "DEADLINE_EXCEEDED",
+        "INTERNAL",
+        "RESOURCE_EXHAUSTED",
+        "UNAVAILABLE",
+    )
+
+    #: Values of ``error.errors[].reason`` in the response body that are
+    #: retried. The Drive API reports rate limits as 403 (Forbidden) with
+    #: one of these reasons.
+    RETRY_ERROR_REASONS = (
+        "backendError",
+        "internalError",
+        "rateLimitExceeded",
+        "userRateLimitExceeded",
+    )
+
+    #: HTTP methods sent again after a connection error or a timeout,
+    #: sending them twice has the same effect as sending them once.
+    IDEMPOTENT_METHODS = ("get", "head", "options", "put", "delete")
+
+    def __init__(
+        self,
+        max_attempts=8,
+        initial_backoff=1,
+        max_backoff=64,
+        max_elapsed=300,
+        jitter=True,
+        retry_unsafe_methods=False,
+    ):
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.max_elapsed = max_elapsed
+        self.jitter = jitter
+        self.retry_unsafe_methods = retry_unsafe_methods
+
+    def is_retryable(self, response):
+        """Returns True if the failed ``response`` is worth retrying.
+
+        The error is classified using the ``status`` and ``reason`` found
+        in the JSON error body, so that a 403 caused by a missing permission
+        is not retried while a 403 caused by a rate limit is.
+        """
+        if response.status_code in self.RETRY_STATUS_CODES:
+            return True
+
+        try:
+            error = response.json()["error"]
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return False
+
+        if not isinstance(error, dict):
+            return False
+
+        if error.get("status") in self.RETRY_ERROR_STATUSES:
+            return True
+
+        reasons = [e.get("reason") for e in error.get("errors", [])]
+        return any(reason in self.RETRY_ERROR_REASONS for reason in reasons)
+
+    def is_safe_to_resend(self, method):
+        """Returns True if a request sent with ``method`` can be sent again
+        after a connection error or a timeout, see ``retry_unsafe_methods``.
+        """
+        if method is None or self.retry_unsafe_methods:
+            return True
+        return method.lower() in self.IDEMPOTENT_METHODS
+
+    def backoff(self, attempt):
+        """Returns the delay in seconds before the retry following
+        the given (zero-based) ``attempt``.
+        """
+        delay = min(self.initial_backoff * 2**attempt, self.max_backoff)
+
+        if self.jitter:
+            delay = min(delay + random.uniform(0, 1), self.max_backoff)
+
+        return delay
+
+    def retry_after(self, response):
+        """Returns the delay requested by the ``Retry-After`` header of
+        ``response`` in seconds, or None.
+        """
+        value = response.headers.get("Retry-After")
+
+        if value is None:
+            return None
+
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        return max(date.timestamp() - time.time(), 0)
+
+    def get_delay(self, attempt, elapsed, response=None, method=None):
+        """Returns how long to wait before sending the request again,
+        or None if it should not be retried.
+
+        :param int attempt: Zero-based number of the attempt that failed.
+        :param float elapsed: Seconds elapsed since the first attempt.
+        :param response: (optional) The failed response, None if the
+            request failed with a connection error or a timeout.
+        :param str method: (optional) The HTTP method of the request.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+
+        if response is None and not self.is_safe_to_resend(method):
+            return None
+
+        delay = self.backoff(attempt)
+
+        if response is not None:
+            if not self.is_retryable(response):
+                return None
+
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+
+        if elapsed + delay > self.max_elapsed:
+            return None
+
+        return delay
+
+    def sleep(self, delay):
+        """Waits ``delay`` seconds before the next attempt."""
+        time.sleep(delay)
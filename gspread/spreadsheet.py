@@ -6,48 +6,175 @@ This module contains common spreadsheets' models.
 
 """
 
-from .exceptions import WorksheetNotFound
-from .urls import (
-    DRIVE_FILES_API_V3_URL,
-    SPREADSHEET_BATCH_UPDATE_URL,
-    SPREADSHEET_DRIVE_URL,
-    SPREADSHEET_SHEETS_COPY_TO_URL,
-    SPREADSHEET_URL,
-    SPREADSHEET_VALUES_APPEND_URL,
-    SPREADSHEET_VALUES_BATCH_CLEAR_URL,
-    SPREADSHEET_VALUES_BATCH_UPDATE_URL,
-    SPREADSHEET_VALUES_BATCH_URL,
-    SPREADSHEET_VALUES_CLEAR_URL,
-    SPREADSHEET_VALUES_URL,
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlencode
+
+from .exceptions import IncorrectCellLabel, WorksheetNotFound
+from .utils import (
+    EXPORT_CHUNK_SIZE,
+    MAX_BATCH_GET_CELLS,
+    MAX_BATCH_PAYLOAD_SIZE,
+    MAX_URL_LENGTH,
+    ExportFormat,
+    a1_range_to_grid_range,
+    batched_by_size,
+    finditem,
+    quote,
 )
-from .utils import ExportFormat, finditem, quote
 from .worksheet import Worksheet
 
 
-class Spreadsheet:
-    """The class that represents a spreadsheet."""
+def _unquote_sheet_name(name):
+    if len(name) > 1 and name.startswith("'") and name.endswith("'"):
+        return name[1:-1].replace("''", "'")
+    return name
+
+
+def _estimate_cell_count(range_name, grid_sizes):
+    """Estimates the number of cells in ``range_name``.
+
+    Unbounded sides of the range extend to the size of the sheet found in
+    ``grid_sizes``, a dict mapping sheet titles to ``(rows, cols)``.
+    Named ranges and unknown sheets count as zero cells.
+    """
+    sheet_name, _, a1 = range_name.rpartition("!")
+
+    if not sheet_name:
+        whole_sheet = _unquote_sheet_name(a1)
+        if whole_sheet in grid_sizes:
+            rows, cols = grid_sizes[whole_sheet]
+            return rows * cols
+
+        # a range without sheet name refers to the first sheet
+        rows, cols = next(iter(grid_sizes.values()), (0, 0))
+    else:
+        rows, cols = grid_sizes.get(_unquote_sheet_name(sheet_name), (0, 0))
+
+    try:
+        grid_range = a1_range_to_grid_range(a1)
+    except IncorrectCellLabel:
+        return 0
+
+    height = grid_range.get("endRowIndex", rows) - grid_range.get("startRowIndex", 0)
+    width = grid_range.get("endColumnIndex", cols) - grid_range.get(
+        "startColumnIndex", 0
+    )
+
+    return max(height, 0) * max(width, 0)
+
+
+class _PendingWrites:
+    """Writes queued by :meth:`Spreadsheet.batch`, in call order."""
+
+    #: key of the segments holding structural and format requests
+    REQUESTS = object()
+
+    def __init__(self, max_payload_size):
+        self.max_payload_size = max_payload_size
+        # consecutive writes sent by a single call, in call order:
+        # [[REQUESTS, [request, ...]], [value_input_option, [value_range, ...]], ...]
+        self.segments = []
+
+    def __bool__(self):
+        return bool(self.segments)
+
+    def _add(self, key, items):
+        if self.segments and self.segments[-1][0] == key:
+            self.segments[-1][1].extend(items)
+        else:
+            self.segments.append([key, list(items)])
 
-    def __init__(self, client, properties):
+    def add_requests(self, requests):
+        self._add(self.REQUESTS, requests)
+
+    def add_values(self, value_input_option, value_ranges):
+        self._add(value_input_option, value_ranges)
+
+    def send(self, spreadsheet):
+        """Sends the queued writes in call order, and empties the queue."""
+        segments, self.segments = self.segments, []
+
+        for key, items in segments:
+            for chunk in batched_by_size(items, self.max_payload_size):
+                if key is self.REQUESTS:
+                    spreadsheet._send_batch_update({"requests": chunk})
+                else:
+                    spreadsheet._send_values_batch_update(
+                        None, {"valueInputOption": key, "data": chunk}
+                    )
+
+
+def _with_fields(params, fields):
+    """Returns a copy of ``params`` with the ``fields`` mask, if any."""
+    if fields is None:
+        return params
+    return dict(params or {}, fields=fields)
+
+
+class Spreadsheet:
+    """The class that represents a spreadsheet.
+
+    The spreadsheet metadata (its properties and the properties of its
+    worksheets) is cached on the client by spreadsheet id for
+    :attr:`metadata_ttl` seconds, so worksheet lookups do not hit the API
+    each time, even across objects opened on the same spreadsheet. The
+    cache is dropped whenever the spreadsheet is modified through any of
+    them.
+
+    :param client: The :class:`~gspread.Client` sending the requests.
+    :param dict properties: The known properties, at least the ``id``.
+    :param bool lazy: (optional) Whether or not to defer fetching the
+        metadata until a property like :attr:`title` or a worksheet is
+        first needed. Reads and writes of known ranges then never fetch
+        it. Defaults to ``False``, the metadata is fetched right away.
+    """
+
+    #: Number of seconds the spreadsheet metadata is cached for.
+    #: Set to ``0`` to always fetch fresh metadata.
+    metadata_ttl = 60
+
+    def __init__(self, client, properties, lazy=False):
         self.client = client
         self._properties = properties
+        self._pending = None
+        # cell indexes built on the worksheets, to invalidate on writes
+        self._indexes = weakref.WeakSet()
 
-        metadata = self.fetch_sheet_metadata()
-        self._properties.update(metadata["properties"])
+        if not lazy:
+            self._properties.update(self._sheet_metadata()["properties"])
+
+    @property
+    def _metadata_cache(self):
+        """The ``(fetch time, metadata)`` cached on the client for this
+        spreadsheet id, or ``None``.
+        """
+        return self.client.metadata_cache.get(self.id)
 
     @property
     def id(self):
         """Spreadsheet ID."""
         return self._properties["id"]
 
+    def _property(self, name):
+        """Returns a spreadsheet property, fetches the metadata first if
+        the property is not known yet.
+        """
+        if name not in self._properties:
+            self._properties.update(self._sheet_metadata()["properties"])
+        return self._properties[name]
+
     @property
     def title(self):
         """Spreadsheet title."""
-        return self._properties["title"]
+        return self._property("title")
 
     @property
     def url(self):
         """Spreadsheet URL."""
-        return SPREADSHEET_DRIVE_URL % self.id
+        return self.client.urls.spreadsheet_drive % self.id
 
     @property
     def creationTime(self):
@@ -97,12 +224,12 @@ class Spreadsheet:
     @property
     def timezone(self):
         """Spreadsheet timeZone"""
-        return self._properties["timeZone"]
+        return self._property("timeZone")
 
     @property
     def locale(self):
         """Spreadsheet locale"""
-        return self._properties["locale"]
+        return self._property("locale")
 
     @property
     def sheet1(self):
@@ -113,9 +240,10 @@ class Spreadsheet:
         yield from self.worksheets()
 
     def __repr__(self):
+        # not self.title, a lazy spreadsheet may not know it yet
         return "<{} {} id:{}>".format(
             self.__class__.__name__,
-            repr(self.title),
+            repr(self._properties.get("title")),
             self.id,
         )
 
@@ -128,12 +256,77 @@ class Spreadsheet:
 
         .. versionadded:: 3.0
         """
+        if self._pending is not None:
+            self._pending.add_requests(body["requests"])
+            return None
+
+        return self._send_batch_update(body)
+
+    def _send_batch_update(self, body):
+        self.flush()
+
         r = self.client.request(
-            "post", SPREADSHEET_BATCH_UPDATE_URL % self.id, json=body
+            "post", self.client.urls.spreadsheet_batch_update % self.id, json=body
         )
+        self.invalidate()
+        self._values_changed()
 
         return r.json()
 
+    @contextmanager
+    def batch(self, max_payload_size=MAX_BATCH_PAYLOAD_SIZE):
+        """Defers the writes made to this spreadsheet until the end of
+        the ``with`` block.
+
+        Consecutive structural and format requests (:meth:`batch_update`)
+        are sent in a single `spreadsheets/<ID>:batchUpdate`_ call, and
+        consecutive value writes (:meth:`values_update`,
+        :meth:`values_batch_update`) in a single ``values:batchUpdate``
+        call. The writes are sent in call order, so a value written before
+        inserting rows lands where it would without ``batch``: group the
+        writes of each kind to send fewer calls. Calls whose body would be
+        larger than ``max_payload_size`` characters are split.
+
+        Writes that cannot be combined, or whose response is needed (like
+        :meth:`add_worksheet`, :meth:`values_append` or
+        :meth:`values_clear`), first send the queued writes then run
+        immediately. Reads are not deferred and do not see queued writes.
+
+        If the block raises an exception, the queued writes are discarded.
+
+        :param int max_payload_size: (optional) Maximum size of a request
+            body, in characters.
+
+        Example::
+
+            with spreadsheet.batch():
+                worksheet.update_acell("A1", "Total")
+                worksheet.format("A1", {"textFormat": {"bold": True}})
+                worksheet.freeze(rows=1)
+
+        .. _spreadsheets/<ID>:batchUpdate: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/batchUpdate
+        """
+        if self._pending is not None:
+            # nested block, the outermost one sends the writes
+            yield
+            return
+
+        self._pending = _PendingWrites(max_payload_size)
+
+        try:
+            yield
+        except BaseException:
+            self._pending = None
+            raise
+
+        pending, self._pending = self._pending, None
+        pending.send(self)
+
+    def flush(self):
+        """Sends the writes queued by :meth:`batch` right away."""
+        if self._pending:
+            self._pending.send(self)
+
     def values_append(self, range, params, body):
         """Lower-level method that directly calls `spreadsheets/<ID>/values:append <https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets.values/append>`_.
 
@@ -146,8 +339,12 @@ class Spreadsheet:
 
         .. versionadded:: 3.0
         """
-        url = SPREADSHEET_VALUES_APPEND_URL % (self.id, quote(range))
+        self.flush()
+        url = self.client.urls.spreadsheet_values_append % (self.id, quote(range))
         r = self.client.request("post", url, params=params, json=body)
+        # appending can extend the grid, the cached sheet sizes become stale
+        self.invalidate()
+        self._values_changed()
         return r.json()
 
     def values_clear(self, range):
@@ -159,45 +356,132 @@ class Spreadsheet:
 
         .. versionadded:: 3.0
         """
-        url = SPREADSHEET_VALUES_CLEAR_URL % (self.id, quote(range))
+        self.flush()
+        url = self.client.urls.spreadsheet_values_clear % (self.id, quote(range))
         r = self.client.request("post", url)
+        self._values_changed()
         return r.json()
 
     def values_batch_clear(self, params=None, body=None):
-        url = SPREADSHEET_VALUES_BATCH_CLEAR_URL % self.id
+        self.flush()
+        url = self.client.urls.spreadsheet_values_batch_clear % self.id
         r = self.client.request("post", url, params=params, json=body)
+        self._values_changed()
         return r.json()
 
-    def values_get(self, range, params=None):
+    def values_get(self, range, params=None, fields=None):
         """Lower-level method that directly calls `spreadsheets/<ID>/values/<range> <https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets.values/get>`_.
 
         :param str range: The `A1 notation <https://developers.google.com/sheets/api/guides/concepts#a1_notation>`_ of the values to retrieve.
         :param dict params: (optional) `Query parameters`_.
+        :param str fields: (optional) A `field mask <https://developers.google.com/sheets/api/guides/field-masks>`_
+            restricting the response to these fields, e.g. ``"values"``.
         :returns: `Response body`_.
         :rtype: dict
 
         .. versionadded:: 3.0
         """
-        url = SPREADSHEET_VALUES_URL % (self.id, quote(range))
+        params = _with_fields(params, fields)
+        url = self.client.urls.spreadsheet_values % (self.id, quote(range))
         r = self.client.request("get", url, params=params)
         return r.json()
 
-    def values_batch_get(self, ranges, params=None):
+    def values_batch_get(
+        self,
+        ranges,
+        params=None,
+        max_url_length=MAX_URL_LENGTH,
+        max_cells=MAX_BATCH_GET_CELLS,
+        max_workers=None,
+    ):
         """Lower-level method that directly calls `spreadsheets/<ID>/values:batchGet <https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets.values/batchGet>`_.
 
+        Long lists of ranges are split into several requests, each with a
+        URL of at most ``max_url_length`` characters and at most
+        ``max_cells`` cells (estimated from the cached sheet sizes). The
+        requests are sent concurrently and their ``valueRanges`` are
+        returned in the order of ``ranges``.
+
         :param ranges: List of ranges in the `A1 notation <https://developers.google.com/sheets/api/guides/concepts#a1_notation>`_ of the values to retrieve.
         :param dict params: (optional) `Query parameters`_.
+        :param int max_url_length: (optional) Maximum length of a request URL.
+        :param int max_cells: (optional) Maximum estimated number of cells
+            fetched by a single request.
+        :param int max_workers: (optional) Maximum number of requests sent
+            at the same time when the ranges are split. Defaults to the
+            :class:`~concurrent.futures.ThreadPoolExecutor` default.
         :returns: `Response body`_.
         :rtype: dict
         """
         if params is None:
             params = {}
 
-        params.update(ranges=ranges)
+        url = self.client.urls.spreadsheet_values_batch % (self.id)
+        chunks = self._split_ranges(url, ranges, params, max_url_length, max_cells)
 
-        url = SPREADSHEET_VALUES_BATCH_URL % (self.id)
-        r = self.client.request("get", url, params=params)
-        return r.json()
+        if len(chunks) <= 1:
+            params.update(ranges=ranges)
+            r = self.client.request("get", url, params=params)
+            return r.json()
+
+        def fetch(chunk):
+            r = self.client.request("get", url, params=dict(params, ranges=chunk))
+            return r.json()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = list(executor.map(fetch, chunks))
+
+        response = responses[0]
+        response["valueRanges"] = [
+            value_range for r in responses for value_range in r.get("valueRanges", [])
+        ]
+        return response
+
+    def _split_ranges(self, url, ranges, params, max_url_length, max_cells):
+        """Splits ``ranges`` into consecutive chunks fitting in one
+        ``values:batchGet`` request. A range exceeding a limit on its own
+        is sent alone.
+        """
+        grid_sizes = self._grid_sizes()
+        base_length = len(url) + 1 + len(urlencode(params, doseq=True))
+
+        chunks = []
+        url_length = cells = 0
+
+        for range_name in ranges:
+            range_length = len(urlencode({"ranges": range_name})) + 1
+            range_cells = _estimate_cell_count(range_name, grid_sizes)
+
+            too_long = url_length + range_length > max_url_length
+            too_large = cells + range_cells > max_cells
+
+            if not chunks or too_long or too_large:
+                chunks.append([])
+                url_length, cells = base_length, 0
+
+            chunks[-1].append(range_name)
+            url_length += range_length
+            cells += range_cells
+
+        return chunks
+
+    def _grid_sizes(self):
+        """Returns the ``(rows, cols)`` of each sheet by title, from the
+        cached metadata only: this never sends a request.
+        """
+        if self._metadata_cache is None:
+            return {}
+
+        sizes = {}
+        for sheet in self._metadata_cache[1].get("sheets", []):
+            properties = sheet["properties"]
+            grid = properties.get("gridProperties", {})
+            sizes[properties["title"]] = (
+                grid.get("rowCount", 0),
+                grid.get("columnCount", 0),
+            )
+
+        return sizes
 
     def values_update(self, range, params=None, body=None):
         """Lower-level method that directly calls `spreadsheets/<ID>/values/<range>`_.
@@ -222,38 +506,131 @@ class Spreadsheet:
 
         .. versionadded:: 3.0
         """
-        url = SPREADSHEET_VALUES_URL % (self.id, quote(range))
+        deferrable = set(params or {}) == {"valueInputOption"} and body is not None
+
+        if self._pending is not None and deferrable:
+            self._pending.add_values(
+                params["valueInputOption"], [dict(body, range=range)]
+            )
+            return None
+
+        self.flush()
+
+        url = self.client.urls.spreadsheet_values % (self.id, quote(range))
         r = self.client.request("put", url, params=params, json=body)
+        self._values_changed()
         return r.json()
 
     def values_batch_update(self, params=None, body=None):
-        url = SPREADSHEET_VALUES_BATCH_UPDATE_URL % self.id
+        """Lower-level method that directly calls `spreadsheets/<ID>/values:batchUpdate <https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets.values/batchUpdate>`_.
+
+        :param dict params: (optional) `Query parameters`_.
+        :param dict body: (optional) `Request body`_.
+        :returns: `Response body`_.
+        :rtype: dict
+        """
+        deferrable = not params and set(body or {}) == {"valueInputOption", "data"}
+
+        if self._pending is not None and deferrable:
+            self._pending.add_values(body["valueInputOption"], body["data"])
+            return None
+
+        return self._send_values_batch_update(params, body)
+
+    def _send_values_batch_update(self, params, body):
+        self.flush()
+
+        url = self.client.urls.spreadsheet_values_batch_update % self.id
         r = self.client.request("post", url, params=params, json=body)
+        self._values_changed()
         return r.json()
 
     def _spreadsheets_get(self, params=None):
         """A method stub that directly calls `spreadsheets.get <https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/get>`_."""
-        url = SPREADSHEET_URL % self.id
+        url = self.client.urls.spreadsheet % self.id
         r = self.client.request("get", url, params=params)
         return r.json()
 
     def _spreadsheets_sheets_copy_to(self, sheet_id, destination_spreadsheet_id):
         """Lower-level method that directly calls `spreadsheets.sheets.copyTo <https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets.sheets/copyTo>`_."""
-        url = SPREADSHEET_SHEETS_COPY_TO_URL % (self.id, sheet_id)
+        self.flush()
+        url = self.client.urls.spreadsheet_sheets_copy_to % (self.id, sheet_id)
 
         body = {"destinationSpreadsheetId": destination_spreadsheet_id}
         r = self.client.request("post", url, json=body)
         return r.json()
 
-    def fetch_sheet_metadata(self, params=None):
+    def fetch_sheet_metadata(self, params=None, fields=None):
+        """Fetches the spreadsheet metadata from the API.
+
+        When called without ``params`` nor ``fields`` the result also
+        refreshes the metadata cache.
+
+        :param dict params: (optional) `Query parameters`_.
+        :param str fields: (optional) A `field mask <https://developers.google.com/sheets/api/guides/field-masks>`_
+            restricting the response to these fields.
+        :rtype: dict
+
+        Example::
+
+            # only the ids and titles of the worksheets
+            spreadsheet.fetch_sheet_metadata(
+                fields="sheets.properties(sheetId,title)"
+            )
+        """
+        cache = params is None and fields is None
+
         if params is None:
             params = {"includeGridData": "false"}
 
-        url = SPREADSHEET_URL % self.id
+        params = _with_fields(params, fields)
+
+        url = self.client.urls.spreadsheet % self.id
 
         r = self.client.request("get", url, params=params)
+        metadata = r.json()
 
-        return r.json()
+        if cache:
+            # stored as a single tuple so that concurrent readers never see
+            # a half-updated cache
+            self.client.metadata_cache[self.id] = (time.monotonic(), metadata)
+
+        return metadata
+
+    def _sheet_metadata(self):
+        """Returns the cached spreadsheet metadata, fetches it if the cache
+        is empty or expired.
+        """
+        cache = self._metadata_cache
+
+        if cache is None or time.monotonic() - cache[0] >= self.metadata_ttl:
+            return self.fetch_sheet_metadata()
+
+        return cache[1]
+
+    def refresh(self):
+        """Fetches the spreadsheet metadata again and updates the cache
+        and the spreadsheet properties.
+
+        :returns: the spreadsheet metadata.
+        :rtype: dict
+        """
+        metadata = self.fetch_sheet_metadata()
+        self._properties.update(metadata["properties"])
+        return metadata
+
+    def invalidate(self):
+        """Drops the cached spreadsheet metadata.
+
+        The next worksheet lookup will fetch it again, for every object
+        opened on this spreadsheet through the same client.
+        """
+        self.client.metadata_cache.pop(self.id, None)
+
+    def _values_changed(self):
+        """Marks the cell indexes of the worksheets as stale after a write."""
+        for index in list(self._indexes):
+            index.invalidate()
 
     def get_worksheet(self, index):
         """Returns a worksheet with specified `index`.
@@ -271,7 +648,7 @@ class Spreadsheet:
         >>> sht = client.open('My fancy spreadsheet')
         >>> worksheet = sht.get_worksheet(2)
         """
-        sheet_data = self.fetch_sheet_metadata()
+        sheet_data = self._sheet_metadata()
 
         try:
             properties = sheet_data["sheets"][index]["properties"]
@@ -294,7 +671,7 @@ class Spreadsheet:
         >>> sht = client.open('My fancy spreadsheet')
         >>> worksheet = sht.get_worksheet_by_id(123456)
         """
-        sheet_data = self.fetch_sheet_metadata()
+        sheet_data = self._sheet_metadata()
 
         try:
             item = finditem(
@@ -309,7 +686,7 @@ class Spreadsheet:
         """Returns a list of all :class:`worksheets <gspread.worksheet.Worksheet>`
         in a spreadsheet.
         """
-        sheet_data = self.fetch_sheet_metadata()
+        sheet_data = self._sheet_metadata()
         return [Worksheet(self, x["properties"]) for x in sheet_data["sheets"]]
 
     def worksheet(self, title):
@@ -330,7 +707,7 @@ class Spreadsheet:
         >>> sht = client.open('Sample one')
         >>> worksheet = sht.worksheet('Annual bonuses')
         """
-        sheet_data = self.fetch_sheet_metadata()
+        sheet_data = self._sheet_metadata()
         try:
             item = finditem(
                 lambda x: x["properties"]["title"] == title,
@@ -374,7 +751,7 @@ class Spreadsheet:
         if index is not None:
             body["requests"][0]["addSheet"]["properties"]["index"] = index
 
-        data = self.batch_update(body)
+        data = self._send_batch_update(body)
 
         properties = data["replies"][0]["addSheet"]["properties"]
 
@@ -420,7 +797,7 @@ class Spreadsheet:
             ]
         }
 
-        data = self.batch_update(body)
+        data = self._send_batch_update(body)
 
         properties = data["replies"][0]["duplicateSheet"]["properties"]
 
@@ -543,6 +920,19 @@ class Spreadsheet:
         """
         return self.client.export(self.id, format)
 
+    def export_to(self, file, format=ExportFormat.PDF, chunk_size=EXPORT_CHUNK_SIZE):
+        """Export the spreadsheet in the given format to a file, without
+        holding it in memory. See :meth:`gspread.Client.export_to`.
+
+        :param file: A path, or a file object opened in binary mode.
+        :param str format: The format of the resulting file, see :meth:`export`.
+        :param int chunk_size: (optional) Size of the chunks written to
+            ``file``, in bytes.
+
+        :returns int: The number of bytes written.
+        """
+        return self.client.export_to(self.id, file, format, chunk_size)
+
     def list_permissions(self):
         """Lists the spreadsheet's permissions."""
         return self.client.list_permissions(self.id)
@@ -595,9 +985,7 @@ class Spreadsheet:
            or a domain email address.
         """
 
-        url = "{}/{}/permissions/{}".format(
-            DRIVE_FILES_API_V3_URL, self.id, permission_id
-        )
+        url = self.client.urls.drive_file_permission % (self.id, permission_id)
 
         payload = {
             "role": "writer",  # new owner must be writer in order to accept ownership by editing permissions
@@ -616,11 +1004,7 @@ class Spreadsheet:
            You can only accept ownership transfer for the user currently being used.
         """
 
-        url = "{}/{}/permissions/{}".format(
-            DRIVE_FILES_API_V3_URL,
-            self.id,
-            permission_id,
-        )
+        url = self.client.urls.drive_file_permission % (self.id, permission_id)
 
         payload = {
             "role": "owner",
@@ -6,27 +6,98 @@ Google API urls.
 
 """
 
-SPREADSHEETS_API_V4_BASE_URL = "https://sheets.googleapis.com/v4/spreadsheets"
-SPREADSHEET_URL = SPREADSHEETS_API_V4_BASE_URL + "/%s"
-SPREADSHEET_BATCH_UPDATE_URL = SPREADSHEETS_API_V4_BASE_URL + "/%s:batchUpdate"
-SPREADSHEET_VALUES_URL = SPREADSHEETS_API_V4_BASE_URL + "/%s/values/%s"
-SPREADSHEET_VALUES_BATCH_URL = SPREADSHEETS_API_V4_BASE_URL + "/%s/values:batchGet"
-SPREADSHEET_VALUES_BATCH_UPDATE_URL = (
-    SPREADSHEETS_API_V4_BASE_URL + "/%s/values:batchUpdate"
-)
-SPREADSHEET_VALUES_BATCH_CLEAR_URL = (
-    SPREADSHEETS_API_V4_BASE_URL + "/%s/values:batchClear"
-)
-SPREADSHEET_VALUES_APPEND_URL = SPREADSHEET_VALUES_URL + ":append"
-SPREADSHEET_VALUES_CLEAR_URL = SPREADSHEET_VALUES_URL + ":clear"
-SPREADSHEET_SHEETS_COPY_TO_URL = SPREADSHEET_URL + "/sheets/%s:copyTo"
-
-DRIVE_FILES_API_V3_URL = "https://www.googleapis.com/drive/v3/files"
-DRIVE_FILES_UPLOAD_API_V2_URL = "https://www.googleapis.com" "/upload/drive/v2/files"
-
-DRIVE_FILES_API_V3_COMMENTS_URL = (
-    "https://www.googleapis.com/drive/v3/files/%s/comments"
-)
-
-SPREADSHEET_DRIVE_URL = "https://docs.google.com/spreadsheets/d/%s"
-WORKSHEET_DRIVE_URL = SPREADSHEET_DRIVE_URL + "#gid=%s"
+SHEETS_API_URL = "https://sheets.googleapis.com/"
+DRIVE_API_URL = "https://www.googleapis.com/"
+DOCS_URL = "https://docs.google.com/"
+
+
+class APIUrls:
+    """The set of URLs a :class:`~gspread.Client` sends its requests to.
+
+    Each attribute is a URL template formatted with ``%``. The module
+    constants with the same upper case name are those of a default
+    instance. By default they point to the Google APIs, the root URL of
+    each API can be changed to send the requests through a proxy or to a
+    local stand-in.
+
+    :param str sheets_url: (optional) Root URL of the Sheets API.
+    :param str drive_url: (optional) Root URL of the Drive API.
+    :param str docs_url: (optional) Root URL of the Google Sheets web
+        pages, used by :attr:`Spreadsheet.url <gspread.spreadsheet.Spreadsheet.url>`
+        and :attr:`Worksheet.url <gspread.worksheet.Worksheet.url>`.
+
+    Example::
+
+        # through a caching reverse proxy
+        urls = APIUrls(sheets_url="https://sheets-cache.example.com/")
+        gc = gspread.Client(credentials, urls=urls)
+    """
+
+    def __init__(
+        self, sheets_url=SHEETS_API_URL, drive_url=DRIVE_API_URL, docs_url=DOCS_URL
+    ):
+        sheets_url = sheets_url.rstrip("/") + "/"
+        drive_url = drive_url.rstrip("/") + "/"
+
+        #: Root URLs of the APIs, without duplicates.
+        self.hosts = tuple(dict.fromkeys([sheets_url, drive_url]))
+
+        self.spreadsheets_api_v4_base = sheets_url + "v4/spreadsheets"
+        self.spreadsheet = self.spreadsheets_api_v4_base + "/%s"
+        self.spreadsheet_batch_update = self.spreadsheet + ":batchUpdate"
+        self.spreadsheet_values = self.spreadsheet + "/values/%s"
+        self.spreadsheet_values_batch = self.spreadsheet + "/values:batchGet"
+        self.spreadsheet_values_batch_update = self.spreadsheet + "/values:batchUpdate"
+        self.spreadsheet_values_batch_clear = self.spreadsheet + "/values:batchClear"
+        self.spreadsheet_values_append = self.spreadsheet_values + ":append"
+        self.spreadsheet_values_clear = self.spreadsheet_values + ":clear"
+        self.spreadsheet_sheets_copy_to = self.spreadsheet + "/sheets/%s:copyTo"
+
+        self.drive_files_api_v3 = drive_url + "drive/v3/files"
+        self.drive_file = self.drive_files_api_v3 + "/%s"
+        self.drive_file_copy = self.drive_file + "/copy"
+        self.drive_file_export = self.drive_file + "/export"
+        self.drive_files_api_v3_comments = self.drive_file + "/comments"
+        self.drive_file_permissions = self.drive_file + "/permissions"
+        self.drive_file_permission = self.drive_file_permissions + "/%s"
+        self.drive_files_upload_api_v2 = drive_url + "upload/drive/v2/files"
+        self.drive_file_upload = self.drive_files_upload_api_v2 + "/%s"
+
+        self.spreadsheet_drive = docs_url.rstrip("/") + "/spreadsheets/d/%s"
+        self.worksheet_drive = self.spreadsheet_drive + "#gid=%s"
+
+    @classmethod
+    def from_base_url(cls, base_url):
+        """Returns the URLs of both APIs served from ``base_url``, e.g. by
+        a :class:`~gspread.fake.FakeServer`.
+        """
+        return cls(sheets_url=base_url, drive_url=base_url)
+
+    def __repr__(self):
+        return "<{} {}>".format(self.__class__.__name__, " ".join(self.hosts))
+
+
+# the module constants are the templates of the default URLs
+_DEFAULT_URLS = APIUrls()
+
+#: Hosts of the Google APIs called by gspread.
+API_HOST_URLS = _DEFAULT_URLS.hosts
+
+SPREADSHEETS_API_V4_BASE_URL = _DEFAULT_URLS.spreadsheets_api_v4_base
+SPREADSHEET_URL = _DEFAULT_URLS.spreadsheet
+SPREADSHEET_BATCH_UPDATE_URL = _DEFAULT_URLS.spreadsheet_batch_update
+SPREADSHEET_VALUES_URL = _DEFAULT_URLS.spreadsheet_values
+SPREADSHEET_VALUES_BATCH_URL = _DEFAULT_URLS.spreadsheet_values_batch
+SPREADSHEET_VALUES_BATCH_UPDATE_URL = _DEFAULT_URLS.spreadsheet_values_batch_update
+SPREADSHEET_VALUES_BATCH_CLEAR_URL = _DEFAULT_URLS.spreadsheet_values_batch_clear
+SPREADSHEET_VALUES_APPEND_URL = _DEFAULT_URLS.spreadsheet_values_append
+SPREADSHEET_VALUES_CLEAR_URL = _DEFAULT_URLS.spreadsheet_values_clear
+SPREADSHEET_SHEETS_COPY_TO_URL = _DEFAULT_URLS.spreadsheet_sheets_copy_to
+
+DRIVE_FILES_API_V3_URL = _DEFAULT_URLS.drive_files_api_v3
+DRIVE_FILES_UPLOAD_API_V2_URL = _DEFAULT_URLS.drive_files_upload_api_v2
+
+DRIVE_FILES_API_V3_COMMENTS_URL = _DEFAULT_URLS.drive_files_api_v3_comments
+
+SPREADSHEET_DRIVE_URL = _DEFAULT_URLS.spreadsheet_drive
+WORKSHEET_DRIVE_URL = _DEFAULT_URLS.worksheet_drive
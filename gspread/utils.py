@@ -6,11 +6,11 @@ This module contains utility functions.
 
 """
 
+import json
 import re
 from collections import defaultdict, namedtuple
 from collections.abc import Sequence
-from functools import wraps
-from itertools import chain
+from functools import lru_cache, wraps
 from math import inf
 from urllib.parse import quote as uquote
 
@@ -24,6 +24,24 @@ MAGIC_NUMBER = 64
 CELL_ADDR_RE = re.compile(r"([A-Za-z]+)([1-9]\d*)")
 A1_ADDR_ROW_COL_RE = re.compile(r"([A-Za-z]+)?([1-9]\d*)?$")
 
+#: Maximum number of columns of a worksheet, column ``ZZZ``.
+MAX_COLUMNS = 18278
+
+#: Maximum size of a request body built by gspread when splitting
+#: large writes, in characters. Google recommends payloads of 2 MB at most.
+MAX_BATCH_PAYLOAD_SIZE = 2 * 1024 * 1024
+
+#: Maximum length of a request URL built by gspread when splitting
+#: multi-range reads. Longer URLs can be rejected with a 414 error.
+MAX_URL_LENGTH = 8000
+
+#: Maximum estimated number of cells fetched by a single request when
+#: splitting multi-range reads.
+MAX_BATCH_GET_CELLS = 100000
+
+#: Size of the chunks an exported file is written in, in bytes.
+EXPORT_CHUNK_SIZE = 1024 * 1024
+
 URL_KEY_V1_RE = re.compile(r"key=([^&#]+)")
 URL_KEY_V2_RE = re.compile(r"/spreadsheets/d/([a-zA-Z0-9-_]+)")
 
@@ -34,6 +52,9 @@ ValueRenderOption = namedtuple(
 ValueInputOption = namedtuple("_ValueInputOption", ["raw", "user_entered"])(
     "RAW", "USER_ENTERED"
 )
+DateTimeOption = namedtuple("_DateTimeOption", ["serial_number", "formatted_string"])(
+    "SERIAL_NUMBER", "FORMATTED_STRING"
+)
 MimeType = namedtuple(
     "_MimeType",
     ["google_sheets", "pdf", "excel", "csv", "open_office_sheet", "tsv", "zip"],
@@ -241,6 +262,15 @@ def rowcol_to_a1(row, col):
     if row < 1 or col < 1:
         raise IncorrectCellLabel("({}, {})".format(row, col))
 
+    return _column_label(col) + str(row)
+
+
+@lru_cache(maxsize=MAX_COLUMNS)
+def _column_label(col):
+    """Returns the letters of the column ``col``, e.g. ``AA`` for 27.
+
+    Memoized: labels are built once per column.
+    """
     div = col
     column_label = ""
 
@@ -251,9 +281,45 @@ def rowcol_to_a1(row, col):
             div -= 1
         column_label = chr(mod + MAGIC_NUMBER) + column_label
 
-    label = "{}{}".format(column_label, row)
+    return column_label
+
+
+@lru_cache(maxsize=2 * MAX_COLUMNS)
+def _column_index(column_label):
+    """Returns the number of the column ``column_label``, e.g. 27 for
+    ``AA`` or ``aa``.
+
+    Memoized: numbers are computed once per label.
+    """
+    col = 0
+    for c in column_label.upper():
+        col = col * 26 + ord(c) - MAGIC_NUMBER
+    return col
+
+
+def rowcols_to_a1(rows, cols):
+    """Translates sequences of rows and columns to the A1 notations of
+    the cells, at once.
+
+    :param list rows: The rows of the cells, starting at 1.
+    :param list cols: The columns of the cells, starting at 1, as many
+        as ``rows``.
+    :rtype: list
+
+    Example:
+
+    >>> rowcols_to_a1([1, 2, 3], [1, 27, 28])
+    ['A1', 'AA2', 'AB3']
+
+    """
+    if len(rows) != len(cols):
+        raise ValueError("rows and cols must have the same length")
+
+    if rows and (min(rows) < 1 or min(cols) < 1):
+        raise IncorrectCellLabel("rows and columns must start at 1")
 
-    return label
+    label = _column_label
+    return [label(int(col)) + str(int(row)) for row, col in zip(rows, cols)]
 
 
 def a1_to_rowcol(label):
@@ -273,12 +339,8 @@ def a1_to_rowcol(label):
     """
     m = CELL_ADDR_RE.match(label)
     if m:
-        column_label = m.group(1).upper()
         row = int(m.group(2))
-
-        col = 0
-        for i, c in enumerate(reversed(column_label)):
-            col += (ord(c) - MAGIC_NUMBER) * (26**i)
+        col = _column_index(m.group(1))
     else:
         raise IncorrectCellLabel(label)
 
@@ -329,9 +391,7 @@ def _a1_to_rowcol_unbounded(label):
         column_label, row = m.groups()
 
         if column_label:
-            col = 0
-            for i, c in enumerate(reversed(column_label.upper())):
-                col += (ord(c) - MAGIC_NUMBER) * (26**i)
+            col = _column_index(column_label)
         else:
             col = inf
 
@@ -382,6 +442,39 @@ def a1_range_to_grid_range(name, sheet_id=None):
     >>> a1_range_to_grid_range('A1', sheet_id=0)
     {'sheetId': 0, 'startRowIndex': 0, 'endRowIndex': 1, 'startColumnIndex': 0, 'endColumnIndex': 1}
     """
+    grid_range = dict(_grid_range(name))
+
+    if sheet_id is not None:
+        grid_range["sheetId"] = sheet_id
+
+    return grid_range
+
+
+def a1_ranges_to_grid_ranges(names, sheet_id=None):
+    """Converts ranges defined in A1 notation to dicts representing
+    `GridRange`_, at once. See :func:`a1_range_to_grid_range`.
+
+    :param list names: The ranges in A1 notation.
+    :param int sheet_id: (optional) The id of the sheet of all the ranges.
+    :rtype: list
+
+    Example:
+
+    >>> a1_ranges_to_grid_ranges(['A1:B2', 'C3'], sheet_id=0)
+    [{'startRowIndex': 0, 'endRowIndex': 2, 'startColumnIndex': 0, 'endColumnIndex': 2, 'sheetId': 0}, {'startRowIndex': 2, 'endRowIndex': 3, 'startColumnIndex': 2, 'endColumnIndex': 3, 'sheetId': 0}]
+    """
+    parse = _grid_range
+    if sheet_id is None:
+        return [dict(parse(name)) for name in names]
+    return [dict(parse(name), sheetId=sheet_id) for name in names]
+
+
+@lru_cache(maxsize=4096)
+def _grid_range(name):
+    """Returns the items of the `GridRange`_ of ``name``, as a tuple.
+
+    Memoized: the ranges of a worksheet are usually parsed many times.
+    """
     start_label, _, end_label = name.partition(":")
 
     start_row_index, start_column_index = _a1_to_rowcol_unbounded(start_label)
@@ -394,19 +487,18 @@ def a1_range_to_grid_range(name, sheet_id=None):
     if start_column_index > end_column_index:
         start_column_index, end_column_index = end_column_index, start_column_index
 
-    grid_range = {
-        "startRowIndex": start_row_index - 1,
-        "endRowIndex": end_row_index,
-        "startColumnIndex": start_column_index - 1,
-        "endColumnIndex": end_column_index,
-    }
-
-    grid_range = {key: value for (key, value) in grid_range.items() if value != inf}
+    grid_range = (
+        ("startRowIndex", start_row_index - 1),
+        ("endRowIndex", end_row_index),
+        ("startColumnIndex", start_column_index - 1),
+        ("endColumnIndex", end_column_index),
+    )
 
-    if sheet_id is not None:
-        grid_range["sheetId"] = sheet_id
+    if end_row_index != inf and end_column_index != inf:
+        # bounded on all sides, the common case
+        return grid_range
 
-    return grid_range
+    return tuple((key, value) for (key, value) in grid_range if value != inf)
 
 
 def column_letter_to_index(column):
@@ -516,31 +608,193 @@ def fill_gaps(L, rows=None, cols=None):
         return []
 
 
-def cell_list_to_rect(cell_list):
+def cell_list_bounds(cell_list):
+    """Returns the position of the top-left and bottom-right cells of the
+    smallest rectangle holding all the cells of ``cell_list``, in a single
+    pass.
+
+    :param list cell_list: A non-empty list of :class:`~gspread.cell.Cell`.
+    :returns: a ``(first_row, first_col, last_row, last_col)`` tuple.
+    """
+    first_row = last_row = cell_list[0].row
+    first_col = last_col = cell_list[0].col
+
+    for cell in cell_list:
+        row = cell.row
+        col = cell.col
+        if row < first_row:
+            first_row = row
+        elif row > last_row:
+            last_row = row
+        if col < first_col:
+            first_col = col
+        elif col > last_col:
+            last_col = col
+
+    return first_row, first_col, last_row, last_col
+
+
+def cell_list_to_rect(cell_list, bounds=None):
+    """Returns the values of the cells as a list of lists where each sublist
+    contains all of the values for one row.
+
+    The Google API requires a rectangle of updates, so if a cell isn't
+    present in the input cell_list, then the value will be None and will
+    not be updated.
+
+    :param list cell_list: A list of :class:`~gspread.cell.Cell`.
+    :param tuple bounds: (optional) The bounds of the cells, as returned
+        by :func:`cell_list_bounds`, if already known.
+    :rtype: list
+    """
     if not cell_list:
         return []
 
-    rows = defaultdict(lambda: {})
+    if bounds is None:
+        bounds = cell_list_bounds(cell_list)
+    first_row, first_col, last_row, last_col = bounds
 
-    row_offset = min(c.row for c in cell_list)
-    col_offset = min(c.col for c in cell_list)
+    width = last_col - first_col + 1
+    rect = [[None] * width for _ in range(last_row - first_row + 1)]
 
     for cell in cell_list:
-        row = rows.setdefault(int(cell.row) - row_offset, {})
-        row[cell.col - col_offset] = cell.value
+        rect[cell.row - first_row][cell.col - first_col] = cell.value
 
-    if not rows:
-        return []
+    return rect
+
+
+def cell_list_to_rects(cell_list):
+    """Groups the cells into rectangles of values covering exactly those
+    cells, see :func:`cells_to_rects`.
+
+    Unlike :func:`cell_list_to_rect`, cells spread over a worksheet do
+    not produce a rectangle padded with None.
+
+    :param list cell_list: A list of :class:`~gspread.cell.Cell`.
+    :returns: a sorted list of ``((first_row, first_col, last_row, last_col), values)``
+        tuples, ``values`` being a list of rows.
+    :rtype: list
+
+    Example:
+
+    >>> cell_list_to_rects([Cell(1, 1, "a"), Cell(1, 2, "b"), Cell(5, 3, "c")])
+    [((1, 1, 1, 2), [['a', 'b']]), ((5, 3, 5, 3), [['c']])]
+    """
+    values = {(cell.row, cell.col): cell.value for cell in cell_list}
+
+    return [
+        (
+            (first_row, first_col, last_row, last_col),
+            [
+                [values[row, col] for col in range(first_col, last_col + 1)]
+                for row in range(first_row, last_row + 1)
+            ],
+        )
+        for first_row, first_col, last_row, last_col in cells_to_rects(values)
+    ]
+
+
+def _merge_row_runs(cells):
+    """Groups ``(row, col)`` cells into rectangles, by merging the runs of
+    consecutive cells of each row with identical runs in the rows below.
+    """
+    rows = defaultdict(set)
+    for row, col in cells:
+        rows[row].add(col)
+
+    rects = []
+    # rectangles ending on the previous row, by (first_col, last_col)
+    open_rects = {}
+    previous_row = None
+
+    for row in sorted(rows):
+        if previous_row != row - 1:
+            rects.extend(open_rects.values())
+            open_rects = {}
+
+        runs = []
+        for col in sorted(rows[row]):
+            if runs and runs[-1][1] == col - 1:
+                runs[-1][1] = col
+            else:
+                runs.append([col, col])
+
+        next_open_rects = {}
+        for first_col, last_col in runs:
+            rect = open_rects.pop((first_col, last_col), None)
+            if rect is None:
+                rect = [row, first_col, row, last_col]
+            rect[2] = row
+            next_open_rects[(first_col, last_col)] = rect
+
+        rects.extend(open_rects.values())
+        open_rects = next_open_rects
+        previous_row = row
+
+    rects.extend(open_rects.values())
+
+    return rects
+
+
+def cells_to_rects(cells):
+    """Groups cells into few rectangles covering exactly those cells.
+
+    Cells are merged row by row and column by column, the grouping with
+    the fewest rectangles is returned.
+
+    :param cells: An iterable of ``(row, col)`` tuples.
+    :returns: a sorted list of ``(first_row, first_col, last_row, last_col)``
+        tuples.
+    :rtype: list
+
+    Example:
+
+    >>> cells_to_rects([(1, 1), (1, 2), (2, 1), (2, 2), (2, 4)])
+    [(1, 1, 2, 2), (2, 4, 2, 4)]
+
+    >>> cells_to_rects([(1, 1), (2, 1), (2, 2), (3, 1)])
+    [(1, 1, 3, 1), (2, 2, 2, 2)]
+    """
+    cells = list(cells)
+
+    by_rows = _merge_row_runs(cells)
+    by_cols = [
+        (first_row, first_col, last_row, last_col)
+        for first_col, first_row, last_col, last_row in _merge_row_runs(
+            (col, row) for row, col in cells
+        )
+    ]
+
+    rects = by_cols if len(by_cols) < len(by_rows) else by_rows
+
+    return sorted(tuple(rect) for rect in rects)
+
+
+def batched_by_size(items, max_size):
+    """Splits ``items`` into consecutive lists whose JSON encoded size
+    does not exceed ``max_size`` characters.
+
+    An item larger than ``max_size`` is returned alone in its list.
+
+    >>> list(batched_by_size([[1, 2], [3, 4], [5, 6]], 12))
+    [[[1, 2], [3, 4]], [[5, 6]]]
+    """
+    batch = []
+    batch_size = 0
+
+    for item in items:
+        item_size = len(json.dumps(item))
+
+        if batch and batch_size + item_size > max_size:
+            yield batch
+            batch = []
+            batch_size = 0
 
-    all_row_keys = chain.from_iterable(row.keys() for row in rows.values())
-    rect_cols = range(max(all_row_keys) + 1)
-    rect_rows = range(max(rows.keys()) + 1)
+        batch.append(item)
+        batch_size += item_size
 
-    # Return the values of the cells as a list of lists where each sublist
-    # contains all of the values for one row. The Google API requires a rectangle
-    # of updates, so if a cell isn't present in the input cell_list, then the
-    # value will be None and will not be updated.
-    return [[rows[i].get(j) for j in rect_cols] for i in rect_rows]
+    if batch:
+        yield batch
 
 
 def quote(value, safe="", encoding="utf-8"):
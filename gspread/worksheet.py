@@ -6,24 +6,32 @@ This module contains common worksheets' models.
 
 """
 
-from .cell import Cell
+from .cell import Cell, CellBlock
+from .columnar import columns_to_dataframe, records_to_columns
 from .exceptions import GSpreadException
-from .urls import SPREADSHEET_URL, WORKSHEET_DRIVE_URL
+from .index import CellIndex
+from .records import RecordDecoder
 from .utils import (
+    MAX_BATCH_PAYLOAD_SIZE,
+    DateTimeOption,
     Dimension,
     ValueInputOption,
     ValueRenderOption,
     a1_range_to_grid_range,
+    a1_ranges_to_grid_ranges,
     a1_to_rowcol,
     absolute_range_name,
     accepted_kwargs,
     cast_to_a1_notation,
+    cell_list_bounds,
     cell_list_to_rect,
+    cell_list_to_rects,
     fill_gaps,
     filter_dict_values,
     finditem,
     is_scalar,
     numericise_all,
+    rightpad,
     rowcol_to_a1,
 )
 
@@ -102,6 +110,33 @@ class ValueRange(list):
             return default
 
 
+def _check_expected_headers(keys, expected_headers=None):
+    """Raises GSpreadException if ``expected_headers`` are not unique or
+    are not all part of the header row ``keys``.
+    """
+    # if no given expected headers, expect all of them
+    if expected_headers is None:
+        expected_headers = keys
+
+    # keys must:
+    # - be uniques
+    # - be part of the complete header list
+    # - not contain extra headers
+    expected = set(expected_headers)
+    headers = set(keys)
+
+    # make sure they are uniques
+    if len(expected) != len(expected_headers):
+        raise GSpreadException("the given 'expected_headers' are not uniques")
+
+    if not expected & headers == expected:
+        raise GSpreadException(
+            "the given 'expected_headers' contains unknown headers: {}".format(
+                expected - headers
+            )
+        )
+
+
 class Worksheet:
     """The class that represents a single sheet in a spreadsheet
     (aka "worksheet").
@@ -132,7 +167,7 @@ class Worksheet:
     @property
     def url(self):
         """Worksheet URL."""
-        return WORKSHEET_DRIVE_URL % (self.spreadsheet.id, self.id)
+        return self.client.urls.worksheet_drive % (self.spreadsheet.id, self.id)
 
     @property
     def index(self):
@@ -187,9 +222,25 @@ class Worksheet:
             return self._properties["tabColorStyle"]["rgbColor"]
         return None
 
+    def batch(self, max_payload_size=MAX_BATCH_PAYLOAD_SIZE):
+        """Defers the writes made to the spreadsheet until the end of
+        the ``with`` block.
+
+        This is a shortcut for :meth:`gspread.spreadsheet.Spreadsheet.batch`,
+        see it for details.
+
+        Example::
+
+            with worksheet.batch():
+                for row in range(1, 101):
+                    worksheet.update_cell(row, 1, row)
+                    worksheet.format("A{}".format(row), {"textFormat": {"bold": True}})
+        """
+        return self.spreadsheet.batch(max_payload_size)
+
     def _get_sheet_property(self, property, default_value):
         """return a property of this worksheet or default value if not found"""
-        meta = self.spreadsheet.fetch_sheet_metadata()
+        meta = self.spreadsheet._sheet_metadata()
         sheet = finditem(
             lambda x: x["properties"]["sheetId"] == self.id, meta["sheets"]
         )
@@ -256,13 +307,18 @@ class Worksheet:
         return Cell(row, col, value)
 
     @cast_to_a1_notation
-    def range(self, name=""):
+    def range(self, name="", as_block=False):
         """Returns a list of :class:`gspread.cell.Cell` objects from a specified range.
 
         :param name: A string with range value in A1 notation (e.g. 'A1:A5')
                      or the named range to fetch.
         :type name: str
 
+        :param bool as_block: (optional) Return a
+            :class:`~gspread.cell.CellBlock` instead of a list. A block
+            only keeps the grid of values and creates the cells when they
+            are accessed, which uses far less memory for large ranges.
+
         Alternatively, you may specify numeric boundaries. All values
         index from 1 (one):
 
@@ -271,7 +327,7 @@ class Worksheet:
         :param int last_row: Last row number
         :param int last_col: Last column number
 
-        :rtype: list
+        :rtype: list or :class:`~gspread.cell.CellBlock`
 
         Example::
 
@@ -291,6 +347,10 @@ class Worksheet:
             >>> worksheet.range()
             [<Cell R1C1 'Hi mom'>, ...]
 
+            >>> # Numeric boundaries with a block of cells
+            >>> worksheet.range(1, 1, 7, 2, as_block=True)
+            <CellBlock R1C1 7x2>
+
         """
         range_label = absolute_range_name(self.title, name)
 
@@ -322,6 +382,9 @@ class Worksheet:
             cols=last_column,
         )
 
+        if as_block:
+            return CellBlock(rect_values, row_offset + 1, column_offset + 1)
+
         return [
             Cell(row=i + row_offset + 1, col=j + column_offset + 1, value=value)
             for i, row in enumerate(rect_values)
@@ -479,27 +542,7 @@ class Worksheet:
 
         keys = data[idx]
 
-        # if no given expected headers, expect all of them
-        if expected_headers is None:
-            expected_headers = keys
-
-        # keys must:
-        # - be uniques
-        # - be part of the complete header list
-        # - not contain extra headers
-        expected = set(expected_headers)
-        headers = set(keys)
-
-        # make sure they are uniques
-        if len(expected) != len(expected_headers):
-            raise GSpreadException("the given 'expected_headers' are not uniques")
-
-        if not expected & headers == expected:
-            raise GSpreadException(
-                "the given 'expected_headers' contains unknown headers: {}".format(
-                    expected - headers
-                )
-            )
+        _check_expected_headers(keys, expected_headers)
 
         if numericise_ignore == ["all"]:
             values = data[idx + 1 :]
@@ -517,10 +560,241 @@ class Worksheet:
 
         return [dict(zip(keys, row)) for row in values]
 
-    def get_all_cells(self):
-        """Returns a list of all `Cell` of the current sheet."""
+    def get_record_columns(
+        self,
+        empty2zero=False,
+        head=1,
+        default_blank="",
+        allow_underscores_in_numeric_literals=False,
+        numericise_ignore=[],
+        value_render_option=None,
+        expected_headers=None,
+        dataframe=False,
+    ):
+        """Returns the same records as :meth:`get_all_records`, by column:
+        a dictionary mapping each key of the head row to a NumPy array of
+        the column values, or a :class:`pandas.DataFrame`.
+
+        Each column is numericised at once: it becomes an ``int64`` or
+        ``float64`` array when all its values are numbers (a column mixing
+        integers and decimals is a ``float64`` array), an ``object`` array
+        holding the same values as :meth:`get_all_records` otherwise.
+        See :func:`gspread.columnar.numericise_column`.
+
+        Requires NumPy, and pandas when ``dataframe`` is set.
+
+        :param bool dataframe: (optional) Return a :class:`pandas.DataFrame`
+            instead of a dictionary.
+
+        The other parameters are the ones of :meth:`get_all_records`.
+
+        Example::
+
+            >>> worksheet.get_record_columns()
+            {'name': array(['a', 'b'], dtype=object), 'score': array([1, 2])}
+        """
+        idx = head - 1
+
+        data = self.get_all_values(value_render_option=value_render_option)
+
+        keys = data[idx] if len(data) > idx else []
+
+        _check_expected_headers(keys, expected_headers)
+
+        columns = records_to_columns(
+            keys,
+            data[idx + 1 :],
+            empty2zero,
+            default_blank,
+            allow_underscores_in_numeric_literals,
+            numericise_ignore,
+        )
+
+        if dataframe:
+            return columns_to_dataframe(columns)
+
+        return columns
+
+    def get_records(self, schema, head=1):
+        """Returns the rows below the head row as typed records.
+
+        The columns to read and their types are declared by ``schema``,
+        either a dict mapping column names to types, or a dataclass. The
+        supported types are ``int``, ``float``, :class:`~decimal.Decimal`,
+        ``bool``, ``str``, :class:`~datetime.date`,
+        :class:`~datetime.datetime` and :class:`~datetime.time`; any other
+        callable is called with the raw cell value.
+
+        Values are fetched unformatted, with dates and times as serial
+        numbers, so numbers and dates are decoded the same way whatever
+        the cell format or the spreadsheet locale. The converter of each
+        column is chosen once for all the rows. Blank cells are ``None``,
+        or ``""`` in ``str`` columns.
+
+        :param schema: A dict mapping column names to types, records are
+            then named tuples with the fields in the same order. A column
+            whose name is not a valid field name (e.g. ``"Unit price"``,
+            ``"2023"`` or ``"class"``) is renamed ``_<position>``, e.g.
+            ``_1`` for the second column of the schema; the ``_columns``
+            attribute of the record type maps each column to its field.
+            Or a dataclass, records are then instances of it; a field can
+            read a column with another name using
+            ``field(metadata={"column": "Column name"})``.
+        :param int head: (optional) Determines which row to use as keys,
+            starting from 1 following the numeration of the spreadsheet.
+        :rtype: list
+
+        Example::
+
+            @dataclass
+            class Order:
+                id: int
+                amount: Decimal
+                placed: datetime.date
+                note: str = field(metadata={"column": "Note"})
+
+            orders = worksheet.get_records(Order)
+
+            totals = worksheet.get_records({"id": int, "total": float})
+            totals[0].total
+        """
+        idx = head - 1
+
+        data = self.get(
+            value_render_option=ValueRenderOption.unformatted,
+            date_time_render_option=DateTimeOption.serial_number,
+        )
+
+        if len(data) <= idx:
+            return []
+
+        # unformatted headers can be numbers or dates, schemas name them as text
+        decoder = RecordDecoder(schema, [str(key) for key in data[idx]])
 
-        return self.range()
+        return [
+            decoder.decode(row, row_number)
+            for row_number, row in enumerate(data[idx + 1 :], head + 1)
+        ]
+
+    def get_all_cells(self, as_block=False):
+        """Returns a list of all `Cell` of the current sheet.
+
+        :param bool as_block: (optional) Return a
+            :class:`~gspread.cell.CellBlock` instead of a list,
+            see :meth:`range`.
+        """
+
+        return self.range(as_block=as_block)
+
+    def iter_rows(
+        self, chunk_rows=1000, value_render_option=None, date_time_render_option=None
+    ):
+        """Yields the rows of the sheet, fetching ``chunk_rows`` rows per
+        request.
+
+        Unlike :meth:`get_all_values`, the sheet is never held in memory as
+        a whole, which makes it suitable for very large sheets. The rows
+        are read up to :attr:`row_count`, as known when the worksheet was
+        fetched.
+
+        Each row is a list of values, empty trailing cells are not
+        included so rows can have different lengths. Empty rows are
+        yielded as empty lists, except the trailing ones.
+
+        :param int chunk_rows: (optional) Number of rows fetched per request.
+        :param str value_render_option: (optional) How values should be
+            represented in the output. See `ValueRenderOption`_ in
+            the Sheets API.
+        :param str date_time_render_option: (optional) How dates, times, and
+            durations should be represented in the output.
+
+        .. _ValueRenderOption: https://developers.google.com/sheets/api/reference/rest/v4/ValueRenderOption
+
+        Example::
+
+            for row in worksheet.iter_rows(chunk_rows=5000):
+                process(row)
+        """
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be a positive number")
+
+        # empty rows are only yielded once a non empty row follows them
+        blank_rows = 0
+
+        for start in range(1, self.row_count + 1, chunk_rows):
+            end = min(start + chunk_rows - 1, self.row_count)
+
+            values = self.get(
+                "{}:{}".format(start, end),
+                value_render_option=value_render_option,
+                date_time_render_option=date_time_render_option,
+            )
+
+            for row in values:
+                if not row:
+                    blank_rows += 1
+                    continue
+
+                for _ in range(blank_rows):
+                    yield []
+                blank_rows = 0
+
+                yield row
+
+            # the API does not return the trailing empty rows of a range
+            blank_rows += end - start + 1 - len(values)
+
+    def iter_records(
+        self,
+        chunk_rows=1000,
+        empty2zero=False,
+        head=1,
+        default_blank="",
+        allow_underscores_in_numeric_literals=False,
+        numericise_ignore=[],
+        value_render_option=None,
+        expected_headers=None,
+    ):
+        """Yields the records of the sheet as dictionaries, fetching
+        ``chunk_rows`` rows per request.
+
+        This is the streaming version of :meth:`get_all_records`, the
+        parameters have the same meaning, see it for details. Rows are
+        read with :meth:`iter_rows`.
+
+        :param int chunk_rows: (optional) Number of rows fetched per request.
+
+        Example::
+
+            for record in worksheet.iter_records(chunk_rows=5000):
+                process(record["Name"], record["Score"])
+        """
+        rows = self.iter_rows(chunk_rows, value_render_option=value_render_option)
+
+        for _ in range(head - 1):
+            if next(rows, None) is None:
+                return
+
+        keys = next(rows, None)
+
+        if keys is None:
+            return
+
+        _check_expected_headers(keys, expected_headers)
+
+        for row in rows:
+            row = rightpad(row, len(keys))
+
+            if numericise_ignore != ["all"]:
+                row = numericise_all(
+                    row,
+                    empty2zero,
+                    default_blank,
+                    allow_underscores_in_numeric_literals,
+                    numericise_ignore,
+                )
+
+            yield dict(zip(keys, row))
 
     @accepted_kwargs(
         major_dimension=None,
@@ -609,7 +883,9 @@ class Worksheet:
 
         return data
 
-    def update_cells(self, cell_list, value_input_option=ValueInputOption.raw):
+    def update_cells(
+        self, cell_list, value_input_option=ValueInputOption.raw, sparse=False
+    ):
         """Updates many cells at once.
 
         :param list cell_list: List of :class:`gspread.cell.Cell` objects to update.
@@ -631,6 +907,16 @@ class Worksheet:
 
         .. _ValueInputOption: https://developers.google.com/sheets/api/reference/rest/v4/ValueInputOption
 
+        :param bool sparse: (optional) Whether or not to send the cells as
+            several ranges covering exactly those cells, with
+            :meth:`batch_update`, instead of a single rectangle padded with
+            ``None``. Smaller for cells spread over the worksheet.
+            Defaults to ``False``.
+
+        :returns: the response of ``values.update``, or of
+            ``values.batchUpdate`` if ``sparse`` is ``True``. None if
+            ``cell_list`` is empty, nothing is sent then.
+
         Example::
 
             # Select a range
@@ -642,12 +928,23 @@ class Worksheet:
             # Update in batch
             worksheet.update_cells(cell_list)
         """
-        values_rect = cell_list_to_rect(cell_list)
+        if not cell_list:
+            return None
 
-        start = rowcol_to_a1(
-            min(c.row for c in cell_list), min(c.col for c in cell_list)
-        )
-        end = rowcol_to_a1(max(c.row for c in cell_list), max(c.col for c in cell_list))
+        if isinstance(cell_list, CellBlock):
+            values_rect = cell_list.values
+            start = rowcol_to_a1(cell_list.first_row, cell_list.first_col)
+            end = rowcol_to_a1(
+                cell_list.first_row + cell_list.row_count - 1,
+                cell_list.first_col + cell_list.col_count - 1,
+            )
+        elif sparse:
+            return self._update_cells_sparse(cell_list, value_input_option)
+        else:
+            bounds = cell_list_bounds(cell_list)
+            values_rect = cell_list_to_rect(cell_list, bounds)
+            start = rowcol_to_a1(bounds[0], bounds[1])
+            end = rowcol_to_a1(bounds[2], bounds[3])
 
         range_name = absolute_range_name(self.title, "{}:{}".format(start, end))
 
@@ -659,6 +956,24 @@ class Worksheet:
 
         return data
 
+    def _update_cells_sparse(self, cell_list, value_input_option):
+        data = [
+            {
+                "range": "{}:{}".format(
+                    rowcol_to_a1(first_row, first_col), rowcol_to_a1(last_row, last_col)
+                ),
+                "values": values,
+            }
+            for (
+                first_row,
+                first_col,
+                last_row,
+                last_col,
+            ), values in cell_list_to_rects(cell_list)
+        ]
+
+        return self.batch_update(data, value_input_option=value_input_option)
+
     @accepted_kwargs(
         major_dimension=None,
         value_render_option=None,
@@ -718,6 +1033,7 @@ class Worksheet:
         major_dimension=None,
         value_render_option=None,
         date_time_render_option=None,
+        max_workers=None,
     )
     def batch_get(self, ranges, **kwargs):
         """Returns one or more ranges of values from the sheet.
@@ -737,6 +1053,10 @@ class Worksheet:
             value_render_option is ``ValueRenderOption.formatted``. The default dateTime
             render option is ``SERIAL_NUMBER``.
 
+        :param int max_workers: (optional) Maximum number of requests sent
+            at the same time when the ranges do not fit in a single request,
+            see :meth:`~gspread.spreadsheet.Spreadsheet.values_batch_get`.
+
         .. versionadded:: 3.3
 
         Examples::
@@ -754,7 +1074,9 @@ class Worksheet:
             }
         )
 
-        response = self.spreadsheet.values_batch_get(ranges=ranges, params=params)
+        response = self.spreadsheet.values_batch_get(
+            ranges=ranges, params=params, max_workers=kwargs["max_workers"]
+        )
 
         return [ValueRange.from_json(x) for x in response["valueRanges"]]
 
@@ -972,11 +1294,12 @@ class Worksheet:
             "requests": [],
         }
 
-        for format in formats:
-            range_name = format["range"]
-            cell_format = format["format"]
+        grid_ranges = a1_ranges_to_grid_ranges(
+            [format["range"] for format in formats], self.id
+        )
 
-            grid_range = a1_range_to_grid_range(range_name, self.id)
+        for format, grid_range in zip(formats, grid_ranges):
+            cell_format = format["format"]
 
             fields = "userEnteredFormat(%s)" % ",".join(cell_format.keys())
 
@@ -1070,7 +1393,9 @@ class Worksheet:
             ]
         }
 
-        return self.spreadsheet.batch_update(body)
+        response = self.spreadsheet.batch_update(body)
+        self._properties["gridProperties"].update(grid_properties)
+        return response
 
     # TODO(post Python 2): replace the method signature with
     # def sort(self, *specs, range=None):
@@ -1828,6 +2153,29 @@ class Worksheet:
         """
         return list(self._finder(filter, query, case_sensitive, in_row, in_column))
 
+    def build_index(self, columns=None, case_sensitive=True):
+        """Builds an index of the values of the sheet, to find cells
+        without fetching the sheet for every lookup.
+
+        The index is rebuilt on the next lookup after values are written
+        through this spreadsheet, see :class:`~gspread.index.CellIndex`.
+
+        :param columns: (optional) One-based column numbers or column
+            letters of the columns to index. Defaults to all the columns.
+        :type columns: list
+        :param bool case_sensitive: (optional) comparison is case sensitive if
+            set to True, case insensitive otherwise. Default is True.
+        :rtype: :class:`~gspread.index.CellIndex`
+
+        Example::
+
+            index = worksheet.build_index(columns=["A"])
+
+            for key in keys:
+                cell = index.find(key)
+        """
+        return CellIndex(self, columns, case_sensitive)
+
     def freeze(self, rows=None, cols=None):
         """Freeze rows and/or columns on the worksheet.
 
@@ -2032,7 +2380,7 @@ class Worksheet:
             e.g. 'D7'.
         """
         absolute_cell = absolute_range_name(self.title, cell)
-        url = SPREADSHEET_URL % (self.spreadsheet.id)
+        url = self.client.urls.spreadsheet % (self.spreadsheet.id)
         params = {"ranges": absolute_cell, "fields": "sheets/data/rowData/values/note"}
         response = self.client.request("get", url, params=params)
         response.raise_for_status()
@@ -0,0 +1,119 @@
+import asyncio
+import threading
+
+import gspread
+
+from .conftest import StubClientTest, stub_response
+
+METADATA = {
+    "properties": {"title": "async"},
+    "sheets": [
+        {
+            "properties": {
+                "sheetId": 0,
+                "title": "Sheet1",
+                "index": 0,
+                "gridProperties": {"rowCount": 10, "columnCount": 3},
+            }
+        }
+    ],
+}
+
+
+class AsyncClientTest(StubClientTest):
+
+    """Offline tests for gspread.AsyncClient."""
+
+    def setUp(self):
+        self.threads = set()
+        super().setUp()
+
+    def handle(self, method, url, **kwargs):
+        self.threads.add(threading.get_ident())
+        if "/values/" in url and method == "GET":
+            return stub_response(
+                json_body={
+                    "range": "Sheet1!A1:B1",
+                    "majorDimension": "ROWS",
+                    "values": [[url.split("/")[5], "x"]],
+                }
+            )
+        if "/values/" in url:
+            return stub_response(json_body={"updatedCells": 1})
+        return stub_response(json_body=METADATA)
+
+    def test_open_many_concurrently(self):
+        async def main():
+            async with gspread.AsyncClient(self.client, max_workers=4) as agc:
+                spreadsheets = await asyncio.gather(
+                    *(agc.open_by_key("key%d" % i) for i in range(8))
+                )
+                sheets = await asyncio.gather(
+                    *(s.get_worksheet(0) for s in spreadsheets)
+                )
+                return await asyncio.gather(*(s.get("A1:B1") for s in sheets))
+
+        results = asyncio.run(main())
+
+        self.assertEqual([r.first() for r in results], ["key%d" % i for i in range(8)])
+        self.assertNotIn(threading.get_ident(), self.threads)
+
+    def test_update(self):
+        async def main():
+            agc = gspread.AsyncClient(self.client)
+            spreadsheet = await agc.open_by_key("key")
+            worksheet = await spreadsheet.get_worksheet(0)
+            result = await worksheet.update("A1", [[1]])
+            agc.close()
+            return worksheet, result
+
+        worksheet, result = asyncio.run(main())
+
+        self.assertIsInstance(worksheet, gspread.AsyncWorksheet)
+        self.assertEqual(worksheet.title, "Sheet1")
+        self.assertEqual(result, {"updatedCells": 1})
+        self.assertEqual(self.session.calls[-1][0], "PUT")
+
+    def test_aclose_does_not_block_the_loop(self):
+        release = threading.Event()
+        handler = self.session.handler
+
+        def blocked_handler(method, url, **kwargs):
+            # the loop sets the event while the client is closing
+            self.assertTrue(release.wait(5))
+            return handler(method, url, **kwargs)
+
+        self.session.handler = blocked_handler
+
+        async def main():
+            async with gspread.AsyncClient(self.client) as agc:
+                opening = asyncio.ensure_future(agc.open_by_key("key"))
+                await asyncio.sleep(0.05)
+
+            # still running while __aexit__ waits for the request
+            return opening
+
+        async def run():
+            task = asyncio.ensure_future(main())
+            await asyncio.sleep(0.1)
+            self.assertFalse(task.done())
+            release.set()
+            opening = await task
+            return await opening
+
+        spreadsheet = asyncio.run(run())
+        self.assertEqual(spreadsheet.title, "async")
+
+    def test_lazy_title(self):
+        async def main():
+            async with gspread.AsyncClient(self.client) as agc:
+                spreadsheet = await agc.open_by_key("key", lazy=True)
+
+                self.assertIsNone(spreadsheet.title)
+                self.assertIn("None", repr(spreadsheet))
+                self.assertEqual(self.session.calls, [])
+
+                await spreadsheet.refresh()
+                return spreadsheet
+
+        self.assertEqual(asyncio.run(main()).title, "async")
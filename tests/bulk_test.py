@@ -0,0 +1,155 @@
+import json
+import os
+import tempfile
+
+import gspread
+
+from .conftest import StubClientTest, stub_response
+
+METADATA = {
+    "properties": {"title": "bulk"},
+    "sheets": [
+        {
+            "properties": {
+                "sheetId": 0,
+                "title": "Sheet1",
+                "index": 0,
+                "gridProperties": {"rowCount": 10, "columnCount": 3},
+            }
+        },
+    ],
+}
+
+
+class BulkWriterTest(StubClientTest):
+
+    """Offline tests for BulkWriter."""
+
+    def setUp(self):
+        self.fail_after = None
+        super().setUp()
+        self.spreadsheet = gspread.Spreadsheet(self.client, {"id": "abc"})
+        self.worksheet = self.spreadsheet.sheet1
+
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.checkpoint_file = os.path.join(tmp_dir.name, "upload.json")
+
+    def handle(self, method, url, **kwargs):
+        if method == "GET":
+            return stub_response(json_body=METADATA)
+        if url.endswith("values:batchUpdate"):
+            sent = len(self.value_writes())
+            if self.fail_after is not None and sent > self.fail_after:
+                return stub_response(500, {"error": {"code": 500}})
+            return stub_response(json_body={})
+        return stub_response(json_body={"replies": [{}]})
+
+    def value_writes(self):
+        return [
+            kwargs["json"]
+            for method, url, kwargs in self.session.calls
+            if url.endswith("values:batchUpdate")
+        ]
+
+    def resizes(self):
+        return [
+            kwargs["json"]["requests"][0]["updateSheetProperties"]
+            for method, url, kwargs in self.session.calls
+            if url.endswith("abc:batchUpdate")
+        ]
+
+    def test_chunks(self):
+        rows = [[i, "x"] for i in range(25)]
+        writer = gspread.BulkWriter(self.worksheet, start_row=2, chunk_rows=10)
+
+        self.assertEqual(writer.write(rows), 25)
+
+        writes = self.value_writes()
+        self.assertEqual(
+            [w["data"][0]["range"] for w in writes],
+            ["'Sheet1'!A2", "'Sheet1'!A12", "'Sheet1'!A22"],
+        )
+        self.assertEqual([row for w in writes for row in w["data"][0]["values"]], rows)
+        self.assertEqual(writes[0]["valueInputOption"], "RAW")
+
+    def test_chunks_bounded_by_payload_size(self):
+        rows = [["x" * 40] for i in range(6)]
+        writer = gspread.BulkWriter(self.worksheet, max_payload_size=100)
+        writer.write(rows)
+
+        for write in self.value_writes():
+            self.assertLessEqual(len(json.dumps(write["data"][0]["values"])), 100)
+        self.assertEqual(len(self.value_writes()), 3)
+
+    def test_resizes_once_ahead(self):
+        writer = gspread.BulkWriter(self.worksheet, chunk_rows=10)
+        writer.write([[1, 2, 3, 4]] * 25)
+
+        self.assertEqual(
+            [r["properties"]["gridProperties"] for r in self.resizes()],
+            [{"rowCount": 25, "columnCount": 4}],
+        )
+        self.assertEqual(
+            self.resizes()[0]["fields"],
+            "gridProperties/rowCount,gridProperties/columnCount",
+        )
+        self.assertEqual(self.worksheet.row_count, 25)
+        self.assertEqual(self.worksheet.col_count, 4)
+
+    def test_grows_unsized_iterables(self):
+        writer = gspread.BulkWriter(self.worksheet, chunk_rows=8)
+        writer.write([i] for i in range(20))
+
+        self.assertEqual(
+            [r["properties"]["gridProperties"] for r in self.resizes()],
+            [{"rowCount": 16}, {"rowCount": 20}],
+        )
+
+    def test_total_rows(self):
+        writer = gspread.BulkWriter(self.worksheet, chunk_rows=8)
+        writer.write(([i] for i in range(20)), total_rows=20)
+
+        self.assertEqual(
+            [r["properties"]["gridProperties"] for r in self.resizes()],
+            [{"rowCount": 20}],
+        )
+
+    def test_resume_from_checkpoint(self):
+        rows = [[i] for i in range(10)]
+        self.fail_after = 1
+
+        writer = gspread.BulkWriter(
+            self.worksheet, chunk_rows=4, checkpoint_file=self.checkpoint_file
+        )
+        with self.assertRaises(gspread.exceptions.APIError):
+            writer.write(rows)
+        self.assertEqual(writer.committed_rows, 4)
+
+        with open(self.checkpoint_file) as f:
+            self.assertEqual(json.load(f)["committed_rows"], 4)
+
+        self.fail_after = None
+        self.session.calls.clear()
+
+        writer = gspread.BulkWriter(
+            self.worksheet, chunk_rows=4, checkpoint_file=self.checkpoint_file
+        )
+        self.assertEqual(writer.committed_rows, 4)
+        self.assertEqual(writer.write(rows), 10)
+
+        writes = self.value_writes()
+        self.assertEqual(
+            [w["data"][0]["range"] for w in writes], ["'Sheet1'!A5", "'Sheet1'!A9"]
+        )
+        self.assertEqual(writes[0]["data"][0]["values"][0], [4])
+
+    def test_checkpoint_of_another_upload(self):
+        gspread.BulkWriter(self.worksheet, checkpoint_file=self.checkpoint_file).write(
+            [[1]]
+        )
+
+        with self.assertRaises(gspread.exceptions.GSpreadException):
+            gspread.BulkWriter(
+                self.worksheet, start_row=5, checkpoint_file=self.checkpoint_file
+            )
@@ -0,0 +1,123 @@
+import unittest
+
+import gspread
+from gspread.fake import FakeGoogleAPI
+
+VALUES = ("GET", "v4/spreadsheets/{id}/values/{range}")
+VERSION = ("GET", "drive/v3/files/{id}")
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    """Tests for gspread.cache, against the fake API."""
+
+    def setUp(self):
+        self.now = 0
+        self.api = FakeGoogleAPI()
+        self.key = self.api.create_spreadsheet(values=[["a", "b"], ["1", "2"]])
+        self.cache = gspread.ResponseCache(ttl=30, clock=lambda: self.now)
+        self.gc = gspread.Client(None, session=self.api.session(), cache=self.cache)
+        self.sheet = self.gc.open_by_key(self.key).sheet1
+        self.api.requests.clear()
+
+    def count(self, request):
+        return self.api.requests.count(request)
+
+    def test_ttl(self):
+        for _ in range(3):
+            self.assertEqual(self.sheet.get_all_values(), [["a", "b"], ["1", "2"]])
+
+        self.assertEqual(self.api.requests, [VALUES])
+        self.assertEqual(self.cache.stats()["hits"], 2)
+
+    def test_validation(self):
+        self.sheet.get_all_values()
+
+        # the version is unknown yet: fetched along with the values
+        self.now = 30
+        self.sheet.get_all_values()
+        self.assertEqual(self.api.requests, [VALUES, VERSION, VALUES])
+
+        # unchanged: only the version is fetched
+        self.now = 60
+        self.assertEqual(self.sheet.get_all_values(), [["a", "b"], ["1", "2"]])
+        self.assertEqual(self.api.requests, [VALUES, VERSION, VALUES, VERSION])
+        self.assertEqual(self.cache.stats()["validated_hits"], 1)
+
+        # changed by another client
+        other = gspread.Client(None, session=self.api.session())
+        other.open_by_key(self.key).sheet1.update("A1", [["changed"]])
+
+        self.sheet.get_all_values()
+        self.assertEqual(self.count(VALUES), 2)
+
+        self.now = 90
+        self.assertEqual(self.sheet.get_all_values()[0], ["changed", "b"])
+        self.assertEqual(self.count(VALUES), 3)
+
+    def test_validated_response_not_served_past_ttl(self):
+        self.sheet.get("A1")
+        self.now = 30
+        self.sheet.get("A1")
+        self.now = 59
+        self.sheet.get("B1")
+        # the version is checked again at 60, before the change
+        self.now = 60
+        self.sheet.get("A1")
+
+        other = gspread.Client(None, session=self.api.session())
+        other.open_by_key(self.key).sheet1.update("B1", [["changed"]])
+
+        # B1 is validated by the version checked at 60...
+        self.now = 89
+        self.assertEqual(self.sheet.get("B1"), [["b"]])
+        # ...so it is fresh until 90, not 30 seconds after the validation
+        self.now = 90
+        self.assertEqual(self.sheet.get("B1"), [["changed"]])
+
+    def test_invalidated_by_writes(self):
+        self.sheet.get_all_values()
+        self.sheet.update("B2", [["3"]])
+
+        self.assertEqual(self.sheet.get_all_values(), [["a", "b"], ["1", "3"]])
+        self.assertEqual(self.count(VALUES), 2)
+
+    def test_file_listing(self):
+        self.gc.list_spreadsheet_files()
+        self.gc.list_spreadsheet_files()
+        self.assertEqual(self.count(("GET", "drive/v3/files")), 1)
+
+        self.gc.create("New")
+
+        self.assertEqual(len(self.gc.list_spreadsheet_files()), 2)
+        self.assertEqual(self.count(("GET", "drive/v3/files")), 2)
+
+    def test_file_listing_behind_a_proxy(self):
+        urls = gspread.APIUrls(
+            sheets_url="https://proxy.example.com/sheets-api/",
+            drive_url="https://proxy.example.com/drive-api/",
+        )
+        gc = gspread.Client(
+            None, session=self.api.session(urls), urls=urls, cache=self.cache
+        )
+
+        gc.list_spreadsheet_files()
+        gc.create("New")
+
+        self.assertEqual(len(gc.list_spreadsheet_files()), 2)
+
+    def test_eviction(self):
+        self.cache.max_bytes = 300
+
+        for row in range(1, 11):
+            self.sheet.get("A{}".format(row))
+
+        stats = self.cache.stats()
+        self.assertLessEqual(stats["size"], 300)
+        self.assertGreater(stats["evictions"], 0)
+
+        # the most recent responses are kept
+        self.sheet.get("A10")
+        self.assertEqual(self.count(VALUES), 10)
+        self.sheet.get("A1")
+        self.assertEqual(self.count(VALUES), 11)
@@ -1,6 +1,9 @@
+import unittest
+
 import pytest
 
 import gspread
+from gspread.cell import CellBlock
 
 from .conftest import GspreadTest
 
@@ -146,3 +149,46 @@ class CellTest(GspreadTest):
 
         # make sure that no ranges were returned
         self.assertEqual(named_range_dict, {})
+
+
+class CellBlockTest(unittest.TestCase):
+
+    """Offline tests for gspread.cell.CellBlock."""
+
+    def setUp(self):
+        self.block = CellBlock([["a", "b", "c"], ["d", "e", "f"]], 3, 2)
+
+    def test_cell_has_slots(self):
+        cell = gspread.Cell(1, 1, "a")
+        with self.assertRaises(AttributeError):
+            cell.extra = 1
+
+    def test_same_cells_as_a_list(self):
+        expected = [
+            gspread.Cell(row, col, value)
+            for row, values in enumerate([["a", "b", "c"], ["d", "e", "f"]], 3)
+            for col, value in enumerate(values, 2)
+        ]
+
+        self.assertEqual(len(self.block), 6)
+        self.assertEqual(list(self.block), expected)
+        self.assertEqual(self.block[4], expected[4])
+        self.assertEqual(self.block[-1], expected[-1])
+        self.assertEqual(self.block[1:3], expected[1:3])
+        self.assertEqual(self.block.cell(4, 2).address, "B4")
+        with self.assertRaises(IndexError):
+            self.block[6]
+        with self.assertRaises(IndexError):
+            self.block.cell(1, 1)
+
+    def test_cells_write_to_the_block(self):
+        self.block[0].value = "A"
+        self.block.cell(4, 4).value = "F"
+
+        self.assertEqual(self.block.values, [["A", "b", "c"], ["d", "e", "F"]])
+        self.assertEqual(self.block[5].value, "F")
+
+    def test_empty(self):
+        block = CellBlock([], 1, 1)
+        self.assertEqual(len(block), 0)
+        self.assertEqual(list(block), [])
@@ -1,8 +1,21 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+import requests
 
 import gspread
+from gspread.fake import FakeAPIError, FakeGoogleAPI
+from gspread.utils import ExportFormat
 
-from .conftest import GspreadTest
+from .conftest import GspreadTest, StubClientTest, StubSession, stub_response
 
 
 class ClientTest(GspreadTest):
@@ -76,3 +89,336 @@ class ClientTest(GspreadTest):
             error.exception.args[0]["message"], "Requested entity was not found."
         )
         self.assertEqual(error.exception.args[0]["status"], "NOT_FOUND")
+
+
+class ClientPoolTest(unittest.TestCase):
+
+    """Offline tests for the connection pool options of Client."""
+
+    def test_default_adapters(self):
+        session = requests.Session()
+        adapter = session.get_adapter("https://sheets.googleapis.com/v4/")
+
+        gspread.Client(None, session=session)
+
+        self.assertIs(session.get_adapter("https://sheets.googleapis.com/v4/"), adapter)
+
+    def test_mounted_adapter(self):
+        session = requests.Session()
+        gspread.Client(None, session=session, pool_maxsize=32, max_retries=3)
+
+        sheets = session.get_adapter("https://sheets.googleapis.com/v4/spreadsheets")
+        drive = session.get_adapter("https://www.googleapis.com/drive/v3/files")
+
+        self.assertIs(sheets, drive)
+        self.assertEqual(sheets._pool_maxsize, 32)
+        self.assertEqual(sheets.max_retries.total, 3)
+        self.assertIsNot(session.get_adapter("https://example.com/"), sheets)
+
+    def test_pool_stats(self):
+        session = requests.Session()
+        client = gspread.Client(None, session=session, pool_maxsize=4)
+        self.assertEqual(client.pool_stats(), {})
+
+        adapter = session.get_adapter("https://sheets.googleapis.com/")
+        pool = adapter.poolmanager.connection_from_url("https://sheets.googleapis.com/")
+        pool.pool.get()
+
+        self.assertEqual(
+            client.pool_stats(),
+            {
+                "sheets.googleapis.com": {
+                    "maxsize": 4,
+                    "in_use": 1,
+                    "idle": 0,
+                    "connections": 0,
+                    "requests": 0,
+                }
+            },
+        )
+
+
+class ConcurrencyProbe:
+
+    """A ``sleep`` for the fake API recording the peak number of requests
+    served at the same time."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = self.peak = 0
+
+    def __call__(self, delay):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        time.sleep(delay)
+        with self.lock:
+            self.current -= 1
+
+
+class ClientOpenManyTest(unittest.TestCase):
+
+    """Tests for Client.open_many and Client.openall, against the fake API."""
+
+    def setUp(self):
+        self.probe = ConcurrencyProbe()
+        self.api = FakeGoogleAPI(latency=0.02, sleep=self.probe)
+        self.gc = gspread.Client(None, session=self.api.session())
+        self.keys = [
+            self.api.create_spreadsheet("Sheet {}".format(i)) for i in range(8)
+        ]
+
+    def test_open_many(self):
+        results = list(self.gc.open_many(self.keys + ["missing"], max_workers=4))
+
+        self.assertEqual(len(results), 9)
+        opened = {r.key: r.spreadsheet for r in results if r.error is None}
+        self.assertEqual(
+            {key: s.title for key, s in opened.items()},
+            {key: "Sheet {}".format(i) for i, key in enumerate(self.keys)},
+        )
+
+        (failed,) = [r for r in results if r.error is not None]
+        self.assertEqual(failed.key, "missing")
+        self.assertIsNone(failed.spreadsheet)
+        self.assertIsInstance(failed.error, gspread.exceptions.APIError)
+
+        self.assertGreater(self.probe.peak, 1)
+        self.assertLessEqual(self.probe.peak, 4)
+
+    def test_open_many_stop_early(self):
+        for result in self.gc.open_many(self.keys, max_workers=1):
+            break
+
+        self.assertIsNone(result.error)
+        self.assertLess(len(self.api.requests), len(self.keys))
+
+    def test_openall_parallel(self):
+        sequential = [s.title for s in self.gc.openall()]
+        self.gc.metadata_cache.clear()
+        self.probe.peak = 0
+
+        spreadsheets = self.gc.openall(parallel=True, max_workers=4)
+
+        self.assertEqual([s.title for s in spreadsheets], sequential)
+        self.assertEqual(sorted(s.id for s in spreadsheets), sorted(self.keys))
+        self.assertGreater(self.probe.peak, 1)
+
+    def test_openall_parallel_partial_failure(self):
+        broken = set(self.keys[1::3])
+        get_spreadsheet = self.api._get_spreadsheet
+
+        def failing_get_spreadsheet(call):
+            if call.file_id in broken:
+                raise FakeAPIError(403, "The caller does not have permission")
+            return get_spreadsheet(call)
+
+        self.api._get_spreadsheet = failing_get_spreadsheet
+        listed = [f["id"] for f in self.gc.list_spreadsheet_files()]
+
+        with self.assertRaises(gspread.exceptions.SpreadsheetsNotOpened) as cm:
+            self.gc.openall(parallel=True, max_workers=4)
+
+        self.assertEqual(set(cm.exception.errors), broken)
+        for error in cm.exception.errors.values():
+            self.assertIsInstance(error, gspread.exceptions.APIError)
+        self.assertEqual(
+            [s.id for s in cm.exception.spreadsheets],
+            [key for key in listed if key not in broken],
+        )
+
+
+class ClientExportTest(unittest.TestCase):
+
+    """Tests for Client.export_to, against the fake API."""
+
+    def setUp(self):
+        self.api = FakeGoogleAPI()
+        self.gc = gspread.Client(None, session=self.api.session())
+        self.key = self.api.create_spreadsheet(
+            values=[[str(i), "value {}".format(i)] for i in range(100)]
+        )
+        self.expected = self.gc.export(self.key, ExportFormat.CSV)
+
+    def test_file_object(self):
+        file = io.BytesIO()
+        writes = []
+        write = file.write
+        file.write = lambda chunk: writes.append(len(chunk)) or write(chunk)
+
+        size = self.gc.export_to(self.key, file, ExportFormat.CSV, chunk_size=256)
+
+        self.assertEqual(file.getvalue(), self.expected)
+        self.assertEqual(size, len(self.expected))
+        self.assertGreater(len(writes), 1)
+        self.assertLessEqual(max(writes), 256)
+
+    def test_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "export.csv")
+
+            spreadsheet = self.gc.open_by_key(self.key)
+            size = spreadsheet.export_to(path, ExportFormat.CSV)
+
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), self.expected)
+            self.assertEqual(size, os.path.getsize(path))
+
+            with self.assertRaises(gspread.exceptions.APIError):
+                self.gc.export_to("missing", path, ExportFormat.CSV)
+
+        with self.assertRaises(gspread.exceptions.UnSupportedExportFormat):
+            self.gc.export_to(self.key, io.BytesIO(), "text/plain")
+
+    def test_not_cached(self):
+        cache = gspread.ResponseCache()
+        gc = gspread.Client(None, session=self.api.session(), cache=cache)
+
+        gc.export_to(self.key, io.BytesIO(), ExportFormat.CSV)
+
+        self.assertEqual(len(cache), 0)
+
+    def test_parallel(self):
+        files = [io.BytesIO() for _ in range(8)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sizes = list(
+                executor.map(
+                    lambda f: self.gc.export_to(self.key, f, ExportFormat.CSV), files
+                )
+            )
+
+        self.assertEqual(sizes, [len(self.expected)] * 8)
+        self.assertEqual({f.getvalue() for f in files}, {self.expected})
+
+
+class ClientCompressionTest(StubClientTest):
+
+    """Offline tests for the compression options of Client."""
+
+    def test_accept_gzip(self):
+        session_headers = dict(self.session.headers)
+        client = gspread.Client(None, session=self.session)
+        client.request("get", "https://sheets.googleapis.com/v4/spreadsheets/abc")
+        client.request(
+            "get",
+            "https://sheets.googleapis.com/v4/spreadsheets/abc",
+            headers={"User-Agent": "app (gzip)"},
+        )
+
+        (_, _, first), (_, _, second) = self.session.calls
+        headers = first["headers"]
+        # requests already accepts gzip by default
+        self.assertIn(
+            "gzip", headers.get("Accept-Encoding", session_headers["Accept-Encoding"])
+        )
+        self.assertTrue(headers["User-Agent"].endswith("(gzip)"))
+        self.assertIn("gspread/" + gspread.__version__, headers["User-Agent"])
+        self.assertIn(session_headers["User-Agent"], headers["User-Agent"])
+
+        # already set headers are kept as they are
+        self.assertEqual(second["headers"]["User-Agent"], "app (gzip)")
+
+        # the session is left as it is
+        self.assertEqual(dict(self.session.headers), session_headers)
+
+    def test_session_without_headers(self):
+        calls = []
+
+        class MinimalSession:
+            def get(self, url, **kwargs):
+                calls.append(kwargs)
+                return stub_response()
+
+        client = gspread.Client(None, session=MinimalSession())
+        client.request("get", "https://sheets.googleapis.com/v4/spreadsheets/abc")
+
+        self.assertEqual(calls[0]["headers"]["Accept-Encoding"], "gzip")
+
+    def test_compress_requests(self):
+        client = gspread.Client(None, session=self.session, compress_requests=True)
+        url = "https://sheets.googleapis.com/v4/spreadsheets/abc:batchUpdate"
+        body = {"requests": [{"value": "x" * 2000}]}
+
+        client.request("post", url, json={"requests": []})
+        client.request("post", url, json=body, headers={"X-Test": "1"})
+
+        (_, _, small), (_, _, large) = self.session.calls
+        self.assertEqual(small["json"], {"requests": []})
+        self.assertNotIn("Content-Encoding", small["headers"])
+
+        self.assertIsNone(large["json"])
+        self.assertEqual(json.loads(gzip.decompress(large["data"])), body)
+        self.assertEqual(large["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(large["headers"]["Content-Type"], "application/json")
+        self.assertEqual(large["headers"]["X-Test"], "1")
+
+    def test_list_spreadsheet_files_fields(self):
+        session = StubSession(
+            lambda method, url, **kwargs: stub_response(json_body={"files": []})
+        )
+        client = gspread.Client(None, session=session)
+
+        client.list_spreadsheet_files()
+        client.list_spreadsheet_files(fields="id,name")
+
+        (_, _, default), (_, _, masked) = session.calls
+        self.assertEqual(
+            default["params"]["fields"],
+            "kind,nextPageToken,files(id,name,createdTime,modifiedTime)",
+        )
+        self.assertEqual(
+            masked["params"]["fields"], "kind,nextPageToken,files(id,name)"
+        )
+
+
+class ClientUrlsTest(unittest.TestCase):
+
+    """Offline tests for the URL set of Client."""
+
+    def test_default_urls(self):
+        urls = gspread.APIUrls()
+
+        self.assertEqual(urls.spreadsheet, gspread.urls.SPREADSHEET_URL)
+        self.assertEqual(urls.spreadsheet_values, gspread.urls.SPREADSHEET_VALUES_URL)
+        self.assertEqual(
+            urls.spreadsheet_values_append, gspread.urls.SPREADSHEET_VALUES_APPEND_URL
+        )
+        self.assertEqual(urls.drive_files_api_v3, gspread.urls.DRIVE_FILES_API_V3_URL)
+        self.assertEqual(urls.worksheet_drive, gspread.urls.WORKSHEET_DRIVE_URL)
+        self.assertEqual(urls.hosts, gspread.urls.API_HOST_URLS)
+
+    def test_custom_urls(self):
+        session = StubSession(
+            lambda method, url, **kwargs: stub_response(
+                json_body={"properties": {"title": "proxied"}, "sheets": []}
+            )
+        )
+        urls = gspread.APIUrls(
+            sheets_url="http://proxy.local/sheets",
+            drive_url="http://proxy.local/drive/",
+        )
+        client = gspread.Client(None, session=session, urls=urls)
+
+        spreadsheet = client.open_by_key("abc")
+        spreadsheet.values_get("Sheet1!A1")
+        client.del_spreadsheet("abc")
+
+        self.assertEqual(
+            [url for _, url, _ in session.calls],
+            [
+                "http://proxy.local/sheets/v4/spreadsheets/abc",
+                "http://proxy.local/sheets/v4/spreadsheets/abc/values/Sheet1%21A1",
+                "http://proxy.local/drive/drive/v3/files/abc",
+            ],
+        )
+        self.assertEqual(spreadsheet.url, "https://docs.google.com/spreadsheets/d/abc")
+
+    def test_base_url(self):
+        client = gspread.Client(
+            None, session=requests.Session(), base_url="http://127.0.0.1:8080"
+        )
+        self.assertEqual(client.urls.hosts, ("http://127.0.0.1:8080/",))
+        self.assertEqual(
+            client.urls.drive_file % "abc", "http://127.0.0.1:8080/drive/v3/files/abc"
+        )
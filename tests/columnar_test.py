@@ -0,0 +1,92 @@
+import unittest
+
+import pytest
+
+from gspread import utils
+
+from .worksheet_test import StubGrid
+
+np = pytest.importorskip("numpy")
+
+from gspread.columnar import numericise_column  # noqa: E402
+
+
+class NumericiseColumnTest(unittest.TestCase):
+
+    """The vectorized conversion must give the values of numericise()."""
+
+    COLUMNS = [
+        ["1", "2", "-3", " 4 ", "1,000"],
+        ["1", "2.5", "1e3", "inf"],
+        ["1", "", "3"],
+        ["1.5", "", "x"],
+        ["a", "b", ""],
+        ["1_000", "2"],
+        ["_", "1"],
+        ["99999999999999999999", "1"],
+        [],
+    ]
+
+    def assert_same_values(self, column, **kwargs):
+        expected = [utils.numericise(v, **kwargs) for v in column]
+        result = numericise_column(column, **kwargs).tolist()
+
+        self.assertEqual(result, expected)
+        for value, expected_value in zip(result, expected):
+            if isinstance(expected_value, str) or expected_value is None:
+                self.assertIs(type(value), type(expected_value))
+
+    def test_same_values_as_numericise(self):
+        options = [
+            {},
+            {"empty2zero": True},
+            {"default_blank": None},
+            {"allow_underscores_in_numeric_literals": True},
+        ]
+        for column in self.COLUMNS:
+            for kwargs in options:
+                with self.subTest(column=column, **kwargs):
+                    self.assert_same_values(column, **kwargs)
+
+    def test_dtypes(self):
+        self.assertEqual(numericise_column(["1", "2"]).dtype, np.int64)
+        self.assertEqual(numericise_column(["1", "2.5"]).dtype, np.float64)
+        self.assertEqual(numericise_column(["1", ""], empty2zero=True).dtype, np.int64)
+        self.assertEqual(numericise_column(["1", ""]).dtype, object)
+        self.assertEqual(numericise_column(["1", "a"]).dtype, object)
+
+
+class WorksheetRecordColumnsTest(unittest.TestCase):
+
+    """Offline tests for Worksheet.get_record_columns."""
+
+    ROWS = [
+        ["name", "score", "code"],
+        ["a", "1", "007"],
+        ["b", "2.5", "008"],
+        ["c", "", "009"],
+    ]
+
+    def setUp(self):
+        self.sheet = StubGrid(self.ROWS, col_count=3).worksheet()
+
+    def test_columns(self):
+        columns = self.sheet.get_record_columns(numericise_ignore=[3])
+
+        self.assertEqual(list(columns), ["name", "score", "code"])
+        self.assertEqual(columns["name"].tolist(), ["a", "b", "c"])
+        self.assertEqual(columns["score"].tolist(), [1, 2.5, ""])
+        self.assertEqual(columns["code"].tolist(), ["007", "008", "009"])
+
+        records = self.sheet.get_all_records(numericise_ignore=[3])
+        for key, column in columns.items():
+            self.assertEqual(column.tolist(), [r[key] for r in records])
+
+    def test_dataframe(self):
+        pytest.importorskip("pandas")
+
+        df = self.sheet.get_record_columns(empty2zero=True, dataframe=True)
+
+        self.assertEqual(list(df.columns), ["name", "score", "code"])
+        self.assertEqual(df["score"].tolist(), [1.0, 2.5, 0.0])
+        self.assertEqual(df["code"].tolist(), [7, 8, 9])
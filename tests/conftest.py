@@ -1,8 +1,10 @@
 import itertools
+import json
 import os
 import unittest
 
 import pytest
+import requests
 import vcr
 from google.oauth2.credentials import Credentials as UserCredentials
 from google.oauth2.service_account import Credentials as ServiceAccountCredentials
@@ -91,3 +93,60 @@ def client():
         raise AssertionError
 
     return gc
+
+
+def stub_response(status_code=200, json_body=None, headers=None):
+    """Build a :class:`requests.Response` holding the given JSON body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"" if json_body is None else json.dumps(json_body).encode()
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    return response
+
+
+class StubSession(requests.Session):
+    """A session that never reaches the network.
+
+    Each request is recorded in ``calls`` and answered by ``handler``,
+    called with ``(method, url, **kwargs)`` and returning a response.
+    """
+
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method.upper(), url, kwargs))
+        return self.handler(method.upper(), url, **kwargs)
+
+
+class NoWaitRetryPolicy(gspread.RetryPolicy):
+    """A retry policy that retries right away."""
+
+    def sleep(self, delay):
+        pass
+
+
+class StubClientTest(unittest.TestCase):
+    """Base class of the offline tests.
+
+    ``self.client`` sends its requests to ``self.session``, a
+    :class:`StubSession` recording them and answering them with
+    :meth:`handle`.
+    """
+
+    def setUp(self):
+        self.session = StubSession(self.handle)
+        self.client = gspread.Client(
+            None, session=self.session, **self.client_options()
+        )
+
+    def client_options(self):
+        """Returns the keyword arguments of the client."""
+        return {}
+
+    def handle(self, method, url, **kwargs):
+        """Answers a request, with an empty JSON object by default."""
+        return stub_response(json_body={})
@@ -0,0 +1,179 @@
+import unittest
+
+import requests
+
+import gspread
+from gspread.fake import FakeGoogleAPI
+from gspread.utils import ExportFormat, ValueInputOption
+
+from .conftest import NoWaitRetryPolicy
+
+
+class FakeGoogleAPITest(unittest.TestCase):
+
+    """Tests for gspread.fake, through the whole client."""
+
+    def setUp(self):
+        self.api = FakeGoogleAPI()
+        self.gc = gspread.Client(None, session=self.api.session())
+
+    def test_create_and_open(self):
+        spreadsheet = self.gc.create("Orders")
+
+        self.assertEqual(self.gc.open("Orders").id, spreadsheet.id)
+        self.assertEqual(spreadsheet.sheet1.row_count, 1000)
+        self.assertEqual(
+            [f["name"] for f in self.gc.list_spreadsheet_files()], ["Orders"]
+        )
+
+        with self.assertRaises(gspread.SpreadsheetNotFound):
+            self.gc.open("Invoices")
+
+        self.gc.del_spreadsheet(spreadsheet.id)
+        self.assertEqual(self.gc.list_spreadsheet_files(), [])
+
+    def test_values(self):
+        key = self.api.create_spreadsheet(values=[["id", "total"], ["1", "9.5"]])
+        sheet = self.gc.open_by_key(key).sheet1
+
+        self.assertEqual(sheet.get_all_values(), [["id", "total"], ["1", "9.5"]])
+
+        sheet.update("B3:C3", [["12", "=B2+B3"]], raw=False)
+        sheet.append_rows([[2, 3.25], ["3", "TRUE"]], ValueInputOption.user_entered)
+        sheet.batch_update([{"range": "D1", "values": [["note"]]}])
+
+        self.assertEqual(
+            sheet.get_all_values(),
+            [
+                ["id", "total", "", "note"],
+                ["1", "9.5", "", ""],
+                ["", "12", "=B2+B3", ""],
+                ["2", "3.25", "", ""],
+                ["3", "TRUE", "", ""],
+            ],
+        )
+        self.assertEqual(
+            sheet.get_values("A4:B5", value_render_option="UNFORMATTED_VALUE"),
+            [[2, 3.25], [3, True]],
+        )
+        self.assertEqual(sheet.col_values(2), ["total", "9.5", "12", "3.25", "TRUE"])
+        self.assertEqual(sheet.acell("B3").value, "12")
+        self.assertEqual(sheet.find("note").address, "D1")
+
+        sheet.batch_clear(["A1:A2", "D:D"])
+        self.assertEqual(sheet.get_values("A1:D2"), [["", "total"], ["", "9.5"]])
+        sheet.clear()
+        self.assertEqual(sheet.get_all_values(), [])
+
+    def test_grid_limits(self):
+        key = self.api.create_spreadsheet(rows=2, cols=2)
+        sheet = self.gc.open_by_key(key).sheet1
+
+        with self.assertRaises(gspread.exceptions.APIError) as e:
+            sheet.update("B2", [[1, 2]])
+        self.assertEqual(e.exception.response.status_code, 400)
+
+        # appended rows grow the worksheet
+        sheet.append_rows([["a"], ["b"], ["c"]])
+        self.assertEqual(sheet.spreadsheet.sheet1.row_count, 3)
+        self.assertEqual(sheet.col_values(1), ["a", "b", "c"])
+
+    def test_worksheets(self):
+        spreadsheet = self.gc.open_by_key(self.api.create_spreadsheet())
+
+        orders = spreadsheet.add_worksheet("It's orders", rows=10, cols=5)
+        orders.update("A1", [["x", "y"]])
+        orders.resize(rows=20)
+        orders.update_title("Orders")
+        copy = spreadsheet.duplicate_sheet(orders.id, new_sheet_name="Copy")
+        spreadsheet.del_worksheet(spreadsheet.sheet1)
+
+        self.assertEqual(
+            [ws.title for ws in spreadsheet.worksheets()], ["Orders", "Copy"]
+        )
+        self.assertEqual(spreadsheet.worksheet("Orders").row_count, 20)
+        self.assertEqual(copy.get_all_values(), [["x", "y"]])
+
+        orders.insert_rows([["first"]], row=1)
+        orders.delete_columns(2)
+        self.assertEqual(orders.get_all_values(), [["first"], ["x"]])
+
+    def test_copy_and_export(self):
+        key = self.api.create_spreadsheet("Source", values=[["a", "b,c"], ["1"]])
+
+        copy = self.gc.copy(key, title="Target")
+        self.assertEqual(copy.title, "Target")
+
+        exported = self.gc.export(copy.id, ExportFormat.CSV)
+        self.assertEqual(exported, b'a,"b,c"\r\n1\r\n')
+
+    def test_fail_next(self):
+        key = self.api.create_spreadsheet()
+        self.api.fail_next(429, count=2)
+
+        with self.assertRaises(gspread.exceptions.APIError) as e:
+            self.gc.open_by_key(key)
+        self.assertEqual(e.exception.response.status_code, 429)
+
+        gc = gspread.Client(
+            None, session=self.api.session(), retry_policy=NoWaitRetryPolicy()
+        )
+        gc.open_by_key(key)
+
+        self.assertEqual(len(self.api.requests), 3)
+
+    def test_quota(self):
+        now = [0]
+        self.api = FakeGoogleAPI(read_quota=2, clock=lambda: now[0])
+        gc = gspread.Client(None, session=self.api.session())
+        key = self.api.create_spreadsheet()
+
+        spreadsheet = gc.open_by_key(key)
+        spreadsheet.sheet1.get_all_values()
+
+        with self.assertRaises(gspread.exceptions.APIError) as e:
+            spreadsheet.sheet1.get_all_values()
+        self.assertIn("Quota exceeded", str(e.exception))
+
+        now[0] = 60
+        spreadsheet.sheet1.get_all_values()
+
+    def test_latency(self):
+        delays = []
+        self.api = FakeGoogleAPI(
+            latency=lambda method, endpoint: 0.5 if method == "GET" else 1,
+            sleep=delays.append,
+        )
+        gc = gspread.Client(None, session=self.api.session())
+
+        gc.create("Orders")
+
+        self.assertEqual(delays, [1, 0.5])
+        self.assertEqual(
+            self.api.requests,
+            [("POST", "drive/v3/files"), ("GET", "v4/spreadsheets/{id}")],
+        )
+
+    def test_mount_custom_urls(self):
+        key = self.api.create_spreadsheet(values=[["a"]])
+
+        gc = gspread.Client(
+            None, session=requests.Session(), base_url="https://proxy.example.com/"
+        )
+        self.api.mount(gc)
+        self.assertEqual(gc.open_by_key(key).sheet1.get_all_values(), [["a"]])
+
+        urls = gspread.APIUrls(sheets_url="https://sheets.example.com/")
+        gc = gspread.Client(None, session=self.api.session(urls), urls=urls)
+        self.assertEqual(gc.open_by_key(key).sheet1.get_all_values(), [["a"]])
+
+    def test_server(self):
+        key = self.api.create_spreadsheet(values=[["a"]])
+
+        with self.api.serve() as server:
+            gc = gspread.Client(None, session=requests.Session(), base_url=server.url)
+            sheet = gc.open_by_key(key).sheet1
+            sheet.update("B1", [["b"]])
+
+            self.assertEqual(sheet.get_all_values(), [["a", "b"]])
+            self.assertTrue(server.url.startswith("http://127.0.0.1:"))
@@ -0,0 +1,149 @@
+import unittest
+
+import requests
+
+import gspread
+from gspread.metrics import RequestEvent, parse_endpoint
+
+from .conftest import NoWaitRetryPolicy, StubClientTest, StubSession, stub_response
+
+
+class ParseEndpointTest(unittest.TestCase):
+    def test_templates(self):
+        urls = {
+            "https://sheets.googleapis.com/v4/spreadsheets/abc": (
+                "v4/spreadsheets/{id}",
+                "abc",
+            ),
+            "https://sheets.googleapis.com/v4/spreadsheets/abc/values:batchGet": (
+                "v4/spreadsheets/{id}/values:batchGet",
+                "abc",
+            ),
+            "https://sheets.googleapis.com/v4/spreadsheets/abc:batchUpdate": (
+                "v4/spreadsheets/{id}:batchUpdate",
+                "abc",
+            ),
+            "https://sheets.googleapis.com/v4/spreadsheets/abc/values/%27S%27%21A1:append": (
+                "v4/spreadsheets/{id}/values/{range}:append",
+                "abc",
+            ),
+            "https://sheets.googleapis.com/v4/spreadsheets/abc/sheets/0:copyTo": (
+                "v4/spreadsheets/{id}/sheets/{sheet_id}:copyTo",
+                "abc",
+            ),
+            "https://www.googleapis.com/drive/v3/files/abc/permissions/42": (
+                "drive/v3/files/{id}/permissions/{permission_id}",
+                "abc",
+            ),
+            "https://www.googleapis.com/drive/v3/files": ("drive/v3/files", None),
+        }
+        for url, expected in urls.items():
+            with self.subTest(url=url):
+                self.assertEqual(parse_endpoint(url), expected)
+
+
+class ClientObserverTest(StubClientTest):
+    def setUp(self):
+        self.responses = []
+        self.events = []
+        super().setUp()
+
+    def client_options(self):
+        return {
+            "retry_policy": NoWaitRetryPolicy(jitter=False),
+            "observers": [self.events.append],
+        }
+
+    def handle(self, method, url, **kwargs):
+        return self.responses.pop(0)
+
+    def test_event(self):
+        self.responses = [
+            stub_response(503),
+            stub_response(json_body={"spreadsheetId": "abc"}),
+        ]
+        url = "https://sheets.googleapis.com/v4/spreadsheets/abc/values:batchUpdate"
+        self.client.request("post", url, json={"data": []})
+
+        (event,) = self.events
+        self.assertEqual(event.method, "POST")
+        self.assertEqual(event.endpoint, "v4/spreadsheets/{id}/values:batchUpdate")
+        self.assertEqual(event.spreadsheet_id, "abc")
+        self.assertEqual(event.status, 200)
+        self.assertEqual(event.bytes_received, len(b'{"spreadsheetId": "abc"}'))
+        self.assertEqual(event.retries, 1)
+        self.assertGreaterEqual(event.latency, 0)
+        self.assertIsNone(event.error)
+
+    def test_error_event(self):
+        self.responses = [stub_response(404, {"error": {"code": 404}})]
+        url = "https://sheets.googleapis.com/v4/spreadsheets/abc"
+
+        with self.assertRaises(gspread.exceptions.APIError):
+            self.client.request("get", url)
+
+        (event,) = self.events
+        self.assertEqual(event.status, 404)
+        self.assertEqual(event.retries, 0)
+        self.assertIsInstance(event.error, gspread.exceptions.APIError)
+
+    def test_connection_error_event(self):
+        def handler(method, url, **kwargs):
+            raise requests.exceptions.ConnectionError()
+
+        self.client.session = StubSession(handler)
+        self.client.retry_policy = None
+
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.client.request("get", "https://www.googleapis.com/drive/v3/files")
+
+        (event,) = self.events
+        self.assertIsNone(event.status)
+        self.assertIsInstance(event.error, requests.exceptions.ConnectionError)
+
+    def test_failing_observer(self):
+        def fail(event):
+            raise RuntimeError("broken exporter")
+
+        self.client.observers.insert(0, fail)
+        url = "https://sheets.googleapis.com/v4/spreadsheets/abc"
+
+        self.responses = [stub_response(json_body={"spreadsheetId": "abc"})]
+        with self.assertLogs("gspread.client", level="ERROR"):
+            response = self.client.request("get", url)
+        self.assertEqual(response.json(), {"spreadsheetId": "abc"})
+
+        self.responses = [stub_response(404, {"error": {"code": 404}})]
+        with self.assertLogs("gspread.client", level="ERROR"):
+            with self.assertRaises(gspread.exceptions.APIError):
+                self.client.request("get", url)
+
+        self.assertEqual(len(self.events), 2)
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    def event(self, latency, endpoint="v4/spreadsheets/{id}", error=None):
+        return RequestEvent("GET", endpoint, "abc", 200, 0, 100, latency, 0, 0, error)
+
+    def test_summary(self):
+        histogram = gspread.LatencyHistogram(buckets=[0.1, 1])
+
+        for latency in [0.05] * 90 + [0.5] * 8 + [2] * 2:
+            histogram(self.event(latency))
+        histogram(self.event(0.2, endpoint="v4/spreadsheets/{id}/values:batchGet"))
+
+        summary = histogram.summary()
+        stats = summary[("GET", "v4/spreadsheets/{id}")]
+
+        self.assertEqual(len(summary), 2)
+        self.assertEqual(stats["count"], 100)
+        self.assertEqual(stats["bytes_received"], 10000)
+        self.assertEqual(stats["buckets"], {0.1: 90, 1: 8, float("inf"): 2})
+        self.assertEqual(stats["p50"], 0.1)
+        self.assertEqual(stats["p95"], 1)
+        self.assertIsNone(stats["p99"])
+        self.assertEqual(stats["max_latency"], 2)
+        self.assertAlmostEqual(stats["mean_latency"], (4.5 + 4 + 4) / 100)
+
+        histogram.reset()
+        self.assertEqual(histogram.summary(), {})
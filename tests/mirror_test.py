@@ -0,0 +1,135 @@
+import gspread
+
+from .conftest import StubClientTest, stub_response
+
+METADATA = {
+    "properties": {"title": "mirror"},
+    "sheets": [
+        {
+            "properties": {
+                "sheetId": 0,
+                "title": "Sheet1",
+                "index": 0,
+                "gridProperties": {"rowCount": 4, "columnCount": 4},
+            }
+        },
+    ],
+}
+
+
+class WorksheetMirrorTest(StubClientTest):
+
+    """Offline tests for WorksheetMirror."""
+
+    VALUES = [
+        ["a", "b", "c", "d"],
+        ["e", "f", "g", "h"],
+        ["i", "j", "k", "l"],
+    ]
+
+    def setUp(self):
+        super().setUp()
+        self.worksheet = gspread.Spreadsheet(self.client, {"id": "abc"}).sheet1
+        self.mirror = gspread.WorksheetMirror(self.worksheet)
+
+    def handle(self, method, url, **kwargs):
+        if "/values/" in url:
+            value_range = {
+                "range": "Sheet1!A1:D3",
+                "majorDimension": "ROWS",
+                "values": self.VALUES,
+            }
+            return stub_response(json_body=value_range)
+        if method == "GET":
+            return stub_response(json_body=METADATA)
+        return stub_response(json_body={"replies": [{}]})
+
+    def writes(self):
+        return [
+            (url.rsplit("/", 1)[-1], kwargs["json"])
+            for method, url, kwargs in self.session.calls
+            if method != "GET"
+        ]
+
+    def test_read(self):
+        self.assertEqual(self.mirror.value(2, 3), "g")
+        self.assertEqual(self.mirror.acell_value("D1"), "d")
+        self.assertEqual(self.mirror.value(10, 10), "")
+        self.assertEqual(self.mirror.get_all_values(), self.VALUES)
+        self.assertEqual((self.mirror.row_count, self.mirror.col_count), (3, 4))
+
+        # not the cells of the last row or column
+        with self.assertRaises(ValueError):
+            self.mirror.value(0, 1)
+        with self.assertRaises(ValueError):
+            self.mirror.value(1, 0)
+
+    def test_flush_sends_changed_cells(self):
+        self.mirror.update_cell(1, 1, "A")
+        self.mirror.update_cell(1, 2, "B")
+        self.mirror.update_cell(2, 1, "E")
+        self.mirror.update_cell(2, 2, "F")
+        self.mirror.update_acell("D3", "L")
+        # unchanged values are not sent
+        self.mirror.update_cell(3, 1, "i")
+
+        self.assertEqual(
+            self.mirror.dirty_cells, [(1, 1), (1, 2), (2, 1), (2, 2), (3, 4)]
+        )
+
+        self.mirror.flush()
+
+        writes = self.writes()
+        self.assertEqual(len(writes), 1)
+        endpoint, body = writes[0]
+        self.assertEqual(endpoint, "values:batchUpdate")
+        self.assertEqual(body["valueInputOption"], "RAW")
+        self.assertEqual(
+            body["data"],
+            [
+                {"range": "'Sheet1'!A1:B2", "values": [["A", "B"], ["E", "F"]]},
+                {"range": "'Sheet1'!D3:D3", "values": [["L"]]},
+            ],
+        )
+        self.assertEqual(self.mirror.dirty_cells, [])
+        self.assertIsNone(self.mirror.flush())
+        self.assertEqual(len(self.writes()), 1)
+
+    def test_flush_grows_worksheet(self):
+        self.mirror.update_cell(6, 2, "x")
+        self.assertEqual(self.mirror.row_count, 6)
+        self.assertEqual(self.mirror.value(5, 4), "")
+
+        self.mirror.flush()
+
+        (resize, resize_body), (values, values_body) = self.writes()
+        self.assertEqual(
+            resize_body["requests"][0]["updateSheetProperties"]["properties"][
+                "gridProperties"
+            ],
+            {"rowCount": 6},
+        )
+        self.assertEqual(
+            values_body["data"], [{"range": "'Sheet1'!B6:B6", "values": [["x"]]}]
+        )
+
+    def test_writes_outside_keep_the_grid_rectangular(self):
+        self.mirror.update_cell(5, 6, "x")
+        self.mirror.update_cell(4, 1, "y")
+
+        self.assertEqual((self.mirror.row_count, self.mirror.col_count), (5, 6))
+        values = self.mirror.get_all_values()
+        self.assertEqual([len(row) for row in values], [6] * 5)
+        self.assertEqual(values[3], ["y", "", "", "", "", ""])
+        self.assertEqual(values[4][5], "x")
+
+        # the copy does not share the rows of the mirror
+        values[0][0] = "changed"
+        self.assertEqual(self.mirror.value(1, 1), self.VALUES[0][0])
+
+    def test_refresh_discards_changes(self):
+        self.mirror.update_cell(1, 1, "A")
+        self.mirror.refresh()
+
+        self.assertEqual(self.mirror.value(1, 1), "a")
+        self.assertEqual(self.mirror.dirty_cells, [])
@@ -0,0 +1,88 @@
+import threading
+import unittest
+
+import gspread
+from gspread.ratelimit import TokenBucket
+
+from .conftest import StubSession, stub_response
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, delay):
+        with self.lock:
+            self.now += delay
+
+
+class TokenBucketTest(unittest.TestCase):
+
+    """Offline tests for gspread.ratelimit.TokenBucket."""
+
+    def test_burst_then_wait(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, capacity=2, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(4)]
+
+        self.assertEqual(waits, [0, 0, 1, 1])
+        self.assertEqual(
+            bucket.stats(),
+            {"requests": 4, "waits": 2, "wait_time": 2, "max_wait": 1},
+        )
+
+    def test_refill(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, capacity=1, clock=clock, sleep=clock.sleep)
+
+        bucket.acquire()
+        clock.now += 5
+
+        self.assertEqual(bucket.acquire(), 0)
+
+    def test_threads_reserve_in_order(self):
+        # a frozen clock: no token comes back while the threads start
+        bucket = TokenBucket(
+            rate=1000, capacity=1, clock=lambda: 0.0, sleep=lambda delay: None
+        )
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(20)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(bucket.stats()["requests"], 20)
+        self.assertEqual(bucket.stats()["waits"], 19)
+        # each waiting thread reserved the next slot
+        self.assertAlmostEqual(bucket.stats()["max_wait"], 0.019)
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    """Offline tests for gspread.RateLimiter."""
+
+    def test_read_and_write_buckets(self):
+        clock = FakeClock()
+        limiter = gspread.RateLimiter(60, 60, clock=clock, sleep=clock.sleep)
+        session = StubSession(lambda method, url, **kwargs: stub_response())
+        clients = [
+            gspread.Client(None, session=session, rate_limiter=limiter)
+            for _ in range(2)
+        ]
+
+        for client in clients:
+            client.request("get", "https://example.com")
+            client.request("post", "https://example.com")
+
+        stats = limiter.stats()
+        self.assertEqual(stats["read"]["requests"], 2)
+        self.assertEqual(stats["write"]["requests"], 2)
+        # the second read waited one second, which refilled the write bucket
+        self.assertEqual(stats["read"]["wait_time"], 1)
+        self.assertEqual(stats["write"]["wait_time"], 0)
@@ -0,0 +1,159 @@
+import unittest
+
+import requests
+
+import gspread
+from gspread.exceptions import APIError
+
+from .conftest import StubClientTest, StubSession, stub_response
+
+
+def error_response(code, status=None, reason=None, headers=None):
+    error = {"code": code, "message": "error"}
+    if status:
+        error["status"] = status
+    if reason:
+        error["errors"] = [{"reason": reason}]
+    return stub_response(code, {"error": error}, headers)
+
+
+class RecordingPolicy(gspread.RetryPolicy):
+    def __init__(self, **kwargs):
+        super().__init__(jitter=False, **kwargs)
+        self.delays = []
+
+    def sleep(self, delay):
+        self.delays.append(delay)
+
+
+class RetryPolicyTest(unittest.TestCase):
+
+    """Offline tests for gspread.RetryPolicy."""
+
+    def test_classification(self):
+        policy = gspread.RetryPolicy()
+
+        self.assertTrue(policy.is_retryable(error_response(429)))
+        self.assertTrue(policy.is_retryable(error_response(503)))
+        self.assertTrue(
+            policy.is_retryable(error_response(403, reason="userRateLimitExceeded"))
+        )
+        self.assertFalse(
+            policy.is_retryable(error_response(403, reason="insufficientPermissions"))
+        )
+        self.assertFalse(policy.is_retryable(error_response(403, "PERMISSION_DENIED")))
+        self.assertFalse(policy.is_retryable(error_response(404, "NOT_FOUND")))
+        self.assertFalse(policy.is_retryable(stub_response(403)))
+
+    def test_backoff(self):
+        policy = gspread.RetryPolicy(initial_backoff=1, max_backoff=10, jitter=False)
+
+        self.assertEqual([policy.backoff(n) for n in range(6)], [1, 2, 4, 8, 10, 10])
+
+        policy = gspread.RetryPolicy(initial_backoff=1, max_backoff=10)
+        for n in range(6):
+            self.assertLessEqual(policy.backoff(n), 10)
+
+    def test_retry_after(self):
+        policy = gspread.RetryPolicy(jitter=False)
+        response = error_response(429, headers={"Retry-After": "30"})
+
+        self.assertEqual(policy.retry_after(response), 30)
+        self.assertEqual(policy.get_delay(0, 0, response), 30)
+
+    def test_limits(self):
+        policy = gspread.RetryPolicy(max_attempts=3, max_elapsed=10, jitter=False)
+        response = error_response(429)
+
+        self.assertEqual(policy.get_delay(0, 0, response), 1)
+        self.assertIsNone(policy.get_delay(2, 0, response))
+        self.assertIsNone(policy.get_delay(0, 9.5, response))
+
+
+class ClientRetryTest(StubClientTest):
+
+    """Offline tests for the retries done by gspread.Client."""
+
+    def handle(self, method, url, **kwargs):
+        response = next(self.responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def make_client(self, responses, policy):
+        self.responses = iter(responses)
+        self.session.calls.clear()
+        self.client.retry_policy = policy
+        return self.client
+
+    def test_retry_until_success(self):
+        policy = RecordingPolicy()
+        client = self.make_client(
+            [
+                error_response(429),
+                requests.exceptions.ConnectionError(),
+                stub_response(json_body={"ok": True}),
+            ],
+            policy,
+        )
+
+        response = client.request("get", "https://example.com")
+
+        self.assertEqual(response.json(), {"ok": True})
+        self.assertEqual(policy.delays, [1, 2])
+
+    def test_no_retry_on_permission_error(self):
+        policy = RecordingPolicy()
+        client = self.make_client([error_response(403, "PERMISSION_DENIED")], policy)
+
+        with self.assertRaises(APIError):
+            client.request("get", "https://example.com")
+        self.assertEqual(policy.delays, [])
+
+    def test_gives_up(self):
+        policy = RecordingPolicy(max_attempts=2)
+        client = self.make_client([error_response(500)] * 2, policy)
+
+        with self.assertRaises(APIError):
+            client.request("get", "https://example.com")
+        self.assertEqual(len(self.session.calls), 2)
+
+    def test_no_retry_of_unsafe_methods_after_timeout(self):
+        policy = RecordingPolicy()
+        client = self.make_client([requests.exceptions.Timeout()], policy)
+
+        with self.assertRaises(requests.exceptions.Timeout):
+            client.request("post", "https://example.com")
+        self.assertEqual(policy.delays, [])
+
+        # an error response proves the request was not applied
+        client = self.make_client(
+            [error_response(429), stub_response(json_body={})], policy
+        )
+        client.request("post", "https://example.com")
+        self.assertEqual(policy.delays, [1])
+
+    def test_retry_unsafe_methods_opt_in(self):
+        policy = RecordingPolicy(retry_unsafe_methods=True)
+        client = self.make_client(
+            [requests.exceptions.Timeout(), stub_response(json_body={})], policy
+        )
+
+        client.request("post", "https://example.com")
+        self.assertEqual(policy.delays, [1])
+
+    def test_failed_response_closed(self):
+        failed = error_response(503)
+        closed = []
+        failed.close = lambda: closed.append(True)
+        client = self.make_client(
+            [failed, stub_response(json_body={})], RecordingPolicy()
+        )
+
+        client.request("get", "https://example.com")
+        self.assertEqual(closed, [True])
+
+    def test_backoff_client_default_policy(self):
+        client = gspread.BackoffClient(None, session=StubSession(None))
+
+        self.assertIsInstance(client.retry_policy, gspread.RetryPolicy)
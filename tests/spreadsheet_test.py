@@ -1,10 +1,13 @@
 import re
+import unittest
 
 import pytest
+import requests
 
 import gspread
+from gspread.fake import FakeGoogleAPI
 
-from .conftest import GspreadTest
+from .conftest import GspreadTest, StubClientTest, stub_response
 
 
 class SpreadsheetTest(GspreadTest):
@@ -161,3 +164,371 @@ class SpreadsheetTest(GspreadTest):
 
         self.assertNotEqual(prev_title, properties["title"])
         self.assertEqual(new_title, properties["title"])
+
+
+class SpreadsheetMetadataCacheTest(StubClientTest):
+
+    """Offline tests for the spreadsheet metadata cache."""
+
+    METADATA = {
+        "properties": {"title": "cached", "locale": "en_US", "timeZone": "Etc/GMT"},
+        "sheets": [
+            {"properties": {"sheetId": 0, "title": "Sheet1", "index": 0}},
+            {"properties": {"sheetId": 1, "title": "Sheet2", "index": 1}},
+        ],
+    }
+
+    def setUp(self):
+        super().setUp()
+        self.spreadsheet = gspread.Spreadsheet(self.client, {"id": "abc"})
+
+    def handle(self, method, url, **kwargs):
+        if method == "GET":
+            return stub_response(json_body=self.METADATA)
+        return stub_response(json_body={"replies": [{}]})
+
+    def metadata_requests(self):
+        return [c for c in self.session.calls if c[0] == "GET"]
+
+    def test_lookups_use_cache(self):
+        self.spreadsheet.sheet1
+        self.spreadsheet.worksheet("Sheet2")
+        self.spreadsheet.get_worksheet_by_id(1)
+        self.spreadsheet.worksheets()
+
+        self.assertEqual(len(self.metadata_requests()), 1)
+
+    def test_batch_update_invalidates(self):
+        self.spreadsheet.sheet1.update_title("renamed")
+        self.spreadsheet.sheet1
+
+        self.assertEqual(len(self.metadata_requests()), 2)
+
+    def test_invalidate_and_refresh(self):
+        self.spreadsheet.invalidate()
+        self.spreadsheet.sheet1
+        self.spreadsheet.refresh()
+        self.spreadsheet.sheet1
+
+        self.assertEqual(len(self.metadata_requests()), 3)
+
+    def test_ttl_expiry(self):
+        self.spreadsheet.metadata_ttl = 0
+        self.spreadsheet.sheet1
+
+        self.assertEqual(len(self.metadata_requests()), 2)
+
+    def test_cache_shared_by_id(self):
+        other = self.client.open_by_key("abc")
+        other.sheet1
+
+        self.assertEqual(other.title, "cached")
+        self.assertEqual(len(self.metadata_requests()), 1)
+
+        gspread.Spreadsheet(self.client, {"id": "def"})
+
+        self.assertEqual(len(self.metadata_requests()), 2)
+
+    def test_write_invalidates_other_instances(self):
+        other = self.client.open_by_key("abc")
+        self.spreadsheet.sheet1.update_title("renamed")
+        other.sheet1
+
+        self.assertEqual(len(self.metadata_requests()), 2)
+
+
+class SpreadsheetBatchTest(StubClientTest):
+
+    """Offline tests for Spreadsheet.batch."""
+
+    def setUp(self):
+        super().setUp()
+        self.spreadsheet = gspread.Spreadsheet(self.client, {"id": "abc"})
+        self.worksheet = self.spreadsheet.sheet1
+
+    def handle(self, method, url, **kwargs):
+        if method == "GET":
+            return stub_response(json_body=SpreadsheetMetadataCacheTest.METADATA)
+        reply = {"addSheet": {"properties": {"sheetId": 2, "title": "new"}}}
+        return stub_response(json_body={"replies": [reply]})
+
+    def writes(self):
+        return [
+            (url.rsplit("/", 1)[-1], kwargs["json"])
+            for method, url, kwargs in self.session.calls
+            if method != "GET"
+        ]
+
+    def test_writes_are_combined(self):
+        with self.worksheet.batch():
+            self.worksheet.update_cell(1, 1, "a")
+            self.worksheet.update_acell("B2", "b")
+            self.worksheet.update("C3", [[1]], raw=False)
+            self.worksheet.format("A1", {"textFormat": {"bold": True}})
+            self.worksheet.freeze(rows=1)
+
+            self.assertEqual(self.writes(), [])
+
+        writes = self.writes()
+        self.assertEqual(
+            [endpoint for endpoint, body in writes],
+            ["values:batchUpdate", "abc:batchUpdate"],
+        )
+        self.assertEqual(writes[0][1]["valueInputOption"], "USER_ENTERED")
+        self.assertEqual(
+            [vr["range"] for vr in writes[0][1]["data"]],
+            ["'Sheet1'!A1", "'Sheet1'!B2", "'Sheet1'!C3"],
+        )
+        self.assertEqual(
+            [list(r) for r in writes[1][1]["requests"]],
+            [["repeatCell"], ["updateSheetProperties"]],
+        )
+
+    def test_values_then_insert_keep_order(self):
+        with self.worksheet.batch():
+            self.worksheet.update("A5", [["total"]])
+            self.worksheet.insert_rows([["header"]], row=1)
+            self.worksheet.update("B1", [["x"]])
+
+        # insert_rows adds the row then appends its values right away
+        self.assertEqual(
+            [endpoint for endpoint, body in self.writes()],
+            [
+                "values:batchUpdate",
+                "abc:batchUpdate",
+                "%27Sheet1%27%21A1:append",
+                "values:batchUpdate",
+            ],
+        )
+        self.assertEqual(self.writes()[0][1]["data"][0]["range"], "'Sheet1'!A5")
+        self.assertIn("insertDimension", self.writes()[1][1]["requests"][0])
+
+    def test_value_input_options_keep_order(self):
+        with self.spreadsheet.batch():
+            self.worksheet.update("A1", [[1]])
+            self.worksheet.update("A1", [[2]], raw=False)
+            self.worksheet.update("A1", [[3]])
+
+        self.assertEqual(
+            [body["valueInputOption"] for endpoint, body in self.writes()],
+            ["RAW", "USER_ENTERED", "RAW"],
+        )
+
+    def test_writes_without_value_input_option_sent_right_away(self):
+        with self.spreadsheet.batch():
+            self.worksheet.freeze(rows=1)
+            self.spreadsheet.values_update("Sheet1!A1", body={"values": [["a"]]})
+            self.spreadsheet.values_batch_update(body={"valueInputOption": "RAW"})
+
+            self.assertEqual(
+                [(endpoint, list(body)) for endpoint, body in self.writes()],
+                [
+                    ("abc:batchUpdate", ["requests"]),
+                    ("Sheet1%21A1", ["values"]),
+                    ("values:batchUpdate", ["valueInputOption"]),
+                ],
+            )
+
+    def test_split_on_payload_size(self):
+        with self.worksheet.batch(max_payload_size=100):
+            for row in range(1, 6):
+                self.worksheet.update_cell(row, 1, "x" * 40)
+
+        writes = self.writes()
+        self.assertEqual(len(writes), 5)
+        self.assertEqual(sum(len(body["data"]) for endpoint, body in writes), 5)
+
+    def test_exception_discards_writes(self):
+        with self.assertRaises(ValueError):
+            with self.worksheet.batch():
+                self.worksheet.update_cell(1, 1, "a")
+                raise ValueError()
+
+        self.assertEqual(self.writes(), [])
+
+    def test_immediate_call_sends_queued_writes_first(self):
+        with self.spreadsheet.batch():
+            self.worksheet.freeze(rows=1)
+            worksheet = self.spreadsheet.add_worksheet("new", 10, 10)
+            self.worksheet.update_cell(1, 1, "a")
+
+        self.assertEqual(worksheet.title, "new")
+        self.assertEqual(
+            [list(body) for endpoint, body in self.writes()],
+            [["requests"], ["requests"], ["valueInputOption", "data"]],
+        )
+        self.assertIn("updateSheetProperties", self.writes()[0][1]["requests"][0])
+        self.assertIn("addSheet", self.writes()[1][1]["requests"][0])
+
+
+class SpreadsheetBatchGetTest(StubClientTest):
+
+    """Offline tests for the splitting of Spreadsheet.values_batch_get."""
+
+    METADATA = {
+        "properties": {"title": "batch get"},
+        "sheets": [
+            {
+                "properties": {
+                    "sheetId": 0,
+                    "title": "Sheet1",
+                    "index": 0,
+                    "gridProperties": {"rowCount": 1000, "columnCount": 26},
+                }
+            },
+        ],
+    }
+
+    def setUp(self):
+        super().setUp()
+        self.spreadsheet = gspread.Spreadsheet(self.client, {"id": "abc"})
+
+    def handle(self, method, url, params=None, **kwargs):
+        if url.endswith("values:batchGet"):
+            value_ranges = [{"range": r} for r in params["ranges"]]
+            return stub_response(json_body={"valueRanges": value_ranges})
+        return stub_response(json_body=self.METADATA)
+
+    def batch_gets(self):
+        return [
+            kwargs["params"]["ranges"]
+            for method, url, kwargs in self.session.calls
+            if url.endswith("values:batchGet")
+        ]
+
+    def test_single_request(self):
+        params = {"valueRenderOption": "FORMULA"}
+        self.spreadsheet.values_batch_get(["A1", "B2"], params=params)
+
+        self.assertEqual(self.batch_gets(), [["A1", "B2"]])
+        self.assertEqual(
+            params, {"valueRenderOption": "FORMULA", "ranges": ["A1", "B2"]}
+        )
+
+    def test_split_on_url_length(self):
+        ranges = ["Sheet1!A{}".format(i) for i in range(1, 301)]
+        response = self.spreadsheet.values_batch_get(
+            ranges, max_url_length=1000, max_workers=4
+        )
+
+        self.assertEqual([vr["range"] for vr in response["valueRanges"]], ranges)
+
+        chunks = self.batch_gets()
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(sorted(r for chunk in chunks for r in chunk), sorted(ranges))
+        for method, url, kwargs in self.session.calls[1:]:
+            request = self.session.prepare_request(
+                requests.Request(method, url, params=kwargs["params"])
+            )
+            self.assertLessEqual(len(request.url), 1000)
+
+    def test_split_on_cell_count(self):
+        response = self.spreadsheet.values_batch_get(
+            ["A:A", "'Sheet1'!B:C", "D1:D10", "Sheet1"], max_cells=2010
+        )
+
+        self.assertEqual(
+            sorted(self.batch_gets()),
+            [["'Sheet1'!B:C", "D1:D10"], ["A:A"], ["Sheet1"]],
+        )
+        self.assertEqual(
+            [vr["range"] for vr in response["valueRanges"]],
+            ["A:A", "'Sheet1'!B:C", "D1:D10", "Sheet1"],
+        )
+
+
+class SpreadsheetFieldMaskTest(StubClientTest):
+
+    """Offline tests for the ``fields`` masks of Spreadsheet."""
+
+    def setUp(self):
+        super().setUp()
+        self.spreadsheet = gspread.Spreadsheet(self.client, {"id": "abc"})
+        self.session.calls.clear()
+        self.spreadsheet.invalidate()
+
+    def handle(self, method, url, **kwargs):
+        return stub_response(json_body={"properties": {"title": "masked"}})
+
+    def test_fetch_sheet_metadata_fields(self):
+        self.spreadsheet.fetch_sheet_metadata(fields="sheets.properties(sheetId,title)")
+
+        (_, _, kwargs) = self.session.calls[0]
+        self.assertEqual(
+            kwargs["params"],
+            {"includeGridData": "false", "fields": "sheets.properties(sheetId,title)"},
+        )
+        # a masked response is not cached
+        self.assertIsNone(self.spreadsheet._metadata_cache)
+
+    def test_values_get_fields(self):
+        params = {"valueRenderOption": "FORMULA"}
+        self.spreadsheet.values_get("Sheet1!A1:B2", params=params, fields="values")
+
+        (_, _, kwargs) = self.session.calls[0]
+        self.assertEqual(
+            kwargs["params"], {"valueRenderOption": "FORMULA", "fields": "values"}
+        )
+        self.assertEqual(params, {"valueRenderOption": "FORMULA"})
+
+
+class SpreadsheetLazyTest(unittest.TestCase):
+
+    """Tests for lazy spreadsheets, against the fake API."""
+
+    METADATA = ("GET", "v4/spreadsheets/{id}")
+
+    def setUp(self):
+        self.api = FakeGoogleAPI()
+        self.gc = gspread.Client(None, session=self.api.session())
+        self.key = self.api.create_spreadsheet("Orders", values=[["a", "b"]])
+        self.api.requests.clear()
+
+    def test_open_by_key(self):
+        spreadsheet = self.gc.open_by_key(self.key, lazy=True)
+        self.assertEqual(self.api.requests, [])
+        self.assertEqual(repr(spreadsheet), "<Spreadsheet None id:{}>".format(self.key))
+
+        # known ranges never need the metadata
+        spreadsheet.values_update(
+            "Sheet1!C1", params={"valueInputOption": "RAW"}, body={"values": [["c"]]}
+        )
+        values = spreadsheet.values_get("Sheet1!A1:C1")["values"]
+        self.assertEqual(values, [["a", "b", "c"]])
+        self.assertNotIn(self.METADATA, self.api.requests)
+
+        # fetched once, on first access
+        self.assertEqual(spreadsheet.title, "Orders")
+        self.assertEqual(spreadsheet.locale, "en_US")
+        self.assertEqual(spreadsheet.sheet1.title, "Sheet1")
+        self.assertEqual(self.api.requests.count(self.METADATA), 1)
+
+    def test_worksheet_lookup_first(self):
+        spreadsheet = self.gc.open_by_key(self.key, lazy=True)
+
+        self.assertEqual(spreadsheet.worksheet("Sheet1").get_all_values(), [["a", "b"]])
+        self.assertEqual(spreadsheet.title, "Orders")
+        self.assertEqual(self.api.requests.count(self.METADATA), 1)
+
+    def test_missing_spreadsheet(self):
+        spreadsheet = self.gc.open_by_key("missing", lazy=True)
+
+        with self.assertRaises(gspread.exceptions.APIError):
+            spreadsheet.title
+
+    def test_openall_and_create(self):
+        spreadsheets = self.gc.openall(lazy=True)
+        created = self.gc.create("Invoices", lazy=True)
+
+        self.assertEqual([s.title for s in spreadsheets], ["Orders"])
+        self.assertEqual(created.title, "Invoices")
+        self.assertNotIn(self.METADATA, self.api.requests)
+
+    def test_copy(self):
+        copied = self.gc.copy(
+            self.key, title="Orders copy", copy_permissions=True, lazy=True
+        )
+
+        self.assertEqual(copied.title, "Orders copy")
+        self.assertNotIn(self.METADATA, self.api.requests)
+        self.assertEqual(copied.sheet1.get_all_values(), [["a", "b"]])
@@ -52,6 +52,18 @@ class UtilsTest(unittest.TestCase):
                 (r, c) = utils.a1_to_rowcol(addr)
                 self.assertEqual((row, col), (r, c))
 
+    def test_rowcols_to_a1(self):
+        self.assertEqual(
+            utils.rowcols_to_a1([1, 2, 3], [1, 27, 731]), ["A1", "AA2", "ABC3"]
+        )
+        self.assertEqual(utils.rowcols_to_a1([], []), [])
+
+        with self.assertRaises(ValueError):
+            utils.rowcols_to_a1([1, 2], [1])
+
+        with self.assertRaises(gspread.exceptions.IncorrectCellLabel):
+            utils.rowcols_to_a1([1, 0], [1, 1])
+
     def test_get_gid(self):
         gid = "od6"
         self.assertEqual(utils.wid_to_gid(gid), "0")
@@ -185,6 +197,25 @@ class UtilsTest(unittest.TestCase):
         self.assertEqual(from_top_left, from_bottom_left)
         self.assertEqual(from_top_left, from_top_right)
 
+    def test_a1_ranges_to_grid_ranges(self):
+        names = ["A1:B2", "C:C", "A1:B2", "2:3"]
+
+        grid_ranges = utils.a1_ranges_to_grid_ranges(names, sheet_id=7)
+
+        self.assertEqual(
+            grid_ranges,
+            [utils.a1_range_to_grid_range(name, sheet_id=7) for name in names],
+        )
+        self.assertEqual(
+            utils.a1_ranges_to_grid_ranges(names),
+            [utils.a1_range_to_grid_range(name) for name in names],
+        )
+
+        # the same range parsed twice gives distinct dicts
+        grid_ranges[0]["endRowIndex"] = 100
+        self.assertEqual(grid_ranges[2]["endRowIndex"], 2)
+        self.assertEqual(utils.a1_range_to_grid_range("A1:B2")["endRowIndex"], 2)
+
     def test_column_letter_to_index(self):
         # All the input values to test one after an other
         # [0] input value
@@ -216,3 +247,64 @@ class UtilsTest(unittest.TestCase):
                         label, expected
                     ),
                 )
+
+    def test_cell_list_to_rect(self):
+        cells = [
+            gspread.Cell(3, 2, "b3"),
+            gspread.Cell(2, 4, "d2"),
+            gspread.Cell(4, 3, "c4"),
+        ]
+
+        self.assertEqual(utils.cell_list_bounds(cells), (2, 2, 4, 4))
+        self.assertEqual(
+            utils.cell_list_to_rect(cells),
+            [
+                [None, None, "d2"],
+                ["b3", None, None],
+                [None, "c4", None],
+            ],
+        )
+        self.assertEqual(utils.cell_list_to_rect([]), [])
+
+    def test_cell_list_to_rects(self):
+        cells = [
+            gspread.Cell(1, 1, "a1"),
+            gspread.Cell(1, 2, "b1"),
+            gspread.Cell(2, 1, "a2"),
+            gspread.Cell(2, 2, "b2"),
+            gspread.Cell(100, 50, "far"),
+        ]
+
+        self.assertEqual(
+            utils.cell_list_to_rects(cells),
+            [
+                ((1, 1, 2, 2), [["a1", "b1"], ["a2", "b2"]]),
+                ((100, 50, 100, 50), [["far"]]),
+            ],
+        )
+        self.assertEqual(utils.cell_list_to_rects([]), [])
+
+    def test_cells_to_rects(self):
+        self.assertEqual(utils.cells_to_rects([]), [])
+        self.assertEqual(utils.cells_to_rects([(3, 2)]), [(3, 2, 3, 2)])
+
+        # a block, a lone cell and a block split by an empty row
+        cells = [(1, 1), (1, 2), (2, 1), (2, 2), (2, 5), (4, 1), (5, 1)]
+        self.assertEqual(
+            utils.cells_to_rects(cells),
+            [(1, 1, 2, 2), (2, 5, 2, 5), (4, 1, 5, 1)],
+        )
+
+        # a column with a cell sticking out is grouped by columns
+        cells = [(1, 1), (2, 1), (2, 2), (3, 1), (4, 1)]
+        self.assertEqual(utils.cells_to_rects(cells), [(1, 1, 4, 1), (2, 2, 2, 2)])
+
+        # the rectangles cover exactly the given cells
+        cells = {(r, c) for r in range(1, 30) for c in range(1, 30) if (r * c) % 7 < 3}
+        covered = set()
+        for first_row, first_col, last_row, last_col in utils.cells_to_rects(cells):
+            for r in range(first_row, last_row + 1):
+                for c in range(first_col, last_col + 1):
+                    self.assertNotIn((r, c), covered)
+                    covered.add((r, c))
+        self.assertEqual(covered, cells)
@@ -1,14 +1,21 @@
+import dataclasses
+import datetime
 import itertools
 import random
 import re
+import typing
+import unittest
+from decimal import Decimal
+from urllib.parse import unquote
 
 import pytest
 
 import gspread
 import gspread.utils as utils
 from gspread.exceptions import APIError, GSpreadException
+from gspread.fake import FakeGoogleAPI
 
-from .conftest import I18N_STR, GspreadTest
+from .conftest import I18N_STR, GspreadTest, StubSession, stub_response
 
 
 class WorksheetTest(GspreadTest):
@@ -1053,3 +1060,346 @@ class WorksheetTest(GspreadTest):
         size_after = res["sheets"][0]["data"][0]["columnMetadata"][0]["pixelSize"]
 
         self.assertGreater(size_after, size_before)
+
+
+class StubGrid:
+    """Serves the values of ``rows`` like the Sheets API values endpoints,
+    for a single worksheet named ``Sheet1``.
+    """
+
+    def __init__(self, rows, row_count=None, col_count=26):
+        self.rows = rows
+        self.metadata = {
+            "properties": {"title": "stub"},
+            "sheets": [
+                {
+                    "properties": {
+                        "sheetId": 0,
+                        "title": "Sheet1",
+                        "index": 0,
+                        "gridProperties": {
+                            "rowCount": row_count or len(rows),
+                            "columnCount": col_count,
+                        },
+                    }
+                }
+            ],
+        }
+        self.session = StubSession(self.handle)
+        self.client = gspread.Client(None, session=self.session)
+
+    def values_requests(self):
+        return [c for c in self.session.calls if "/values/" in c[1]]
+
+    def handle(self, method, url, **kwargs):
+        if "/values/" not in url:
+            return stub_response(json_body=self.metadata)
+
+        range_name = unquote(url.split("/values/")[1])
+        grid_range = utils.a1_range_to_grid_range(range_name.partition("!")[2])
+        start = grid_range.get("startRowIndex", 0)
+        end = grid_range.get("endRowIndex", len(self.rows))
+        values = [list(row) for row in self.rows[start:end]]
+        while values and not values[-1]:
+            values.pop()
+
+        return stub_response(
+            json_body={
+                "range": range_name,
+                "majorDimension": "ROWS",
+                "values": values,
+            }
+        )
+
+    def worksheet(self):
+        return gspread.Spreadsheet(self.client, {"id": "abc"}).sheet1
+
+
+class WorksheetStreamingTest(unittest.TestCase):
+
+    """Offline tests for Worksheet.iter_rows and Worksheet.iter_records."""
+
+    ROWS = [
+        ["name", "score"],
+        ["a", "1"],
+        [],
+        ["c", "3.5"],
+        ["d"],
+        [],
+        ["f", "6"],
+        [],
+        [],
+    ]
+
+    def test_iter_rows(self):
+        grid = StubGrid(self.ROWS)
+        rows = list(grid.worksheet().iter_rows(chunk_rows=2))
+
+        self.assertEqual(rows, self.ROWS[:7])
+        self.assertEqual(len(grid.values_requests()), 5)
+
+    def test_iter_rows_blank_chunk(self):
+        rows = [["a"], [], [], [], ["e"]]
+        grid = StubGrid(rows)
+
+        self.assertEqual(list(grid.worksheet().iter_rows(chunk_rows=2)), rows)
+
+    def test_iter_records(self):
+        grid = StubGrid(self.ROWS)
+        records = list(grid.worksheet().iter_records(chunk_rows=3))
+
+        self.assertEqual(
+            records,
+            [
+                {"name": "a", "score": 1},
+                {"name": "", "score": ""},
+                {"name": "c", "score": 3.5},
+                {"name": "d", "score": ""},
+                {"name": "", "score": ""},
+                {"name": "f", "score": 6},
+            ],
+        )
+
+    def test_iter_records_matches_get_all_records(self):
+        grid = StubGrid(self.ROWS)
+        worksheet = grid.worksheet()
+
+        self.assertEqual(
+            list(worksheet.iter_records(chunk_rows=4, head=2, numericise_ignore=[2])),
+            worksheet.get_all_records(head=2, numericise_ignore=[2]),
+        )
+
+    def test_iter_records_empty_sheet(self):
+        grid = StubGrid([], row_count=10)
+
+        self.assertEqual(list(grid.worksheet().iter_records()), [])
+
+
+class WorksheetCellBlockTest(unittest.TestCase):
+
+    """Offline tests for Worksheet.range(as_block=True)."""
+
+    ROWS = [["a", "b"], ["c"], []]
+
+    def setUp(self):
+        self.grid = StubGrid(self.ROWS, col_count=2)
+        self.sheet = self.grid.worksheet()
+
+    def test_range_as_block(self):
+        block = self.sheet.range("A1:B3", as_block=True)
+
+        self.assertEqual((block.first_row, block.first_col), (1, 1))
+        self.assertEqual(block.values, [["a", "b"], ["c", ""], ["", ""]])
+        self.assertEqual(list(block), self.sheet.range("A1:B3"))
+
+    def test_update_cells_with_block(self):
+        block = self.sheet.range(2, 1, 3, 2, as_block=True)
+        block.cell(3, 2).value = "x"
+        self.sheet.update_cells(block)
+
+        method, url, kwargs = self.grid.session.calls[-1]
+        self.assertEqual(method, "PUT")
+        self.assertEqual(unquote(url.split("/values/")[1]), "'Sheet1'!A2:B3")
+        self.assertEqual(kwargs["json"], {"values": [["c", ""], ["", "x"]]})
+
+    def test_update_cells_with_empty_block(self):
+        calls = len(self.grid.session.calls)
+
+        self.assertIsNone(self.sheet.update_cells(gspread.CellBlock([], 1, 1)))
+        self.assertIsNone(self.sheet.update_cells([]))
+        self.assertIsNone(self.sheet.update_cells([], sparse=True))
+        self.assertEqual(len(self.grid.session.calls), calls)
+
+
+class WorksheetIndexTest(unittest.TestCase):
+
+    """Offline tests for Worksheet.build_index."""
+
+    ROWS = [
+        ["id", "name"],
+        ["1", "Apple"],
+        ["2", "pear"],
+        ["3", "apple"],
+    ]
+
+    def setUp(self):
+        self.grid = StubGrid(self.ROWS, col_count=2)
+        self.sheet = self.grid.worksheet()
+
+    def test_lookups_do_not_fetch(self):
+        index = self.sheet.build_index()
+        self.assertEqual(len(self.grid.values_requests()), 1)
+
+        self.assertEqual(index.find("pear"), gspread.Cell(3, 2, "pear"))
+        self.assertEqual(index.findall("apple"), [gspread.Cell(4, 2, "apple")])
+        self.assertEqual(index.positions("3"), [(4, 1)])
+        self.assertIsNone(index.find("plum"))
+        self.assertIn("id", index)
+        self.assertEqual(len(self.grid.values_requests()), 1)
+
+    def test_columns_and_case(self):
+        index = self.sheet.build_index(columns=["B"], case_sensitive=False)
+
+        self.assertEqual(
+            index.findall("APPLE"),
+            [gspread.Cell(2, 2, "Apple"), gspread.Cell(4, 2, "apple")],
+        )
+        self.assertEqual(index.findall("apple", in_column=2), index.findall("apple"))
+        self.assertNotIn("1", index)
+
+        # column A is not indexed, its cells cannot be found
+        with self.assertRaises(ValueError):
+            index.findall("apple", in_column=1)
+
+    def test_case_insensitive_numbers(self):
+        grid = StubGrid([["id", "ok"], [42, True], [7.5, False]], col_count=2)
+        index = grid.worksheet().build_index(case_sensitive=False)
+
+        self.assertEqual(index.find(42), gspread.Cell(2, 1, 42))
+        self.assertEqual(index.find("7.5"), gspread.Cell(3, 1, 7.5))
+        self.assertEqual(index.find("true"), gspread.Cell(2, 2, True))
+
+    def test_writes_invalidate(self):
+        index = self.sheet.build_index(columns=[1])
+
+        self.sheet.update_cell(5, 1, "4")
+        self.assertTrue(index.stale)
+
+        self.grid.rows = self.ROWS + [["4", "plum"]]
+        self.assertEqual(index.find("4"), gspread.Cell(5, 1, "4"))
+        self.assertFalse(index.stale)
+        self.assertEqual(len(self.grid.values_requests()), 3)
+
+
+class WorksheetTypedRecordsTest(unittest.TestCase):
+
+    """Offline tests for Worksheet.get_records."""
+
+    ROWS = [
+        ["id", "amount", "placed", "paid", "Note", "at"],
+        [1, 10.5, 44927, True, "first", 44927.75],
+        [2, 0.1, 44928, False, 42],
+        [3, "", "", "", "", ""],
+    ]
+
+    def setUp(self):
+        self.grid = StubGrid(self.ROWS, col_count=6)
+        self.sheet = self.grid.worksheet()
+
+    def test_dict_schema(self):
+        records = self.sheet.get_records(
+            {"id": int, "amount": Decimal, "placed": datetime.date, "paid": bool}
+        )
+
+        self.assertEqual(
+            records[0], (1, Decimal("10.5"), datetime.date(2023, 1, 1), True)
+        )
+        self.assertEqual(records[1].amount, Decimal("0.1"))
+        self.assertEqual(records[2], (3, None, None, None))
+
+        params = self.grid.values_requests()[0][2]["params"]
+        self.assertEqual(params["valueRenderOption"], "UNFORMATTED_VALUE")
+        self.assertEqual(params["dateTimeRenderOption"], "SERIAL_NUMBER")
+
+    def test_dataclass_schema(self):
+        @dataclasses.dataclass
+        class Order:
+            id: int
+            at: typing.Optional[datetime.datetime]
+            note: str = dataclasses.field(metadata={"column": "Note"})
+
+        records = self.sheet.get_records(Order)
+
+        self.assertEqual(
+            records,
+            [
+                Order(1, datetime.datetime(2023, 1, 1, 18), "first"),
+                Order(2, None, "42"),
+                Order(3, None, ""),
+            ],
+        )
+
+    def test_numeric_header(self):
+        grid = StubGrid([["region", 2022, 2023.5], ["north", 1, 2]], col_count=3)
+
+        records = grid.worksheet().get_records(
+            {"region": str, "2022": int, "2023.5": int}
+        )
+
+        self.assertEqual(records, [("north", 1, 2)])
+        # fields that are not identifiers are renamed after their position
+        self.assertEqual(records[0]._1, 1)
+        self.assertEqual(
+            type(records[0])._columns,
+            {"region": "region", "2022": "_1", "2023.5": "_2"},
+        )
+
+    def test_negative_serial_date(self):
+        grid = StubGrid([["placed"], [-0.5], [-1], [0.5]], col_count=1)
+
+        records = grid.worksheet().get_records({"placed": datetime.date})
+
+        self.assertEqual(
+            [r.placed for r in records],
+            [
+                datetime.date(1899, 12, 29),
+                datetime.date(1899, 12, 29),
+                datetime.date(1899, 12, 30),
+            ],
+        )
+
+    def test_errors(self):
+        with self.assertRaises(gspread.exceptions.GSpreadException):
+            self.sheet.get_records({"missing": int})
+
+        with self.assertRaises(gspread.exceptions.GSpreadException):
+            self.sheet.get_records({"amount": int})
+
+        with self.assertRaises(TypeError):
+            self.sheet.get_records([("id", int)])
+
+
+class WorksheetUpdateCellsTest(unittest.TestCase):
+
+    """Tests for Worksheet.update_cells, against the fake API."""
+
+    def setUp(self):
+        self.api = FakeGoogleAPI()
+        gc = gspread.Client(None, session=self.api.session())
+        key = self.api.create_spreadsheet(values=[["a", "b", "c"], ["d", "e", "f"]])
+        self.sheet = gc.open_by_key(key).sheet1
+        self.api.requests.clear()
+
+    def test_dense(self):
+        self.sheet.update_cells([gspread.Cell(2, 3, "F"), gspread.Cell(1, 1, "A")])
+
+        self.assertEqual(
+            self.api.requests, [("PUT", "v4/spreadsheets/{id}/values/{range}")]
+        )
+        self.assertEqual(
+            self.sheet.get_all_values(), [["A", "b", "c"], ["d", "e", "F"]]
+        )
+
+    def test_sparse(self):
+        cells = [
+            gspread.Cell(1, 1, "A"),
+            gspread.Cell(1, 2, "B"),
+            gspread.Cell(2, 3, "F"),
+            gspread.Cell(4, 5, "far"),
+        ]
+
+        response = self.sheet.update_cells(cells, sparse=True)
+
+        self.assertEqual(
+            self.api.requests, [("POST", "v4/spreadsheets/{id}/values:batchUpdate")]
+        )
+        self.assertEqual(response["totalUpdatedCells"], 4)
+        self.assertEqual(
+            self.sheet.get_all_values(),
+            [
+                ["A", "B", "c", "", ""],
+                ["d", "e", "F", "", ""],
+                ["", "", "", "", ""],
+                ["", "", "", "", "far"],
+            ],
+        )